@@ -1,51 +1,194 @@
-from fastapi import APIRouter
+import asyncio
+import base64
+import json
+import random
+import re
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from app.logic.common.seed import get_new_seed
-from app.logic.minmax.solver import generate_and_solve_minmax
-from app.logic.minmax.visualizer import generate_tree_image_base64
+from app.logic.minmax.solver import (
+    MINMAX_ALGORITHM_ALPHABETA,
+    MINMAX_SOURCE_RANDOM,
+    _alpha_beta,
+    build_compact_tree,
+    build_schema_tree,
+    fixed_tree_params,
+    generate_and_solve_minmax,
+    iter_alpha_beta_trace,
+    minmax_problem_text,
+    solve_minmax
+)
+from app.logic.minmax.visualizer import IMAGE_MIME_TYPES, IMAGE_FORMAT_SVG
+from app.logic.minmax.image_cache import (
+    MINMAX_IMAGE_CACHE_CONTROL,
+    MINMAX_RENDER_RETRY_AFTER,
+    minmax_image_key,
+    minmax_render_pool,
+    render_minmax_image
+)
+from app.logic.minmax.annotations import ANNOTATION_MISSING, decode_bound, grade_node_answers
+from app.logic.minmax.constructive import CONSTRUCTIVE_MAX_TARGET
 from app.logic.minmax.evaluator import evaluate_minmax
+from app.logic.minmax.games import GAMES
+from app.logic.minmax.mcts import MCTS_DEFAULT_PLAYOUTS, MCTS_MAX_PLAYOUTS, mcts_search
+from app.logic.minmax.tree import NODE_MAX
+from app.logic.minmax.variants import SEARCH_VARIANTS
 
 from app.schemas.minmax_schemas import (
     MinMaxProblemResponse,
     MinMaxAnswerRequest,
     EvaluationResponse,
     MinMaxProblemText,
-    MinMaxGenerateRequest
+    MinMaxGenerateRequest,
+    MinMaxAnalysisResponse,
+    MinMaxChildEstimate,
+    MinMaxGenerationParams,
+    MinMaxNodeAnnotation,
+    MinMaxNodeAnswersRequest,
+    MinMaxNodeEvaluationResponse
 )
 
 router = APIRouter()
 
+TREE_FORMAT_COMPACT = "compact"
+# Numele nodurilor: R urmat de indicii copiilor (1..9) pe drum
+MINMAX_NODE_NAME_PATTERN = re.compile(r"R[1-9]{0,12}")
+MINMAX_COMPACT_MEDIA_TYPE = "application/vnd.smartest.minmax-compact+json"
+
+
+def _check_source(source: str) -> None:
+    if source != MINMAX_SOURCE_RANDOM and source not in GAMES:
+        raise HTTPException(status_code=400, detail=f"Sursă de arbore necunoscută: {source}")
+
+
+def _check_algorithm(algorithm: str, chance_nodes: bool) -> None:
+    if algorithm != MINMAX_ALGORITHM_ALPHABETA and algorithm not in SEARCH_VARIANTS:
+        raise HTTPException(status_code=400, detail=f"Algoritm necunoscut: {algorithm}")
+    if chance_nodes and algorithm != MINMAX_ALGORITHM_ALPHABETA:
+        raise HTTPException(status_code=400, detail="Arborii cu noduri CHANCE se rezolvă doar cu *-minimax.")
+
+
+def _check_targets(source: str, chance_nodes: bool, target_visited, min_cutoffs) -> None:
+    if target_visited is None and min_cutoffs is None:
+        return
+    if target_visited is not None and min_cutoffs is not None:
+        raise HTTPException(status_code=400, detail="Se poate cere fie target_visited, fie min_cutoffs, nu ambele.")
+    if source != MINMAX_SOURCE_RANDOM or chance_nodes:
+        raise HTTPException(status_code=400,
+                            detail="Țintele de tăiere se aplică doar arborilor aleatori fără noduri CHANCE.")
+    if (target_visited is not None and target_visited < 1) or (min_cutoffs is not None and min_cutoffs < 0):
+        raise HTTPException(status_code=400, detail="Țintele de tăiere trebuie să fie pozitive.")
+    # Costul generatorului constructiv crește cu ținta (lățimea bitset-urilor)
+    if max(target_visited or 0, min_cutoffs or 0) > CONSTRUCTIVE_MAX_TARGET:
+        raise HTTPException(status_code=400,
+                            detail=f"Țintele de tăiere pot fi cel mult {CONSTRUCTIVE_MAX_TARGET}.")
+
+
+def _render_queue_full() -> HTTPException:
+    """Coada de randare este plină: clientul reîncearcă după MINMAX_RENDER_RETRY_AFTER secunde."""
+    return HTTPException(status_code=503, detail="Serverul randează prea multe imagini; reîncearcă în curând.",
+                         headers={"Retry-After": str(MINMAX_RENDER_RETRY_AFTER)})
+
 
 @router.post("/generate/minmax", response_model=MinMaxProblemResponse)
-async def generate_minmax_problem(request: MinMaxGenerateRequest):
+async def generate_minmax_problem(request: MinMaxGenerateRequest, http_request: Request):
     """
     Generează o problemă MinMax. 
     Acceptă parametri de configurare (depth, root type).
+    Imaginea arborelui este randată în fundal și servită separat prin `tree_image_url`.
     """
+    _check_source(request.source)
+    _check_algorithm(request.algorithm, request.chance_nodes)
+    _check_targets(request.source, request.chance_nodes, request.target_visited, request.min_cutoffs)
     new_seed = get_new_seed()
 
     # Convertim modelul Pydantic în dicționar pentru solver
     params = request.dict()
 
-    tree_structure, _, _, chosen_depth, text_dict, root_type_str = generate_and_solve_minmax(
-        seed=new_seed,
-        params=params
-    )
+    # Generarea (cu ținte de tăiere, generatorul constructiv) nu blochează bucla de evenimente
+    solution = await run_in_threadpool(solve_minmax, new_seed, params)
+    chosen_depth = solution.depth
+    root_type_str = solution.root_type
+    text_dict = minmax_problem_text(solution)
+
+    # Negociere format: parametru explicit sau header Accept
+    compact = (request.tree_format == TREE_FORMAT_COMPACT
+               or MINMAX_COMPACT_MEDIA_TYPE in http_request.headers.get("accept", ""))
+    if compact:
+        tree_structure, tree_compact = None, build_compact_tree(solution.tree)
+    else:
+        tree_structure, tree_compact = build_schema_tree(solution.tree), None
 
-    tree_image_b64 = generate_tree_image_base64(
-        tree_structure.model_dump()
+    image_format = request.image_format if request.image_format in IMAGE_MIME_TYPES else IMAGE_FORMAT_SVG
+    chance_nodes = solution.chance_nodes
+    targets = {"target_visited": request.target_visited, "min_cutoffs": request.min_cutoffs}
+    image_key = minmax_image_key(new_seed, chosen_depth, root_type_str, image_format, request.source, chance_nodes,
+                                 **targets)
+
+    # Pre-randare în fundal: răspunsul nu așteaptă imaginea
+    future = minmax_render_pool.submit(
+        image_key,
+        lambda: render_minmax_image(new_seed, chosen_depth, root_type_str, image_format, solution.tree,
+                                    request.source, chance_nodes, **targets),
+        optional=not request.inline_image
     )
 
+    tree_image_b64 = None
+    if request.inline_image:
+        if future is None:
+            raise _render_queue_full()
+        image = await asyncio.wrap_future(future)
+        tree_image_b64 = base64.b64encode(image.content).decode("utf-8")
+
+    query = {"depth": chosen_depth, "root": root_type_str, "image_format": image_format}
+    if request.source != MINMAX_SOURCE_RANDOM:
+        query["source"] = request.source
+    if chance_nodes:
+        query["chance_nodes"] = "true"
+    query.update({name: value for name, value in targets.items() if value is not None})
+    tree_image_url = str(http_request.url_for("get_minmax_image", seed=new_seed).include_query_params(**query))
+
     return MinMaxProblemResponse(
         seed=new_seed,
         tree=tree_structure,
+        tree_compact=tree_compact,
         difficulty=f"L6_Depth{chosen_depth}",
         tree_image_base64=tree_image_b64,
+        tree_image_mime=IMAGE_MIME_TYPES[image_format],
+        tree_image_url=tree_image_url,
         text=MinMaxProblemText(**text_dict),
         root_type=root_type_str
     )
 
 
+def _reconstruction_params(answer: MinMaxGenerationParams) -> Dict[str, Any]:
+    """Validează parametrii de generare trimiși înapoi și îi traduce în parametrii solverului."""
+    _check_source(answer.generated_source)
+    _check_algorithm(answer.generated_algorithm, answer.generated_chance_nodes)
+    _check_targets(answer.generated_source, answer.generated_chance_nodes,
+                   answer.generated_target_visited, answer.generated_min_cutoffs)
+
+    # Reconstruim dicționarul de parametri pe baza datelor primite de la frontend
+    # Acest lucru rezolvă problema desincronizării când utilizatorul alege manual MIN/MAX sau Adâncimea.
+    return {
+        "random_depth": answer.generated_random_depth,
+        "depth": answer.generated_depth,
+        "random_root": answer.generated_random_root,
+        "is_maximizing_player": answer.generated_is_maximizing,
+        "source": answer.generated_source,
+        "chance_nodes": answer.generated_chance_nodes,
+        "algorithm": answer.generated_algorithm,
+        "target_visited": answer.generated_target_visited,
+        "min_cutoffs": answer.generated_min_cutoffs
+    }
+
+
 @router.post("/evaluate/minmax", response_model=EvaluationResponse)
 async def evaluate_minmax_answer(user_answer: MinMaxAnswerRequest):
     """
@@ -54,25 +197,190 @@ async def evaluate_minmax_answer(user_answer: MinMaxAnswerRequest):
     pentru a asigura că arborele evaluat este identic cu cel afișat utilizatorului.
     """
     
-    # Reconstruim dicționarul de parametri pe baza datelor primite de la frontend
-    # Acest lucru rezolvă problema desincronizării când utilizatorul alege manual MIN/MAX sau Adâncimea.
-    reconstruction_params = {
-        "random_depth": user_answer.generated_random_depth,
-        "depth": user_answer.generated_depth,
-        "random_root": user_answer.generated_random_root,
-        "is_maximizing_player": user_answer.generated_is_maximizing
-    }
+    reconstruction_params = _reconstruction_params(user_answer)
 
     # Apelăm solverul cu parametrii de reconstrucție
-    _, correct_root_value, correct_visited_nodes, _, _, _ = generate_and_solve_minmax(
+    _, correct_root_value, correct_visited_nodes, _, _, _ = await run_in_threadpool(
+        generate_and_solve_minmax,
         seed=user_answer.problem_seed,
-        params=reconstruction_params
+        params=reconstruction_params,
+        build_tree=False
     )
 
     evaluation = evaluate_minmax(
         user_answer=user_answer,
         correct_value=correct_root_value,
-        correct_nodes=correct_visited_nodes
+        correct_nodes=correct_visited_nodes,
+        chance_nodes=reconstruction_params["chance_nodes"] and user_answer.generated_source == MINMAX_SOURCE_RANDOM
     )
 
-    return evaluation
\ No newline at end of file
+    return evaluation
+
+
+@router.post("/evaluate/minmax/nodes", response_model=MinMaxNodeEvaluationResponse)
+def evaluate_minmax_nodes(answers: MinMaxNodeAnswersRequest):
+    """
+    Notare parțială per nod: valoarea întoarsă de fiecare nod și dacă a fost tăiat.
+    Arborele este reconstruit și căutat o singură dată (cu tabelul de adnotări),
+    iar răspunsul complet este comparat vectorizat cu tabelul.
+    """
+    params = _reconstruction_params(answers)
+    if answers.generated_chance_nodes or answers.generated_algorithm != MINMAX_ALGORITHM_ALPHABETA:
+        raise HTTPException(status_code=400, detail="Notarea per nod este disponibilă doar pentru Alpha-Beta.")
+
+    solution = solve_minmax(answers.problem_seed, params, annotate=True)
+    annotations = solution.annotations
+    names = solution.tree.node_names()
+    index_by_name = {name: index for index, name in enumerate(names)}
+
+    submitted = [(index_by_name[node.name], node) for node in answers.nodes if node.name in index_by_name]
+    grade = grade_node_answers(
+        annotations,
+        np.array([index for index, _ in submitted], dtype=np.int64),
+        np.array([ANNOTATION_MISSING if node.value is None else node.value for _, node in submitted],
+                 dtype=np.int64),
+        np.array([node.pruned for _, node in submitted], dtype=bool),
+    )
+
+    corrections = [
+        MinMaxNodeAnnotation(
+            name=names[index],
+            value=None if annotations.pruned[index] else int(annotations.values[index]),
+            alpha=decode_bound(annotations.alpha[index]),
+            beta=decode_bound(annotations.beta[index]),
+            pruned=bool(annotations.pruned[index])
+        )
+        for index in grade.wrong.tolist()
+    ]
+    return MinMaxNodeEvaluationResponse(
+        percentage=grade.percentage,
+        correct_nodes=grade.correct,
+        total_nodes=grade.total,
+        corrections=corrections,
+        explanation=f"{grade.correct} din {grade.total} noduri au valoarea și starea (tăiat / vizitat) corecte."
+    )
+
+
+@router.get("/image/minmax/{seed}", name="get_minmax_image")
+async def get_minmax_image(seed: int, depth: int, root: str, http_request: Request, image_format: str = IMAGE_FORMAT_SVG,
+                           source: str = MINMAX_SOURCE_RANDOM, chance_nodes: bool = False,
+                           target_visited: Optional[int] = None, min_cutoffs: Optional[int] = None,
+                           lod_depth: Optional[int] = None, expand: Optional[str] = None):
+    """
+    Servește imaginea arborelui (binar) din cache-ul LRU.
+    Dacă imaginea nu mai este în cache, este regenerată din seed o singură dată.
+    Cu `lod_depth` (niveluri afișate complet) și / sau `expand` (ex. R213), imaginea este rezumată:
+    subarborii adânci și frații tăiați devin noduri agregate; arborii adânci sunt rezumați implicit.
+    """
+    if image_format not in IMAGE_MIME_TYPES:
+        raise HTTPException(status_code=400, detail=f"Format de imagine necunoscut: {image_format}")
+    if root not in ("MAX", "MIN"):
+        raise HTTPException(status_code=400, detail="Parametrul root trebuie să fie MAX sau MIN.")
+    _check_source(source)
+    chance_nodes = chance_nodes and source == MINMAX_SOURCE_RANDOM
+    _check_targets(source, chance_nodes, target_visited, min_cutoffs)
+    depth = max(1, min(12, depth))
+
+    if lod_depth is not None:
+        lod_depth = max(1, min(12, lod_depth))
+    if expand is not None and not MINMAX_NODE_NAME_PATTERN.fullmatch(expand):
+        raise HTTPException(status_code=400, detail=f"Nume de nod invalid: {expand}")
+
+    variant = {"target_visited": target_visited, "min_cutoffs": min_cutoffs, "lod_depth": lod_depth, "expand": expand}
+    image_key = minmax_image_key(seed, depth, root, image_format, source, chance_nodes, **variant)
+    future = minmax_render_pool.submit(
+        image_key,
+        lambda: render_minmax_image(seed, depth, root, image_format, source=source, chance_nodes=chance_nodes,
+                                    **variant)
+    )
+    if future is None:
+        raise _render_queue_full()
+    try:
+        image = await asyncio.wrap_future(future)
+    except ValueError as error:
+        # Nodul cerut prin `expand` nu există în acest arbore
+        raise HTTPException(status_code=400, detail=str(error))
+
+    headers = {"ETag": image.etag, "Cache-Control": MINMAX_IMAGE_CACHE_CONTROL}
+    if http_request.headers.get("if-none-match") == image.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=image.content, media_type=image.media_type, headers=headers)
+
+
+@router.get("/trace/minmax/{seed}")
+def stream_minmax_trace(seed: int, depth: int, root: str, source: str = MINMAX_SOURCE_RANDOM,
+                        chance_nodes: bool = False, algorithm: str = MINMAX_ALGORITHM_ALPHABETA,
+                        target_visited: Optional[int] = None, min_cutoffs: Optional[int] = None):
+    """
+    Transmite (NDJSON, câte un eveniment pe linie) execuția completă Alpha-Beta
+    pentru arborele identificat de seed, adâncime, tipul rădăcinii și aceiași parametri de
+    reconstrucție ca imaginea (noduri CHANCE, ținte de tăiere), deci pentru arborele afișat.
+    Evenimentele sunt produse pe măsură ce sunt trimise, fără a fi stocate.
+    """
+    if root not in ("MAX", "MIN"):
+        raise HTTPException(status_code=400, detail="Parametrul root trebuie să fie MAX sau MIN.")
+    _check_source(source)
+    chance_nodes = chance_nodes and source == MINMAX_SOURCE_RANDOM
+    _check_algorithm(algorithm, chance_nodes)
+    _check_targets(source, chance_nodes, target_visited, min_cutoffs)
+    if chance_nodes or algorithm != MINMAX_ALGORITHM_ALPHABETA:
+        raise HTTPException(status_code=400, detail="Trace-ul este disponibil doar pentru Alpha-Beta.")
+    depth = max(1, min(12, depth))
+
+    params = fixed_tree_params(depth, root, source, chance_nodes, algorithm, target_visited, min_cutoffs)
+    tree = solve_minmax(seed, params).tree
+
+    def ndjson_lines():
+        for event in iter_alpha_beta_trace(tree):
+            yield json.dumps(event, separators=(",", ":")) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.get("/analyze/minmax/{seed}", response_model=MinMaxAnalysisResponse)
+def analyze_minmax_tree(seed: int, depth: int, root: str, source: str = MINMAX_SOURCE_RANDOM,
+                        playouts: int = MCTS_DEFAULT_PLAYOUTS):
+    """
+    Compară estimarea aproximativă MCTS (buget fix de simulări) cu rezultatul exact Alpha-Beta
+    pentru arborele identificat de seed, adâncime, tipul rădăcinii și sursă.
+    """
+    if root not in ("MAX", "MIN"):
+        raise HTTPException(status_code=400, detail="Parametrul root trebuie să fie MAX sau MIN.")
+    _check_source(source)
+    depth = max(1, min(12, depth))
+    playouts = max(1, min(MCTS_MAX_PLAYOUTS, playouts))
+
+    solution = solve_minmax(seed, fixed_tree_params(depth, root, source))
+    tree = solution.tree
+    # RNG separat pentru simulări, determinist pentru același seed
+    result = mcts_search(tree, playouts, random.Random(seed))
+
+    first = tree.offsets[0]
+    exact_values = [_alpha_beta(tree.subtree(child)) for child in range(first, first + tree.arity[0])]
+    children = [
+        MinMaxChildEstimate(
+            name=stats.name,
+            visits=stats.visits,
+            value_estimate=stats.value_estimate,
+            exact_value=exact
+        )
+        for stats, exact in zip(result.children, exact_values)
+    ]
+
+    exact_best_child = None
+    if children:
+        pick = max if tree.types[0] == NODE_MAX else min
+        exact_best_child = pick(children, key=lambda child: child.exact_value).name
+
+    return MinMaxAnalysisResponse(
+        seed=seed,
+        root_type=solution.root_type,
+        exact_value=solution.root_value,
+        alpha_beta_leaves_visited=solution.stats.leaves_visited,
+        playouts=result.playouts,
+        mcts_value_estimate=result.root_value_estimate,
+        mcts_best_child=result.best_child,
+        exact_best_child=exact_best_child,
+        mcts_leaves_evaluated=result.leaves_evaluated,
+        children=children
+    )
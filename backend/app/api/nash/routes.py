@@ -1,44 +1,221 @@
-from fastapi import APIRouter, Body
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Body, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.logic.common.seed import get_new_seed
-from app.logic.nash.solver import generate_and_solve_nash
-from app.logic.nash.evaluator import evaluate_nash
+from app.logic.nash.solver import (
+    NASH_PROBLEM_MIXED,
+    NASH_PROBLEM_TYPES,
+    NASH_PROBLEM_ZERO_SUM,
+    generate_and_solve_nash,
+    payoff_arrays
+)
+from app.logic.nash.dominance import iterated_elimination
+from app.logic.nash.packed import NASH_COMPACT_FORMATS
+from app.logic.nash.editor import NASH_PAYOFF_MAX, NASH_PAYOFF_MIN, nash_editor_sessions
+from app.logic.nash.evaluator import (
+    evaluate_extensive,
+    evaluate_iesds,
+    evaluate_mixed_nash,
+    evaluate_nash,
+    evaluate_tensor_nash,
+    evaluate_zero_sum
+)
+from app.logic.nash.dynamics import NASH_DYNAMICS_RULES, iter_dynamics
+from app.logic.nash.extensive import generate_and_solve_extensive
+from app.logic.nash.mixed import lemke_howson
+from app.logic.nash.tensor import generate_and_solve_tensor, solve_pure_nash_tensor
+from app.logic.nash.zero_sum import solve_zero_sum
 
 from app.schemas.nash_schemas import (
+    NashGenerationParams,
+    NashCellUpdateRequest,
+    NashCellUpdateResponse,
+    NashDynamicsRequest,
     NashProblemResponse,
     NashAnswerRequest,
     NashEvaluationResponse,
+    NashExtensiveAnswerRequest,
+    NashExtensiveGenerateRequest,
+    NashExtensiveProblemResponse,
     NashGenerateRequest,
+    NashIesdsAnswerRequest,
+    NashMixedAnswerRequest,
+    NashTensorAnswerRequest,
+    NashTensorGenerateRequest,
+    NashTensorProblemResponse,
+    NashZeroSumAnswerRequest,
     ProblemText
 )
 
 router = APIRouter()
 
+# Forma normală (pentru explicații) se enumeră doar până la 10^4 profiluri
+NASH_EXTENSIVE_NORMAL_FORM_MAX_LOG10 = 4
+
+
+def _reconstruction_params(answer: NashGenerationParams, problem_type: Optional[str] = None) -> Dict[str, Any]:
+    """Parametrii de generare ai problemei la care se răspunde (pentru reconstrucția din seed)."""
+    return {
+        "rows": answer.rows,
+        "cols": answer.cols,
+        "random_size": answer.random_size,
+        "large_game": answer.large_game,
+        "target_equilibria": answer.target_equilibria,
+        "problem_type": problem_type
+    }
+
+
+def _check_problem_type(problem_type: str) -> None:
+    if problem_type not in NASH_PROBLEM_TYPES:
+        raise HTTPException(status_code=400,
+                            detail=f"Tipul problemei trebuie să fie unul dintre {', '.join(NASH_PROBLEM_TYPES)}.")
+
+
+def _generate(seed: int, params: Dict[str, Any]):
+    """`generate_and_solve_nash`, cu ținta de echilibre imposibil de atins raportată ca 400."""
+    target = params.get("target_equilibria")
+    if target is not None and target < 0:
+        raise HTTPException(status_code=400, detail="Numărul de echilibre cerut trebuie să fie pozitiv.")
+    try:
+        return generate_and_solve_nash(seed=seed, params=params)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+
+def _editor_session(session_id: str):
+    """Sesiunea de editare cerută, cu sesiunile inexistente sau evacuate raportate ca 404."""
+    session = nash_editor_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Sesiunea de editare nu există sau a expirat.")
+    return session
+
+
+def _generate_tensor(seed: int, players: int, strategies):
+    """`generate_and_solve_tensor`, cu dimensiunile invalide raportate ca 400."""
+    try:
+        return generate_and_solve_tensor(seed=seed, params={"players": players, "strategies": strategies})
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+
+def _generate_extensive(seed: int, request):
+    """`generate_and_solve_extensive`, cu arborii prea mari raportați ca 400."""
+    params = {"players": request.players, "depth": request.depth, "max_breadth": request.max_breadth}
+    try:
+        return generate_and_solve_extensive(seed=seed, params=params)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
 
 @router.post("/generate/nash", response_model=NashProblemResponse)
 async def generate_nash_problem(request: NashGenerateRequest):
     """
     Generates a Nash problem based on user preferences.
     """
+    _check_problem_type(request.problem_type)
+    # Notarea strategiilor mixte (/evaluate/nash/mixed) există doar pentru jocurile mici
+    if request.problem_type == NASH_PROBLEM_MIXED and request.large_game:
+        raise HTTPException(status_code=400, detail="Problemele cu strategii mixte sunt disponibile doar pentru jocurile mici.")
     new_seed = get_new_seed()
 
     # Pass the request parameters to the solver
     params = {
         "rows": request.rows,
         "cols": request.cols,
-        "random_size": request.random_size
+        "random_size": request.random_size,
+        "large_game": request.large_game,
+        "problem_type": request.problem_type,
+        "target_equilibria": request.target_equilibria
     }
 
-    matrix_obj, _, text_dict = generate_and_solve_nash(
+    matrix_obj, _, text_dict = _generate(
         seed=new_seed,
         params=params
     )
 
+    # Grila JSON implicită sau, la cerere, tabloul compact (base64 / listă plată)
+    if request.matrix_format in NASH_COMPACT_FORMATS:
+        matrix, matrix_compact = None, matrix_obj.to_compact(request.matrix_format)
+    else:
+        matrix, matrix_compact = matrix_obj.to_schema(), None
+
+    editor_session, editor_equilibria = None, None
+    if request.editable:
+        editor_session, session = nash_editor_sessions.create(matrix_obj)
+        editor_equilibria = session.index.equilibria()
+
     return NashProblemResponse(
         seed=new_seed,
-        matrix=matrix_obj,
+        matrix=matrix,
+        matrix_compact=matrix_compact,
+        editor_session=editor_session,
+        editor_equilibria=editor_equilibria,
+        text=ProblemText(**text_dict),
+        difficulty=f"{matrix_obj.rows}x{matrix_obj.cols}",
+        problem_type=request.problem_type
+    )
+
+
+@router.post("/generate/nash/tensor", response_model=NashTensorProblemResponse)
+async def generate_nash_tensor_problem(request: NashTensorGenerateRequest):
+    """
+    Generează un joc cu N jucători; plățile sunt trimise doar în format compact (listă plată sau base64).
+    """
+    if request.matrix_format not in NASH_COMPACT_FORMATS:
+        raise HTTPException(status_code=400, detail="Jocurile cu N jucători se trimit doar ca 'flat' sau 'base64'.")
+    new_seed = get_new_seed()
+    game, _, text_dict = _generate_tensor(new_seed, request.players, request.strategies)
+
+    return NashTensorProblemResponse(
+        seed=new_seed,
+        game=game.to_schema(request.matrix_format),
         text=ProblemText(**text_dict),
-        difficulty=f"{matrix_obj.rows}x{matrix_obj.cols}"
+        difficulty="x".join(str(s) for s in game.strategies)
+    )
+
+
+@router.post("/generate/nash/extensive", response_model=NashExtensiveProblemResponse)
+async def generate_nash_extensive_problem(request: NashExtensiveGenerateRequest):
+    """
+    Generează un joc secvențial (arbore în ordine BFS, cu jucătorul care mută în fiecare nod).
+    """
+    new_seed = get_new_seed()
+    game, _, text_dict = _generate_extensive(new_seed, request)
+
+    return NashExtensiveProblemResponse(
+        seed=new_seed,
+        tree=game.to_schema(),
+        text=ProblemText(**text_dict),
+        difficulty=f"{game.players} jucători, adâncime {game.depth}"
+    )
+
+
+@router.post("/edit/nash/{session_id}", response_model=NashCellUpdateResponse)
+async def update_nash_cell(session_id: str, update: NashCellUpdateRequest):
+    """
+    Modifică o celulă a matricei dintr-o sesiune de editare și întoarce echilibrele pure
+    actualizate incremental (O(rows + cols)), plus cele apărute / dispărute.
+    """
+    session = _editor_session(session_id)
+    matrix = session.index.matrix
+    if not (0 <= update.row < matrix.rows and 0 <= update.col < matrix.cols):
+        raise HTTPException(status_code=400, detail="Celula nu există în matrice.")
+    if not all(NASH_PAYOFF_MIN <= payoff <= NASH_PAYOFF_MAX for payoff in (update.p1, update.p2)):
+        raise HTTPException(status_code=400,
+                            detail=f"Plățile trebuie să fie între {NASH_PAYOFF_MIN} și {NASH_PAYOFF_MAX}.")
+
+    with session.lock:
+        change = session.index.update(update.row, update.col, update.p1, update.p2)
+        equilibria = session.index.equilibria()
+
+    return NashCellUpdateResponse(
+        session_id=session_id,
+        equilibria=equilibria,
+        added=change.added,
+        removed=change.removed
     )
 
 
@@ -46,23 +223,164 @@ async def generate_nash_problem(request: NashGenerateRequest):
 async def evaluate_nash_answer(user_answer: NashAnswerRequest):
     """
     Evaluează răspunsul utilizatorului.
-    Reconstruiește problema folosind Seed-ul + Parametrii trimiși de frontend.
+    Reconstruiește problema folosind Seed-ul + Parametrii trimiși de frontend; în modul editor
+    (`editor_session`) se notează matricea editată, cu echilibrele din indexul sesiunii.
     """
+    # Fără echilibru pur, explicația indică un echilibru mixt (Lemke–Howson; doar pentru jocurile mici)
+    mixed_equilibrium = None
 
-    # Reconstruim parametrii originali
-    reconstruction_params = {
-        "rows": user_answer.rows,
-        "cols": user_answer.cols,
-        "random_size": user_answer.random_size
-    }
+    if user_answer.editor_session is not None:
+        session = _editor_session(user_answer.editor_session)
+        with session.lock:
+            correct_equilibria = session.index.equilibria()
+            if not correct_equilibria and not user_answer.large_game:
+                mixed_equilibrium = lemke_howson(*payoff_arrays(session.index.matrix))
+    else:
+        # Reconstruim parametrii originali
+        reconstruction_params = _reconstruction_params(user_answer)
+
+        # Regenerăm soluția corectă folosind aceeași configurație
+        matrix_obj, correct_equilibria, _ = _generate(
+            seed=user_answer.problem_seed,
+            params=reconstruction_params
+        )
+        if not correct_equilibria and not user_answer.large_game:
+            mixed_equilibrium = lemke_howson(*payoff_arrays(matrix_obj))
+
+    return evaluate_nash(
+        user_answer=user_answer,
+        correct_equilibria=correct_equilibria,
+        mixed_equilibrium=mixed_equilibrium
+    )
 
-    # Regenerăm soluția corectă folosind aceeași configurație
-    _, correct_equilibria, _ = generate_and_solve_nash(
+
+@router.post("/evaluate/nash/mixed", response_model=NashEvaluationResponse)
+async def evaluate_nash_mixed_answer(user_answer: NashMixedAnswerRequest):
+    """
+    Evaluează un răspuns în strategii mixte.
+    Matricea este reconstruită din seed și parametri, iar echilibrul de referință
+    (afișat la răspunsuri greșite) este calculat cu Lemke–Howson.
+    """
+    if user_answer.large_game:
+        raise HTTPException(status_code=400, detail="Problemele cu strategii mixte sunt disponibile doar pentru jocurile mici.")
+
+    reconstruction_params = _reconstruction_params(user_answer)
+    matrix_obj, _, _ = _generate(
         seed=user_answer.problem_seed,
         params=reconstruction_params
     )
+    p1, p2 = payoff_arrays(matrix_obj)
 
-    return evaluate_nash(
+    return evaluate_mixed_nash(
+        user_answer=user_answer,
+        p1=p1,
+        p2=p2,
+        reference=lemke_howson(p1, p2)
+    )
+
+
+@router.post("/evaluate/nash/zero_sum", response_model=NashEvaluationResponse)
+async def evaluate_nash_zero_sum_answer(user_answer: NashZeroSumAnswerRequest):
+    """
+    Evaluează un răspuns la un joc de sumă nulă (valoarea jocului și strategia Jucătorului 1).
+    Soluția de referință este calculată cu simplexul din `zero_sum`, inclusiv pentru jocurile mari
+    (acestea sunt întâi reduse prin eliminarea strategiilor strict dominate).
+    """
+    reconstruction_params = _reconstruction_params(user_answer, problem_type=NASH_PROBLEM_ZERO_SUM)
+    matrix_obj, _, _ = _generate(
+        seed=user_answer.problem_seed,
+        params=reconstruction_params
+    )
+    p1, _ = payoff_arrays(matrix_obj)
+
+    return evaluate_zero_sum(
+        user_answer=user_answer,
+        p1=p1,
+        solution=solve_zero_sum(p1, reduce=user_answer.large_game)
+    )
+
+
+@router.post("/evaluate/nash/iesds", response_model=NashEvaluationResponse)
+async def evaluate_nash_iesds_answer(user_answer: NashIesdsAnswerRequest):
+    """
+    Evaluează un răspuns la eliminarea iterată a strategiilor strict dominate.
+    """
+    reconstruction_params = _reconstruction_params(user_answer)
+    matrix_obj, _, _ = _generate(
+        seed=user_answer.problem_seed,
+        params=reconstruction_params
+    )
+
+    return evaluate_iesds(
+        user_answer=user_answer,
+        result=iterated_elimination(*payoff_arrays(matrix_obj))
+    )
+
+
+@router.post("/evaluate/nash/tensor", response_model=NashEvaluationResponse)
+async def evaluate_nash_tensor_answer(user_answer: NashTensorAnswerRequest):
+    """
+    Evaluează un răspuns la un joc cu N jucători (jocul este reconstruit din seed și dimensiuni).
+    """
+    _, correct_equilibria, _ = _generate_tensor(
+        user_answer.problem_seed, user_answer.players, user_answer.strategies
+    )
+
+    return evaluate_tensor_nash(
         user_answer=user_answer,
         correct_equilibria=correct_equilibria
-    )
\ No newline at end of file
+    )
+
+
+@router.post("/evaluate/nash/extensive", response_model=NashEvaluationResponse)
+async def evaluate_nash_extensive_answer(user_answer: NashExtensiveAnswerRequest):
+    """
+    Evaluează drumul de echilibru propus pentru un joc secvențial.
+    Pentru jocurile mici, explicația compară cu echilibrele Nash pure ale formei normale.
+    """
+    game, equilibrium, _ = _generate_extensive(user_answer.problem_seed, user_answer)
+
+    normal_form_equilibria = None
+    normal_form = game.normal_form
+    if sum(normal_form.log10_strategy_counts()) <= NASH_EXTENSIVE_NORMAL_FORM_MAX_LOG10:
+        tensor = normal_form.to_tensor()
+        normal_form_equilibria = len(solve_pure_nash_tensor(tensor.player_payoffs()))
+
+    return evaluate_extensive(
+        user_answer=user_answer,
+        equilibrium=equilibrium,
+        normal_form_equilibria=normal_form_equilibria
+    )
+
+
+@router.post("/dynamics/nash")
+def stream_nash_dynamics(request: NashDynamicsRequest):
+    """
+    Transmite (NDJSON, câte un eveniment pe linie) o simulare a dinamicilor evolutive pe lotul de
+    populații: eșantioane la fiecare `stride` pași, apoi echilibrele la care converg traiectoriile.
+    Istoricul nu este stocat; memoria depinde doar de numărul de populații și de dimensiunea jocului.
+    """
+    if request.rule not in NASH_DYNAMICS_RULES:
+        raise HTTPException(status_code=400,
+                            detail=f"Dinamica trebuie să fie una dintre {', '.join(NASH_DYNAMICS_RULES)}.")
+    _check_problem_type(request.problem_type)
+    matrix_obj, _, _ = _generate(
+        seed=request.problem_seed,
+        params=_reconstruction_params(request, problem_type=request.problem_type)
+    )
+    events = iter_dynamics(
+        *payoff_arrays(matrix_obj),
+        rule=request.rule,
+        populations=request.populations,
+        steps=request.steps,
+        step_size=request.step_size,
+        stride=request.stride,
+        sampled=request.sampled,
+        seed=request.dynamics_seed
+    )
+
+    def ndjson_lines():
+        for event in events:
+            yield json.dumps(event, separators=(",", ":")) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
\ No newline at end of file
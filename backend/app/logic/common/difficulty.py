@@ -13,6 +13,25 @@ MINMAX_L6_MAX_BREADTH = 3
 NASH_MATRIX_MIN_SIZE = 2
 NASH_MATRIX_MAX_SIZE = 3
 
+# Limitele dimensiunilor cerute explicit (mod normal / mod "joc mare")
+NASH_REQUEST_MIN_SIZE = 2
+NASH_REQUEST_MAX_SIZE = 4
+NASH_LARGE_MAX_SIZE = 2000
+# Jocurile de sumă nulă mari sunt rezolvate prin simplex (cost ~ pivotări x m x n)
+NASH_ZERO_SUM_MAX_SIZE = 500
+# Jocuri cu N jucători (tensori de plăți): limitele jucătorilor, strategiilor și profilurilor
+NASH_TENSOR_MAX_PLAYERS = 6
+NASH_TENSOR_MAX_STRATEGIES = 100
+NASH_TENSOR_MAX_PROFILES = 1_000_000
+# Jocuri în formă extinsă: adâncimea aleatoare (probleme mici), limitele cerute explicit
+NASH_EXTENSIVE_MIN_DEPTH = 2
+NASH_EXTENSIVE_MAX_DEPTH = 3
+NASH_EXTENSIVE_MAX_REQUEST_DEPTH = 40
+NASH_EXTENSIVE_MIN_BREADTH = 2
+NASH_EXTENSIVE_MAX_BREADTH = 10
+NASH_EXTENSIVE_MAX_PLAYERS = 4
+NASH_EXTENSIVE_MAX_NODES = 2_000_000
+
 NASH_MIN_PAYOFF = -5
 NASH_MAX_PAYOFF = 10
 
@@ -14,6 +14,15 @@ def set_seed(seed_id: int) -> int:
     return seed_id
 
 
+def get_rng(seed_id: int) -> random.Random:
+    """
+    Returnează un generator pseudo-aleator propriu, inițializat cu seed-ul dat.
+    Produce aceeași secvență ca random.seed(seed_id) urmat de apelurile globale,
+    dar nu partajează starea între cereri (sigur pentru rulări în paralel).
+    """
+    return random.Random(seed_id)
+
+
 def get_new_seed() -> int:
     """
     Generează un seed nou, unic, bazat pe o combinație de timp și UUID.
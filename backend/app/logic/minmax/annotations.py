@@ -0,0 +1,134 @@
+"""
+Tabelul de adnotări Alpha-Beta per nod, pentru notarea parțială a răspunsurilor.
+
+O singură parcurgere (bucla comună `_walk_alpha_beta`, prin cârlige) completează, pentru fiecare index de nod:
+  values  - valoarea întoarsă de nod (fail-soft, ca la tablă); pentru frunze, valoarea lor
+  alpha   - alpha la ieșirea din nod (pentru frunze: fereastra în care au fost evaluate)
+  beta    - beta la ieșirea din nod
+  pruned  - nodul nu a fost vizitat (tăiat împreună cu un strămoș sau frate)
+Tablourile sunt NumPy int32 / bool, deci notarea unui răspuns complet este o singură
+comparație vectorizată. ±infinit este codificat cu limitele int32; nodurile tăiate au
+valoarea ANNOTATION_MISSING.
+"""
+from typing import Optional
+
+import numpy as np
+
+from app.logic.minmax.solver import AlphaBetaStats, AlphaBetaVisitor, run_alpha_beta_visitor
+from app.logic.minmax.tree import FlatTree
+
+ANNOTATION_NEG_INF = int(np.iinfo(np.int32).min)
+ANNOTATION_POS_INF = int(np.iinfo(np.int32).max)
+# Valoarea nodurilor nevizitate (nu există o valoare întoarsă)
+ANNOTATION_MISSING = ANNOTATION_NEG_INF
+
+
+def _encode_bound(bound: float) -> int:
+    if bound == -float('inf'):
+        return ANNOTATION_NEG_INF
+    if bound == float('inf'):
+        return ANNOTATION_POS_INF
+    return int(bound)
+
+
+def decode_bound(bound: int) -> Optional[int]:
+    """Marginea din tabel, cu ±infinit ca None (la fel ca în trace-ul NDJSON)."""
+    return None if bound in (ANNOTATION_NEG_INF, ANNOTATION_POS_INF) else int(bound)
+
+
+class AlphaBetaAnnotations:
+    """Adnotările unui arbore, aliniate cu indicii nodurilor din `FlatTree`."""
+
+    def __init__(self, values: np.ndarray, alpha: np.ndarray, beta: np.ndarray, pruned: np.ndarray):
+        self.values = values
+        self.alpha = alpha
+        self.beta = beta
+        self.pruned = pruned
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def root_value(self) -> int:
+        return int(self.values[0])
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.alpha.nbytes + self.beta.nbytes + self.pruned.nbytes
+
+
+class _AnnotationVisitor(AlphaBetaVisitor):
+    """Completează tabelele de adnotări din cârligele parcurgerii comune."""
+
+    def __init__(self, size: int):
+        # Listele Python sunt mai rapide la scrieri individuale; conversia în NumPy se face o dată, la final
+        self.values = [ANNOTATION_MISSING] * size
+        self.alpha = [ANNOTATION_NEG_INF] * size
+        self.beta = [ANNOTATION_POS_INF] * size
+        self.visited = bytearray(size)
+
+    def enter(self, node, depth, alpha, beta):
+        self.visited[node] = 1
+
+    def leaf(self, node, depth, alpha, beta, value):
+        self.visited[node] = 1
+        self.values[node] = value
+        self.alpha[node] = _encode_bound(alpha)
+        self.beta[node] = _encode_bound(beta)
+
+    def exit(self, node, depth, value, alpha, beta):
+        self.values[node] = value
+        self.alpha[node] = _encode_bound(alpha)
+        self.beta[node] = _encode_bound(beta)
+
+
+def annotate_alpha_beta(tree: FlatTree, stats: Optional[AlphaBetaStats] = None) -> AlphaBetaAnnotations:
+    """
+    Rulează Alpha-Beta (parcurgerea comună cu `_alpha_beta`, deci aceeași ordine și aceleași
+    tăieri) și reține valoarea, fereastra finală și starea de vizitare a fiecărui nod.
+    Contoarele se scriu în `stats`, deci parcurgerea poate înlocui apelul `_alpha_beta`.
+    """
+    visitor = _AnnotationVisitor(len(tree))
+    run_alpha_beta_visitor(tree, visitor, stats)
+
+    return AlphaBetaAnnotations(
+        values=np.array(visitor.values, dtype=np.int32),
+        alpha=np.array(visitor.alpha, dtype=np.int32),
+        beta=np.array(visitor.beta, dtype=np.int32),
+        pruned=np.frombuffer(bytes(visitor.visited), dtype=np.bool_) == 0,
+    )
+
+
+class NodeGrade:
+    """Rezultatul notării per nod: câte noduri sunt corecte și care sunt greșite."""
+
+    def __init__(self, correct: int, total: int, wrong: np.ndarray):
+        self.correct = correct
+        self.total = total
+        self.wrong = wrong  # indicii nodurilor greșite sau lipsă, crescător
+
+    @property
+    def percentage(self) -> int:
+        return round(100 * self.correct / self.total) if self.total else 0
+
+
+def grade_node_answers(annotations: AlphaBetaAnnotations, nodes: np.ndarray, values: np.ndarray,
+                       pruned: np.ndarray) -> NodeGrade:
+    """
+    Notează un răspuns complet dintr-o singură comparație vectorizată.
+    Un nod este corect dacă starea (tăiat / vizitat) coincide și, pentru nodurile vizitate,
+    valoarea coincide. Nodurile netrimise sunt greșite; pentru un index trimis de mai multe ori
+    contează ultima apariție.
+    """
+    total = len(annotations)
+    nodes = np.asarray(nodes, dtype=np.int64)
+    answered = np.zeros(total, dtype=bool)
+    answered_values = np.full(total, ANNOTATION_MISSING, dtype=np.int64)
+    answered_pruned = np.zeros(total, dtype=bool)
+    answered[nodes] = True
+    answered_values[nodes] = values
+    answered_pruned[nodes] = pruned
+
+    correct = answered & (answered_pruned == annotations.pruned) & (
+        annotations.pruned | (answered_values == annotations.values))
+    return NodeGrade(correct=int(correct.sum()), total=total, wrong=np.flatnonzero(~correct))
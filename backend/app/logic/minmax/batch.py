@@ -0,0 +1,243 @@
+"""
+Rezolvarea vectorizată (NumPy) a mii de arbori MinMax deodată, pentru calibrarea dificultății.
+
+Arborii sunt concatenați și regrupați pe niveluri: nivelul `d` al lotului conține nodurile
+de pe nivelul `d` ale tuturor arborilor, în ordinea arborilor și apoi BFS. Astfel copiii
+nodurilor interne de pe nivelul `d` ocupă, în aceeași ordine, intervale contigue pe nivelul
+`d + 1`, iar fiecare nivel se reduce dintr-o singură operație (`np.maximum.reduceat`).
+
+Numărul de frunze vizitate de Alpha-Beta se obține dintr-o a doua trecere, de sus în jos,
+folosind valorile exacte ale nodurilor: ferestrele (alpha, beta) și tăierile sunt identice
+cu cele ale căutării secvențiale (o valoare fail-soft în afara ferestrei are același efect
+ca valoarea exactă). La un nod MAX, copilul `i` primește fereastra
+(max(alpha, max(v_0..v_{i-1})), beta) și este vizitat cât timp fereastra nu este vidă;
+simetric pentru MIN. Maximul prefix pe segmente se calculează cu un singur
+`np.maximum.accumulate`, adăugând fiecărei valori un decalaj proporțional cu indexul părintelui.
+A doua trecere coboară doar în copiii nodurilor vizitate.
+
+Modulul rezolvă arbori deja generați: generarea din seed-uri (`generate_minmax_trees`) este
+o buclă Python, mai scumpă decât rezolvarea, și se face o singură dată per lot.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.logic.common.seed import get_rng
+from app.logic.minmax.solver import MINMAX_SOURCE_RANDOM, _generate_flat_tree, _resolve_tree_params
+from app.logic.minmax.tree import FlatTree, NODE_MAX, NODE_CHANCE
+
+
+class BatchResult:
+    """Rezultatele unui lot, ca tablouri NumPy aliniate cu lista de arbori."""
+
+    def __init__(self, depths: np.ndarray, root_is_max: np.ndarray, root_values: np.ndarray,
+                 leaves_visited: np.ndarray, cutoffs: np.ndarray, leaf_counts: np.ndarray,
+                 node_values: np.ndarray, node_offsets: np.ndarray):
+        self.depths = depths
+        self.root_is_max = root_is_max
+        self.root_values = root_values
+        self.leaves_visited = leaves_visited
+        self.cutoffs = cutoffs  # numărul total de tăieri Alpha-Beta per arbore
+        self.leaf_counts = leaf_counts
+        self.node_values = node_values  # valoarea minimax exactă a fiecărui nod, arbore după arbore
+        self.node_offsets = node_offsets  # nodurile arborelui i: node_offsets[i] .. node_offsets[i + 1] - 1
+
+    def tree_values(self, index: int) -> np.ndarray:
+        """Valorile nodurilor arborelui `index`, aliniate cu indicii din `FlatTree`."""
+        return self.node_values[self.node_offsets[index]:self.node_offsets[index + 1]]
+
+    def __len__(self) -> int:
+        return len(self.depths)
+
+    def distribution_by_depth(self) -> Dict[int, Dict[str, Any]]:
+        """Statistici de calibrare pe adâncimi: valorile rădăcinii și frunzele vizitate."""
+        summary = {}
+        for depth in np.unique(self.depths).tolist():
+            mask = self.depths == depth
+            values, counts = np.unique(self.root_values[mask], return_counts=True)
+            visited = self.leaves_visited[mask]
+            summary[depth] = {
+                "trees": int(mask.sum()),
+                "root_values": dict(zip(values.tolist(), counts.tolist())),
+                "leaves_visited_mean": float(visited.mean()),
+                "leaves_visited_percentiles": np.percentile(visited, [10, 50, 90]).tolist(),
+                "pruned_fraction_mean": float((1 - visited / self.leaf_counts[mask]).mean()),
+            }
+        return summary
+
+
+def _segmented_exclusive_prefix_max(values: np.ndarray, segment_offsets: np.ndarray,
+                                    is_first: np.ndarray) -> np.ndarray:
+    """
+    Pentru fiecare copil, maximul valorilor (>= 0) fraților aflați înaintea lui (-1 pentru primul).
+    Decalajul `segment_offsets` (indexul părintelui înmulțit cu domeniul valorilor) face ca
+    maximul cumulat să nu treacă dintr-un segment în altul.
+    """
+    inclusive = np.maximum.accumulate(segment_offsets + values) - segment_offsets
+    exclusive = np.empty_like(inclusive)
+    exclusive[0] = -1
+    exclusive[1:] = inclusive[:-1]
+    exclusive[is_first] = -1
+    return exclusive
+
+
+def solve_flat_trees_batch(trees: List[FlatTree]) -> Dict[str, np.ndarray]:
+    """
+    Valoarea rădăcinii, frunzele vizitate și tăierile Alpha-Beta pentru fiecare arbore din listă,
+    plus valoarea minimax a fiecărui nod (`node_values`, concatenate în ordinea de intrare, cu
+    arborele i între `node_offsets[i]` și `node_offsets[i + 1]`).
+    Arborii cu noduri de șansă nu sunt suportați (folosesc `star_minimax`).
+    """
+    count = len(trees)
+    if count == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return {"root_values": empty, "leaves_visited": empty, "cutoffs": empty, "leaf_counts": empty,
+                "node_values": empty, "node_offsets": np.zeros(1, dtype=np.int64)}
+
+    # O singură copiere per tablou: `bytes.join` concatenează direct bufferele `array`
+    sizes = np.fromiter(map(len, trees), dtype=np.int64, count=count)
+    arity = np.frombuffer(b"".join(tree.arity for tree in trees), dtype=np.int32)
+    values = np.frombuffer(b"".join(tree.values for tree in trees), dtype=np.int32).astype(np.int64)
+    types = np.frombuffer(b"".join(tree.types for tree in trees), dtype=np.int8)
+    if np.any(types == NODE_CHANCE):
+        raise ValueError("Arborii cu noduri CHANCE nu sunt suportați de rezolvarea în lot.")
+
+    # Nivelul fiecărui nod, din lățimile nivelurilor fiecărui arbore (liste Python, fără apeluri NumPy per arbore)
+    widths, level_ids = [], []
+    for tree in trees:
+        starts = tree.level_starts
+        widths.extend(b - a for a, b in zip(starts, starts[1:] + [len(tree)]))
+        level_ids.extend(range(len(starts)))
+    tree_ids = np.repeat(np.arange(count), sizes)
+    levels = np.repeat(np.array(level_ids, dtype=np.int16), widths)
+
+    # Regrupare stabilă pe niveluri (radix sort pe int16): ordinea arborilor și ordinea BFS sunt păstrate
+    order = np.argsort(levels, kind="stable")
+    arity, values, types, tree_ids = arity[order], values[order], types[order], tree_ids[order]
+    level_bounds = np.searchsorted(levels[order], np.arange(levels.max() + 2))
+    level_slices = [slice(level_bounds[d], level_bounds[d + 1]) for d in range(len(level_bounds) - 1)]
+
+    # --- Trecerea 1 (de jos în sus): valoarea exactă a fiecărui nod ---
+    for depth in range(len(level_slices) - 2, -1, -1):
+        level, below = level_slices[depth], level_slices[depth + 1]
+        level_arity = arity[level]
+        internal = np.flatnonzero(level_arity)
+        if len(internal) == 0:
+            continue
+        child_values = values[below]
+        starts = np.concatenate(([0], np.cumsum(level_arity[internal])[:-1]))
+        maxima = np.maximum.reduceat(child_values, starts)
+        minima = np.minimum.reduceat(child_values, starts)
+        level_values = values[level]
+        level_values[internal] = np.where(types[level][internal] == NODE_MAX, maxima, minima)
+        values[level] = level_values
+
+    # --- Trecerea 2 (de sus în jos): ferestrele Alpha-Beta, doar pe nodurile vizitate ---
+    # Valorile sunt deplasate în 1..value_range; 0 și value_range + 1 țin locul lui -inf / +inf
+    value_low = int(values.min()) - 1
+    shifted = values - value_low
+    value_range = int(shifted.max())
+    visited = np.zeros(len(values), dtype=bool)
+    visited[level_slices[0]] = True
+    cutoffs = np.zeros(count, dtype=np.int64)
+
+    # Nodurile vizitate de pe nivelul curent (indici globali) și fereastra cu care sunt căutate
+    nodes = np.arange(level_slices[0].start, level_slices[0].stop)
+    node_alpha = np.zeros(len(nodes), dtype=np.int64)
+    node_beta = np.full(len(nodes), value_range + 1, dtype=np.int64)
+
+    for depth in range(len(level_slices) - 1):
+        level, below = level_slices[depth], level_slices[depth + 1]
+        node_arity = arity[nodes]
+        internal = node_arity > 0
+        nodes, node_alpha, node_beta, node_arity = (
+            nodes[internal], node_alpha[internal], node_beta[internal], node_arity[internal])
+        if len(nodes) == 0:
+            break
+
+        # Copiii nodurilor vizitate: câte un segment contiguu pe nivelul următor pentru fiecare nod
+        level_first_child = below.start + np.cumsum(arity[level]) - arity[level]
+        node_first_child = level_first_child[nodes - level.start]
+        segment_starts = np.cumsum(node_arity) - node_arity
+        parents = np.repeat(np.arange(len(nodes)), node_arity)
+        children = np.arange(len(parents)) - segment_starts[parents] + node_first_child[parents]
+        is_first = np.zeros(len(children), dtype=bool)
+        is_first[segment_starts] = True
+
+        child_values = shifted[children]
+        segment_offsets = parents * (value_range + 2)
+        # Fără frați anteriori, maximul prefix devine -1 < 0 (= -inf), iar minimul value_range + 2 (> +inf)
+        prefix_max = _segmented_exclusive_prefix_max(child_values, segment_offsets, is_first)
+        prefix_min = value_range + 1 - _segmented_exclusive_prefix_max(
+            value_range + 1 - child_values, segment_offsets, is_first)
+
+        parent_alpha = node_alpha[parents]
+        parent_beta = node_beta[parents]
+        parent_is_max = types[nodes][parents] == NODE_MAX
+        child_alpha = np.where(parent_is_max, np.maximum(parent_alpha, prefix_max), parent_alpha)
+        child_beta = np.where(parent_is_max, parent_beta, np.minimum(parent_beta, prefix_min))
+        child_visited = child_alpha < child_beta
+
+        # Tăiere: nod vizitat cu copii rămași neexplorați
+        visited_children = np.add.reduceat(child_visited.astype(np.int64), segment_starts)
+        cut = visited_children < node_arity
+        cutoffs += np.bincount(tree_ids[nodes][cut], minlength=count)
+
+        nodes = children[child_visited]
+        node_alpha, node_beta = child_alpha[child_visited], child_beta[child_visited]
+        visited[nodes] = True
+
+    leaves = arity == 0
+    root_values = values[level_slices[0]]
+    # Valorile tuturor nodurilor, înapoi în ordinea de intrare (arbore după arbore, BFS)
+    node_values = np.empty_like(values)
+    node_values[order] = values
+    return {
+        "root_values": root_values,
+        "leaves_visited": np.bincount(tree_ids[leaves & visited], minlength=count),
+        "cutoffs": cutoffs,
+        "leaf_counts": np.bincount(tree_ids[leaves], minlength=count),
+        "node_values": node_values,
+        "node_offsets": np.concatenate(([0], np.cumsum(sizes))),
+    }
+
+
+def generate_minmax_trees(seeds: Iterable[int], params: Optional[Dict[str, Any]] = None) -> List[FlatTree]:
+    """
+    Arborii lui `solve_minmax` pentru o listă de seed-uri (același RNG per seed).
+    Generarea este o buclă Python (un RNG per seed) și costă de câteva ori mai mult decât
+    rezolvarea în lot: pentru calibrări repetate, arborii se generează o dată și se refolosesc.
+    """
+    source = (params or {}).get("source") or MINMAX_SOURCE_RANDOM
+    if (params or {}).get("chance_nodes"):
+        raise ValueError("Arborii cu noduri CHANCE nu sunt suportați de rezolvarea în lot.")
+
+    trees = []
+    for seed in seeds:
+        rng = get_rng(seed)
+        depth, is_max = _resolve_tree_params(rng, params)
+        if source == MINMAX_SOURCE_RANDOM:
+            trees.append(_generate_flat_tree(max_depth=depth, is_max=is_max, rng=rng))
+        else:
+            from app.logic.minmax.games import generate_game_problem
+
+            trees.append(generate_game_problem(source, rng, depth, is_max)[0])
+    return trees
+
+
+def solve_minmax_batch(trees: List[FlatTree]) -> BatchResult:
+    """
+    Echivalentul vectorizat al lui `_alpha_beta` pentru o listă de arbori deja generați
+    (de exemplu cu `generate_minmax_trees`): rezultatele coincid cu solverul scalar.
+    """
+    solved = solve_flat_trees_batch(trees)
+    return BatchResult(
+        depths=np.fromiter((tree.depth for tree in trees), dtype=np.int64, count=len(trees)),
+        root_is_max=np.fromiter((tree.types[0] == NODE_MAX for tree in trees), dtype=bool, count=len(trees)),
+        root_values=solved["root_values"],
+        leaves_visited=solved["leaves_visited"],
+        cutoffs=solved["cutoffs"],
+        leaf_counts=solved["leaf_counts"],
+        node_values=solved["node_values"],
+        node_offsets=solved["node_offsets"],
+    )
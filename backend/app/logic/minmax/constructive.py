@@ -0,0 +1,354 @@
+"""
+Generator constructiv: valori ale frunzelor care impun un anumit tipar de tăieri Alpha-Beta.
+
+Forma arborelui vine din seed (ca de obicei); aici alegem doar valorile frunzelor vizitate,
+astfel încât Alpha-Beta să viziteze exact `target_visited` frunze sau să facă cel puțin
+`min_cutoffs` tăieri, fără a reîncerca alte seed-uri.
+
+Comportamentul Alpha-Beta într-un nod depinde doar de:
+  - modul ferestrei: care dintre alpha / beta sunt finite (4 moduri);
+  - rezultatul nodului față de fereastră: LOW (v <= alpha), MID (alpha < v < beta), HIGH (v >= beta).
+Cu valori reale, orice combinație de rezultate compatibilă cu modurile poate fi realizată
+(o transformare monotonă duce orice fereastră finită în oricare alta).
+
+1. De jos în sus: pentru fiecare (nod, mod, rezultat), mulțimea numerelor realizabile
+   (frunze vizitate sau tăieri), ca bitset (bitul c setat <=> c este realizabil).
+   Un nod MAX taie (HIGH) la primul copil HIGH; LOW înseamnă toți copiii LOW;
+   MID înseamnă niciun copil HIGH și cel puțin unul MID. Simetric pentru MIN.
+2. De sus în jos: alegem rezultatul și numărul fiecărui copil vizitat, simulăm Alpha-Beta
+   cu ferestre numerice și dăm frunzelor valori exacte (alpha, beta sau mijlocul ferestrei).
+3. Valorile frunzelor vizitate sunt comprimate după rang (ordinea și egalitățile se păstrează,
+   deci și tăierile) în intervalul 1..20 (1..m dacă sunt m > 20 valori distincte).
+   Frunzele nevizitate își păstrează valorile din seed.
+
+Fiecare nod este procesat o singură dată în fiecare direcție, dar munca per nod este o
+convoluție de bitset-uri, proporțională cu numărul de valori realizabile ale copilului
+înmulțit cu lățimea bitset-ului. Necapată, lățimea crește cu subarborele (până la numărul
+lui de frunze), iar costul total devine supraliniar. De aceea bitset-urile sunt limitate la
+`limit` biți: numerele >= limit sunt comasate într-un singur bit de saturație, ceea ce
+păstrează exact toate sumele < limit (singurele folosite la descompunerea unei ținte mai mici).
+Ținta este adusă întâi între minimul și maximul realizabil (două treceri liniare, fără bitset-uri),
+iar limita nu depășește CONSTRUCTIVE_MAX_WIDTH: costul este liniar în numărul de noduri.
+"""
+from array import array
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+
+from app.logic.minmax.tree import FlatTree, NODE_MAX
+
+OUTCOME_LOW = 0
+OUTCOME_MID = 1
+OUTCOME_HIGH = 2
+
+# Ce numărăm: frunze vizitate sau tăieri (noduri cu copii rămași neexplorați)
+COUNT_LEAVES = "leaves"
+COUNT_CUTOFFS = "cutoffs"
+
+# Intervalul valorilor frunzelor (aceleași ca în generatorul aleator)
+LEAF_VALUE_MIN = 1
+LEAF_VALUE_MAX = 20
+
+# Cea mai mare țintă acceptată (frunze vizitate sau tăieri) și lățimea maximă a bitset-urilor
+CONSTRUCTIVE_MAX_TARGET = 4096
+CONSTRUCTIVE_MAX_WIDTH = 2 * CONSTRUCTIVE_MAX_TARGET + 2
+
+
+def _mode(alpha_finite: bool, beta_finite: bool) -> int:
+    return 2 * alpha_finite + beta_finite
+
+
+def _bits(mask: int) -> List[int]:
+    """Indicii biților setați, în ordine crescătoare."""
+    result = []
+    while mask:
+        low = mask & -mask
+        result.append(low.bit_length() - 1)
+        mask ^= low
+    return result
+
+
+def _saturate(mask: int, limit: Optional[int]) -> int:
+    """Comasează biții >= limit în bitul `limit` ("cel puțin limit")."""
+    if limit is None or not mask >> limit:
+        return mask
+    return (mask & ((1 << limit) - 1)) | (1 << limit)
+
+
+def _convolve(a: int, b: int, limit: Optional[int] = None) -> int:
+    """Mulțimea sumelor {x + y | x în a, y în b}, pentru bitset-uri (saturată la `limit`)."""
+    if not a or not b:
+        return 0
+    if bin(a).count("1") > bin(b).count("1"):
+        a, b = b, a
+    result = 0
+    for shift in _bits(a):
+        if limit is not None and shift >= limit:
+            # Toate sumele rămase sunt >= limit
+            result |= 1 << limit
+            break
+        result |= b << shift
+    return _saturate(result, limit)
+
+
+class CutoffPlanner:
+    """Mulțimile realizabile (pas 1) și descompunerea unei ținte pe copii (pas 2)."""
+
+    def __init__(self, tree: FlatTree, metric: str = COUNT_LEAVES, limit: Optional[int] = None):
+        self.tree = tree
+        self.metric = metric
+        # Numerele >= limit sunt comasate în bitul `limit` (None = fără limită)
+        self.limit = limit
+        # sets[nod][mod] = (LOW, MID, HIGH), fiecare un bitset
+        self.sets: List[Optional[List[Tuple[int, int, int]]]] = [None] * len(tree)
+
+        leaf_unit = 1 << (1 if metric == COUNT_LEAVES else 0)
+        arity = tree.arity
+        for node in range(len(tree) - 1, -1, -1):
+            if arity[node] == 0:
+                self.sets[node] = [
+                    (leaf_unit if mode & 2 else 0, leaf_unit, leaf_unit if mode & 1 else 0)
+                    for mode in range(4)
+                ]
+            else:
+                self.sets[node] = [self._combine(node, mode)[0] for mode in range(4)]
+
+    def _orientation(self, node: int) -> Tuple[int, int, int]:
+        """(rezultatul de tăiere, rezultatul "toți copiii la fel", bitul de mod care devine finit)."""
+        if self.tree.types[node] == NODE_MAX:
+            return OUTCOME_HIGH, OUTCOME_LOW, 2  # MAX: alpha devine finit după primul copil
+        return OUTCOME_LOW, OUTCOME_HIGH, 1  # MIN: beta devine finit după primul copil
+
+    def _combine(self, node: int, mode: int):
+        """Setul nodului în modul dat, plus prefixele necesare descompunerii."""
+        tree = self.tree
+        cut_outcome, pass_outcome, finite_bit = self._orientation(node)
+        can_cut = bool(mode & (1 if cut_outcome == OUTCOME_HIGH else 2))
+        first, count = tree.offsets[node], tree.arity[node]
+
+        # q_pass: toți copiii de până acum au rezultatul "pass"; q_mid: cel puțin unul MID, niciunul de tăiere
+        q_pass, q_mid = [1], [0]
+        cut_sets = []
+        for i in range(count):
+            child_mode = mode | finite_bit if i > 0 else mode
+            child_sets = self.sets[first + i][child_mode]
+            pass_set, mid_set, cut_set = child_sets[pass_outcome], child_sets[OUTCOME_MID], child_sets[cut_outcome]
+            bonus = 1 if self.metric == COUNT_CUTOFFS and i < count - 1 else 0
+            limit = self.limit
+            cut_sets.append(_saturate(_convolve(q_pass[i] | q_mid[i], cut_set, limit) << bonus, limit)
+                            if can_cut else 0)
+            q_pass.append(_convolve(q_pass[i], pass_set, limit))
+            q_mid.append(_convolve(q_mid[i], pass_set | mid_set, limit) | _convolve(q_pass[i], mid_set, limit))
+
+        result = [0, 0, 0]
+        result[pass_outcome] = q_pass[count]
+        result[OUTCOME_MID] = q_mid[count]
+        for cut_set in cut_sets:
+            result[cut_outcome] |= cut_set
+        return tuple(result), q_pass, q_mid, cut_sets
+
+    def decompose(self, node: int, mode: int, outcome: int, target: int) -> List[Tuple[int, int]]:
+        """(rezultat, număr) pentru fiecare copil vizitat, în ordine, astfel încât suma să fie `target`."""
+        tree = self.tree
+        cut_outcome, pass_outcome, finite_bit = self._orientation(node)
+        _, q_pass, q_mid, cut_sets = self._combine(node, mode)
+        first, count = tree.offsets[node], tree.arity[node]
+
+        def child_sets(i: int):
+            return self.sets[first + i][mode | finite_bit if i > 0 else mode]
+
+        plan: List[Tuple[int, int]] = []
+        if outcome == cut_outcome:
+            # Primul copil la care tăierea poate da exact ținta
+            for j in range(count):
+                if not cut_sets[j] >> target & 1:
+                    continue
+                bonus = 1 if self.metric == COUNT_CUTOFFS and j < count - 1 else 0
+                rest = target - bonus
+                before = q_pass[j] | q_mid[j]
+                for value in _bits(child_sets(j)[cut_outcome]):
+                    if rest - value >= 0 and before >> (rest - value) & 1:
+                        break
+                plan.append((cut_outcome, value))
+                remaining, prefix = rest - value, j
+                state = OUTCOME_MID if q_mid[j] >> remaining & 1 else pass_outcome
+                break
+        else:
+            remaining, prefix, state = target, count, outcome
+
+        # Reconstruim prefixul de la dreapta la stânga
+        for i in range(prefix - 1, -1, -1):
+            sets = child_sets(i)
+            if state == pass_outcome:
+                for value in _bits(sets[pass_outcome]):
+                    if remaining >= value and q_pass[i] >> (remaining - value) & 1:
+                        break
+                plan.append((pass_outcome, value))
+            else:
+                chosen = None
+                # Fie copilul este primul MID (prefixul e "pass"), fie prefixul conține deja un MID
+                for value in _bits(sets[OUTCOME_MID]):
+                    if remaining >= value and q_pass[i] >> (remaining - value) & 1:
+                        chosen, next_state = (OUTCOME_MID, value), pass_outcome
+                        break
+                if chosen is None:
+                    for child_outcome in (OUTCOME_MID, pass_outcome):
+                        for value in _bits(sets[child_outcome]):
+                            if remaining >= value and q_mid[i] >> (remaining - value) & 1:
+                                chosen, next_state = (child_outcome, value), OUTCOME_MID
+                                break
+                        if chosen is not None:
+                            break
+                plan.append(chosen)
+                state = next_state
+            remaining -= plan[-1][1]
+
+        plan.reverse()
+        return plan
+
+
+def _count_bound(tree: FlatTree, metric: str, maximum: bool = False) -> int:
+    """
+    Cel mai mic (sau, cu maximum=True, cel mai mare) număr realizabil la rădăcină: aceeași
+    recurență ca `CutoffPlanner._combine`, cu minime / maxime în loc de bitset-uri
+    (suma extremelor în loc de convoluție), deci liniară.
+    """
+    pick = max if maximum else min
+    missing = -float('inf') if maximum else float('inf')  # rezultat nerealizabil
+    leaf_unit = 1 if metric == COUNT_LEAVES else 0
+    arity, offsets, types = tree.arity, tree.offsets, tree.types
+    bounds: List[Optional[List[Tuple[float, float, float]]]] = [None] * len(tree)
+    for node in range(len(tree) - 1, -1, -1):
+        if arity[node] == 0:
+            bounds[node] = [(leaf_unit if mode & 2 else missing, leaf_unit, leaf_unit if mode & 1 else missing)
+                            for mode in range(4)]
+            continue
+        if types[node] == NODE_MAX:
+            cut_outcome, pass_outcome, finite_bit = OUTCOME_HIGH, OUTCOME_LOW, 2
+        else:
+            cut_outcome, pass_outcome, finite_bit = OUTCOME_LOW, OUTCOME_HIGH, 1
+        first, count = offsets[node], arity[node]
+        node_bounds = []
+        for mode in range(4):
+            can_cut = bool(mode & (1 if cut_outcome == OUTCOME_HIGH else 2))
+            q_pass, q_mid, cut = 0, missing, missing
+            for i in range(count):
+                child = bounds[first + i][mode | finite_bit if i > 0 else mode]
+                bonus = 1 if metric == COUNT_CUTOFFS and i < count - 1 else 0
+                if can_cut:
+                    cut = pick(cut, pick(q_pass, q_mid) + child[cut_outcome] + bonus)
+                q_pass, q_mid = (q_pass + child[pass_outcome],
+                                 pick(q_mid + pick(child[pass_outcome], child[OUTCOME_MID]),
+                                      q_pass + child[OUTCOME_MID]))
+            result = [missing, missing, missing]
+            result[pass_outcome], result[OUTCOME_MID] = q_pass, q_mid
+            result[cut_outcome] = cut
+            node_bounds.append(tuple(result))
+        bounds[node] = node_bounds
+    return int(bounds[0][_mode(False, False)][OUTCOME_MID])
+
+
+def _leaf_value(outcome: int, alpha, beta):
+    if outcome == OUTCOME_LOW:
+        return alpha
+    if outcome == OUTCOME_HIGH:
+        return beta
+    if alpha == -float('inf') and beta == float('inf'):
+        return Fraction(0)
+    if alpha == -float('inf'):
+        return beta - 1
+    if beta == float('inf'):
+        return alpha + 1
+    return (alpha + beta) / 2
+
+
+def _closest(mask: int, target: int, at_least: bool) -> Optional[int]:
+    candidates = _bits(mask)
+    if not candidates:
+        return None
+    if at_least:
+        above = [c for c in candidates if c >= target]
+        return above[0] if above else candidates[-1]
+    return min(candidates, key=lambda c: (abs(c - target), c))
+
+
+def construct_leaf_values(tree: FlatTree, target_visited: Optional[int] = None,
+                          min_cutoffs: Optional[int] = None) -> FlatTree:
+    """
+    Returnează arborele cu aceeași formă și valori ale frunzelor alese astfel încât
+    Alpha-Beta să viziteze exact `target_visited` frunze (sau numărul realizabil cel mai apropiat),
+    respectiv să facă cel puțin `min_cutoffs` tăieri (cel mai mic număr realizabil >= min_cutoffs,
+    sau maximul posibil pentru această formă). Țintele peste CONSTRUCTIVE_MAX_TARGET sunt respinse
+    de rute; aici sunt reduse la această valoare și aduse între extremele realizabile.
+    """
+    if tree.arity[0] == 0:
+        return tree
+
+    metric = COUNT_LEAVES if target_visited is not None else COUNT_CUTOFFS
+    # Peste maximul realizabil, cel mai apropiat număr este chiar maximul (și simetric pentru minim)
+    highest = _count_bound(tree, metric, maximum=True)
+    if metric == COUNT_LEAVES:
+        goal = min(max(min(target_visited, CONSTRUCTIVE_MAX_TARGET), _count_bound(tree, metric)), highest)
+    else:
+        goal = min(min_cutoffs, CONSTRUCTIVE_MAX_TARGET, highest)
+    # Un număr realizabil sub 2 * goal + 2 este mereu cel puțin la fel de bun ca unul peste.
+    # Minimul și maximul sunt realizabile, deci pentru frunze (goal >= minim) prima limită ajunge;
+    # pentru tăieri limita crește doar dacă între goal și ea nu există niciun număr realizabil
+    # (doar un minim realizabil peste CONSTRUCTIVE_MAX_WIDTH, pe arbori uriași, lărgește bitset-urile)
+    widest = min(highest + 1, max(CONSTRUCTIVE_MAX_WIDTH, goal + 1))
+    limit = min(2 * goal + 2, widest)
+    while True:
+        planner = CutoffPlanner(tree, metric, limit)
+        # Rădăcina are fereastra (-inf, +inf), deci rezultatul ei este mereu MID
+        root_set = planner.sets[0][_mode(False, False)][OUTCOME_MID]
+        exact = root_set & ((1 << limit) - 1)
+        if metric == COUNT_LEAVES:
+            target = _closest(exact, goal, at_least=False)
+        else:
+            target = _closest(exact, goal, at_least=True)
+        saturated = root_set >> limit & 1
+        if target is not None and (limit == widest or not (saturated and metric == COUNT_CUTOFFS and target < goal)):
+            break
+        limit = min(2 * limit, widest)
+
+    arity, offsets, types = tree.arity, tree.offsets, tree.types
+    assigned: Dict[int, Fraction] = {}
+
+    # Adâncimea este mică (cel mult 12 niveluri), deci recursivitatea este sigură
+    def realize(node: int, alpha, beta, outcome: int, count: int):
+        if arity[node] == 0:
+            value = _leaf_value(outcome, alpha, beta)
+            assigned[node] = value
+            return value
+
+        mode = _mode(alpha != -float('inf'), beta != float('inf'))
+        plan = planner.decompose(node, mode, outcome, count)
+        first = offsets[node]
+        if types[node] == NODE_MAX:
+            best = -float('inf')
+            for i, (child_outcome, child_count) in enumerate(plan):
+                best = max(best, realize(first + i, alpha, beta, child_outcome, child_count))
+                alpha = max(alpha, best)
+            return best
+
+        best = float('inf')
+        for i, (child_outcome, child_count) in enumerate(plan):
+            best = min(best, realize(first + i, alpha, beta, child_outcome, child_count))
+            beta = min(beta, best)
+        return best
+
+    realize(0, -float('inf'), float('inf'), OUTCOME_MID, target)
+
+    # Compresie după rang: ordinea și egalitățile (deci toate comparațiile Alpha-Beta) se păstrează
+    distinct = sorted(set(assigned.values()))
+    if len(distinct) == 1:
+        ranks = {distinct[0]: (LEAF_VALUE_MIN + LEAF_VALUE_MAX) // 2}
+    elif len(distinct) <= LEAF_VALUE_MAX - LEAF_VALUE_MIN + 1:
+        spread = (LEAF_VALUE_MAX - LEAF_VALUE_MIN) / (len(distinct) - 1)
+        ranks = {value: LEAF_VALUE_MIN + round(rank * spread) for rank, value in enumerate(distinct)}
+    else:
+        ranks = {value: LEAF_VALUE_MIN + rank for rank, value in enumerate(distinct)}
+
+    values = array("i", tree.values)
+    for node, value in assigned.items():
+        values[node] = ranks[value]
+    return FlatTree(tree.arity, values, tree.types, tree.level_starts)
@@ -1,12 +1,22 @@
 from typing import Dict, Any
 from app.schemas.minmax_schemas import MinMaxAnswerRequest, EvaluationResponse
 
+# Toleranța pentru valorile fracționare (doar arborii expectiminimax, rotunjite la două zecimale);
+# valorile arborilor fără noduri CHANCE sunt întregi și se compară exact
+MINMAX_VALUE_TOLERANCE = 0.01
 
-def evaluate_minmax(user_answer: MinMaxAnswerRequest, correct_value: int, correct_nodes: int) -> EvaluationResponse:
+
+def evaluate_minmax(user_answer: MinMaxAnswerRequest, correct_value: float, correct_nodes: int,
+                    chance_nodes: bool = False) -> EvaluationResponse:
     percentage = 0
     explanation = ""
 
-    if user_answer.root_value == correct_value:
+    if chance_nodes:
+        value_is_correct = abs(user_answer.root_value - correct_value) < MINMAX_VALUE_TOLERANCE
+    else:
+        value_is_correct = user_answer.root_value == correct_value
+
+    if value_is_correct:
         percentage += 50
         explanation += "Valoarea rădăcinii este corectă. "
     else:
@@ -0,0 +1,159 @@
+"""
+Expectiminimax cu tăieri *-minimax (Star1 / Star2, Ballard 1983).
+
+Nodurile de șansă (NODE_CHANCE) au copii echiprobabili, iar valoarea lor este media
+valorilor copiilor. Expectimax simplu nu poate tăia nimic, dar dacă valorile frunzelor
+sunt mărginite în [L, U], după ce am văzut o parte din copii valoarea nodului de șansă
+este cuprinsă între două margini:
+  Star1 - fiecare copil este căutat cu o fereastră derivată din (alpha, beta) și din
+          marginile L/U ale copiilor rămași; o valoare în afara ferestrei oprește căutarea.
+  Star2 - înainte de Star1, fiecare copil (nod MAX/MIN) este "sondat" doar prin primul său
+          copil, ceea ce dă o margine inferioară (MAX) sau superioară (MIN) a valorii lui;
+          dacă marginile combinate depășesc deja fereastra, nodul de șansă este tăiat.
+
+Calculele folosesc fracții exacte, deci tăierile (și numărul de frunze vizitate) nu depind
+de erori de rotunjire. O frunză citită de mai multe ori (sondare + căutare) se numără o dată.
+"""
+from fractions import Fraction
+from typing import Optional
+
+from app.logic.minmax.solver import AlphaBetaStats
+from app.logic.minmax.tree import FlatTree, NODE_MAX, NODE_MIN, NODE_CHANCE
+
+# Numărul de zecimale cu care se afișează (și se notează) valoarea rădăcinii
+EXPECTIMAX_VALUE_DECIMALS = 2
+
+
+def star_minimax(tree: FlatTree, stats: Optional[AlphaBetaStats] = None, star2: bool = True,
+                 alpha: float = -float('inf'), beta: float = float('inf')) -> Fraction:
+    """
+    Valoarea exactă (Fraction) a arborelui expectiminimax, cu tăieri Star1 și opțional Star2.
+    Contoarele se scriu în `stats`, la fel ca pentru `_alpha_beta`.
+    """
+    if stats is None:
+        stats = AlphaBetaStats()
+
+    arity, offsets, values, types = tree.arity, tree.offsets, tree.values, tree.types
+    leaf_values = tree.leaf_values()
+    # Marginile valorilor frunzelor (necesare tăierilor la nodurile de șansă)
+    low, high = Fraction(min(leaf_values)), Fraction(max(leaf_values))
+    seen = bytearray(len(arity))
+    cutoffs = stats.cutoffs_per_depth
+
+    def record_cutoff(node: int, depth: int, explored: int):
+        if explored < arity[node]:
+            while len(cutoffs) <= depth:
+                cutoffs.append(0)
+            cutoffs[depth] += 1
+
+    def search(node: int, depth: int, alpha, beta) -> Fraction:
+        if arity[node] == 0:
+            if not seen[node]:
+                seen[node] = 1
+                stats.leaves_visited += 1
+            stats.max_depth_reached = max(stats.max_depth_reached, depth)
+            return Fraction(values[node])
+
+        if types[node] == NODE_CHANCE:
+            return chance(node, depth, alpha, beta)
+
+        first = offsets[node]
+        explored = 0
+        if types[node] == NODE_MAX:
+            value = -float('inf')
+            for child in range(first, first + arity[node]):
+                explored += 1
+                value = max(value, search(child, depth + 1, alpha, beta))
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    record_cutoff(node, depth, explored)
+                    break
+            return value
+
+        value = float('inf')
+        for child in range(first, first + arity[node]):
+            explored += 1
+            value = min(value, search(child, depth + 1, alpha, beta))
+            beta = min(beta, value)
+            if alpha >= beta:
+                record_cutoff(node, depth, explored)
+                break
+        return value
+
+    def chance(node: int, depth: int, alpha, beta) -> Fraction:
+        n = arity[node]
+        first = offsets[node]
+
+        # --- Star2: sondăm fiecare copil prin primul lui copil ---
+        probe_type = types[first]
+        if star2 and arity[first] > 0 and probe_type != NODE_CHANCE:
+            bound_sum = Fraction(0)
+            for i in range(n):
+                rest = n - i - 1
+                grandchild = offsets[first + i]
+                if probe_type == NODE_MAX:
+                    # Primul copil al unui nod MAX este o margine inferioară a valorii lui
+                    hi = n * beta - bound_sum - rest * low
+                    if hi <= low:
+                        record_cutoff(node, depth, i)
+                        return (bound_sum + (rest + 1) * low) / n
+                    w = search(grandchild, depth + 2, low, min(hi, high))
+                    if w >= hi:
+                        record_cutoff(node, depth, i + 1)
+                        return (bound_sum + w + rest * low) / n
+                else:
+                    # Primul copil al unui nod MIN este o margine superioară a valorii lui
+                    lo = n * alpha - bound_sum - rest * high
+                    if lo >= high:
+                        record_cutoff(node, depth, i)
+                        return (bound_sum + (rest + 1) * high) / n
+                    w = search(grandchild, depth + 2, max(lo, low), high)
+                    if w <= lo:
+                        record_cutoff(node, depth, i + 1)
+                        return (bound_sum + w + rest * high) / n
+                bound_sum += w
+
+        # --- Star1: căutăm copiii pe rând, cu ferestre derivate din marginile L/U ---
+        total = Fraction(0)
+        for i in range(n):
+            rest = n - i - 1
+            a = n * alpha - total - rest * high
+            b = n * beta - total - rest * low
+            if a >= high:
+                record_cutoff(node, depth, i)
+                return (total + (rest + 1) * high) / n
+            if b <= low:
+                record_cutoff(node, depth, i)
+                return (total + (rest + 1) * low) / n
+
+            value = search(first + i, depth + 1, max(a, low), min(b, high))
+            if value <= a:
+                record_cutoff(node, depth, i + 1)
+                return (total + value + rest * high) / n
+            if value >= b:
+                record_cutoff(node, depth, i + 1)
+                return (total + value + rest * low) / n
+            total += value
+        return total / n
+
+    # Adâncimea arborilor este limitată (cel mult 12 niveluri), deci recursivitatea este mică
+    return search(0, 0, alpha, beta)
+
+
+def expectimax_value(tree: FlatTree) -> Fraction:
+    """Expectiminimax fără tăieri (referință): media la nodurile de șansă, max/min în rest."""
+    arity, offsets, values, types = tree.arity, tree.offsets, tree.values, tree.types
+    node_values = [Fraction(0)] * len(arity)
+    # Copiii au mereu indici mai mari decât părintele => parcurgere inversă
+    for node in range(len(arity) - 1, -1, -1):
+        if arity[node] == 0:
+            node_values[node] = Fraction(values[node])
+            continue
+        children = node_values[offsets[node]:offsets[node] + arity[node]]
+        if types[node] == NODE_MAX:
+            node_values[node] = max(children)
+        elif types[node] == NODE_MIN:
+            node_values[node] = min(children)
+        else:
+            node_values[node] = sum(children) / len(children)
+    return node_values[0]
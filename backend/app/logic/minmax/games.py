@@ -0,0 +1,300 @@
+"""
+Probleme MinMax construite pe jocuri reale mici (Tic-Tac-Toe și Nim).
+
+Graful jocului este un DAG cu multe transpoziții (aceeași poziție se obține prin
+ordini diferite ale mutărilor), deci soluția folosește o tabelă de transpoziții
+indexată prin hashing Zobrist și adâncire iterativă (iterative deepening).
+
+Problema afișată este o "vedere" a jocului din poziția generată: primele
+`view_depth` mutări sunt desfășurate ca arbore MinMax, iar fiecare frunză primește
+valoarea exactă (teoretică) a poziției, calculată cu solverul cu tabelă de transpoziții.
+"""
+import random
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from app.logic.minmax.tree import FlatTree, NODE_MAX, NODE_MIN
+
+GAME_TICTACTOE = "tictactoe"
+GAME_NIM = "nim"
+
+# Adâncimea maximă a vederii (numărul de mutări desfășurate în arborele afișat)
+MINMAX_GAME_MAX_VIEW_DEPTH = 4
+
+# Scoruri din perspectiva jucătorului la mutare
+TTT_WIN_SCORE = 10  # + numărul de căsuțe libere (câștigul rapid valorează mai mult)
+NIM_WIN_SCORE = 10
+
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+# Adâncimea memorată pentru subarborii rezolvați complet (fără orizont)
+TT_SOLVED_DEPTH = 1 << 30
+
+TTT_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+
+class ZobristTable:
+    """Chei aleatoare pe 64 de biți pentru fiecare (poziție, piesă) și pentru jucătorul la mutare."""
+
+    def __init__(self, squares: int, pieces: int, seed: int):
+        rng = random.Random(seed)
+        self.keys = [[rng.getrandbits(64) for _ in range(pieces)] for _ in range(squares)]
+        self.side_key = rng.getrandbits(64)
+
+    def hash_of(self, cells: Tuple[int, ...], to_move: int) -> int:
+        h = 0
+        for square, piece in enumerate(cells):
+            h ^= self.keys[square][piece]
+        if to_move == 2:
+            h ^= self.side_key
+        return h
+
+
+class TicTacToe:
+    """Stare: (tabla ca tuplu de 9 valori 0/1/2, jucătorul la mutare 1=X sau 2=O). X este MAX."""
+    name = GAME_TICTACTOE
+
+    def __init__(self):
+        self.zobrist = ZobristTable(9, 3, seed=0x7177AC)
+
+    def hash(self, state) -> int:
+        return self.zobrist.hash_of(state[0], state[1])
+
+    def moves(self, state) -> List[int]:
+        return [i for i, cell in enumerate(state[0]) if cell == 0]
+
+    def play(self, state, h: int, move: int):
+        cells, to_move = state
+        new_cells = cells[:move] + (to_move,) + cells[move + 1:]
+        # Actualizare incrementală a hash-ului: scoatem căsuța goală, punem piesa, schimbăm jucătorul
+        keys = self.zobrist.keys[move]
+        new_h = h ^ keys[0] ^ keys[to_move] ^ self.zobrist.side_key
+        return (new_cells, 3 - to_move), new_h
+
+    def terminal_score(self, state) -> Optional[int]:
+        """Scorul pentru jucătorul la mutare dacă jocul s-a terminat, altfel None."""
+        cells, to_move = state
+        for a, b, c in TTT_LINES:
+            if cells[a] != 0 and cells[a] == cells[b] == cells[c]:
+                # Linia completă aparține adversarului (ultimul care a mutat)
+                return -(TTT_WIN_SCORE + cells.count(0))
+        if 0 not in cells:
+            return 0
+        return None
+
+    def random_position(self, rng: random.Random, maximizing: bool):
+        """Poziție ne-terminală în care X (MAX) sau O (MIN) este la mutare."""
+        while True:
+            played = rng.choice([2, 4] if maximizing else [1, 3, 5])
+            state = (tuple([0] * 9), 1)
+            h = self.hash(state)
+            for _ in range(played):
+                state, h = self.play(state, h, rng.choice(self.moves(state)))
+                if self.terminal_score(state) is not None:
+                    break
+            else:
+                return state
+
+    def describe(self, state) -> str:
+        symbols = {0: "_", 1: "X", 2: "O"}
+        rows = [" ".join(symbols[c] for c in state[0][r * 3:r * 3 + 3]) for r in range(3)]
+        player = "X (MAX)" if state[1] == 1 else "O (MIN)"
+        return f"Tic-Tac-Toe, la mutare este {player}. Tabla: " + " / ".join(rows) + "."
+
+
+class Nim:
+    """Stare: (dimensiunile grămezilor, jucătorul la mutare 1=MAX sau 2=MIN). Ultimul care ia câștigă."""
+    name = GAME_NIM
+    HEAPS = 3
+    MAX_HEAP = 5
+
+    def __init__(self):
+        self.zobrist = ZobristTable(self.HEAPS, self.MAX_HEAP + 1, seed=0x91A)
+
+    def hash(self, state) -> int:
+        return self.zobrist.hash_of(state[0], state[1])
+
+    def moves(self, state) -> List[Tuple[int, int]]:
+        return [(heap, take) for heap, size in enumerate(state[0]) for take in range(1, size + 1)]
+
+    def play(self, state, h: int, move: Tuple[int, int]):
+        heaps, to_move = state
+        heap, take = move
+        old = heaps[heap]
+        new_heaps = heaps[:heap] + (old - take,) + heaps[heap + 1:]
+        keys = self.zobrist.keys[heap]
+        new_h = h ^ keys[old] ^ keys[old - take] ^ self.zobrist.side_key
+        return (new_heaps, 3 - to_move), new_h
+
+    def terminal_score(self, state) -> Optional[int]:
+        if any(state[0]):
+            return None
+        # Adversarul a luat ultimul obiect => jucătorul la mutare a pierdut
+        return -NIM_WIN_SCORE
+
+    def random_position(self, rng: random.Random, maximizing: bool):
+        heaps = tuple(rng.randint(1, 3) for _ in range(self.HEAPS))
+        return heaps, 1 if maximizing else 2
+
+    def describe(self, state) -> str:
+        player = "MAX" if state[1] == 1 else "MIN"
+        return (f"Nim cu grămezile {list(state[0])}; la mutare este {player}. "
+                f"La fiecare mutare se iau unul sau mai multe obiecte dintr-o singură grămadă, "
+                f"iar jucătorul care ia ultimul obiect câștigă.")
+
+
+GAMES = {
+    GAME_TICTACTOE: TicTacToe(),
+    GAME_NIM: Nim(),
+}
+
+
+class TranspositionTable:
+    """Tabelă de transpoziții: hash Zobrist -> (adâncime, tip margine, valoare, cea mai bună mutare)."""
+
+    def __init__(self):
+        self.entries: Dict[int, Tuple[int, int, int, object]] = {}
+        self.hits = 0
+        self.stores = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def probe(self, h: int):
+        entry = self.entries.get(h)
+        if entry is not None:
+            self.hits += 1
+        return entry
+
+    def store(self, h: int, depth: int, flag: int, value: int, best_move) -> None:
+        self.stores += 1
+        self.entries[h] = (depth, flag, value, best_move)
+
+
+class GameSolver:
+    """Negamax cu Alpha-Beta, tabelă de transpoziții și adâncire iterativă."""
+
+    def __init__(self, game, tt: Optional[TranspositionTable] = None):
+        self.game = game
+        self.tt = tt if tt is not None else TranspositionTable()
+        self.nodes = 0
+
+    def _negamax(self, state, h: int, depth: int, alpha: int, beta: int) -> Tuple[int, bool]:
+        """Returnează (valoarea pentru jucătorul la mutare, subarbore rezolvat complet?)."""
+        self.nodes += 1
+        terminal = self.game.terminal_score(state)
+        if terminal is not None:
+            return terminal, True
+        if depth == 0:
+            # Orizontul adâncirii iterative: evaluare neutră, rezultat incomplet
+            return 0, False
+
+        alpha_orig = alpha
+        best_move = None
+        entry = self.tt.probe(h)
+        if entry is not None:
+            entry_depth, flag, value, best_move = entry
+            if entry_depth >= depth:
+                if flag == TT_EXACT:
+                    return value, entry_depth == TT_SOLVED_DEPTH
+                if flag == TT_LOWER:
+                    alpha = max(alpha, value)
+                elif flag == TT_UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, entry_depth == TT_SOLVED_DEPTH
+
+        moves = self.game.moves(state)
+        if best_move in moves:
+            # Ordonarea mutărilor: întâi cea mai bună mutare din iterația anterioară
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+
+        best_value = -float('inf')
+        solved = True
+        for move in moves:
+            child, child_h = self.game.play(state, h, move)
+            value, child_solved = self._negamax(child, child_h, depth - 1, -beta, -alpha)
+            value = -value
+            solved = solved and child_solved
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = TT_UPPER
+        elif best_value >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self.tt.store(h, TT_SOLVED_DEPTH if solved else depth, flag, best_value, best_move)
+        return best_value, solved
+
+    def solve(self, state, h: Optional[int] = None, max_depth: int = 64) -> int:
+        """Valoarea exactă pentru jucătorul la mutare, prin adâncire iterativă până la rezolvare."""
+        if h is None:
+            h = self.game.hash(state)
+        value = 0
+        for depth in range(1, max_depth + 1):
+            value, solved = self._negamax(state, h, depth, -float('inf'), float('inf'))
+            if solved:
+                break
+        return value
+
+
+def build_game_view(game, state, view_depth: int, solver: Optional[GameSolver] = None) -> FlatTree:
+    """
+    Desfășoară primele `view_depth` mutări din `state` ca FlatTree (ordine BFS).
+    Frunzele (poziții terminale sau de la orizontul vederii) au valoarea exactă
+    din perspectiva jucătorului 1 (MAX).
+    """
+    if solver is None:
+        solver = GameSolver(game)
+
+    arity = array("i")
+    values = array("i")
+    types = array("b")
+    level_starts = []
+
+    queue = deque([(state, game.hash(state), 0)])
+    current_level = -1
+    while queue:
+        node_state, h, depth = queue.popleft()
+        if depth != current_level:
+            level_starts.append(len(arity))
+            current_level = depth
+
+        is_max = node_state[1] == 1
+        types.append(NODE_MAX if is_max else NODE_MIN)
+        terminal = game.terminal_score(node_state)
+        if terminal is not None or depth == view_depth:
+            score = terminal if terminal is not None else solver.solve(node_state, h)
+            arity.append(0)
+            values.append(score if is_max else -score)
+            continue
+
+        moves = game.moves(node_state)
+        arity.append(len(moves))
+        values.append(0)
+        for move in moves:
+            child, child_h = game.play(node_state, h, move)
+            queue.append((child, child_h, depth + 1))
+
+    return FlatTree(arity, values, types, level_starts)
+
+
+def generate_game_problem(game_name: str, rng: random.Random, view_depth: int,
+                          maximizing: bool) -> Tuple[FlatTree, str]:
+    """Generează poziția din RNG și returnează vederea ca arbore MinMax, plus descrierea poziției."""
+    game = GAMES[game_name]
+    state = game.random_position(rng, maximizing)
+    view_depth = max(1, min(MINMAX_GAME_MAX_VIEW_DEPTH, view_depth))
+    return build_game_view(game, state, view_depth), game.describe(state)
@@ -0,0 +1,171 @@
+"""
+Livrarea amânată a imaginilor MinMax.
+
+Imaginea unui arbore este complet determinată de (sursă, seed, adâncime, tip rădăcină, format),
+deci o randăm o singură dată, în fundal, și o păstrăm într-un cache LRU limitat
+ca dimensiune totală (în octeți).
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from app.logic.minmax.annotations import annotate_alpha_beta
+from app.logic.minmax.lod import MINMAX_LOD_AUTO_DEPTH, MINMAX_LOD_DEFAULT_DEPTH, build_lod_tree, build_plain_tree
+from app.logic.minmax.solver import MINMAX_SOURCE_RANDOM, fixed_tree_params, solve_minmax
+from app.logic.minmax.tree import FlatTree, NODE_CHANCE
+from app.logic.minmax.visualizer import render_tree_image
+
+# Limitele cache-ului și ale pool-ului de randare
+MINMAX_IMAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+MINMAX_RENDER_WORKERS = 2
+# Randări în lucru sau în coadă; pre-randările opționale folosesc doar jumătate din coadă,
+# ca să rămână loc pentru imaginile cerute explicit
+MINMAX_RENDER_MAX_PENDING = 64
+# Câte secunde să aștepte clientul când coada este plină (antetul Retry-After al răspunsului 503)
+MINMAX_RENDER_RETRY_AFTER = 1
+
+# Imaginile sunt deterministe pentru un URL dat => pot fi păstrate oricât de către client
+MINMAX_IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedImage:
+    def __init__(self, content: bytes, media_type: str):
+        self.content = content
+        self.media_type = media_type
+        self.etag = '"' + hashlib.sha1(content).hexdigest() + '"'
+
+
+class ImageCache:
+    """Cache LRU thread-safe, limitat de suma dimensiunilor imaginilor stocate."""
+
+    def __init__(self, max_bytes: int = MINMAX_IMAGE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> Optional[CachedImage]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def put(self, key: str, item: CachedImage) -> None:
+        size = len(item.content)
+        if size > self.max_bytes:
+            # O imagine mai mare decât tot cache-ul nu este păstrată
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous.content)
+            self._items[key] = item
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.total_bytes -= len(evicted.content)
+
+
+class ImageRenderPool:
+    """
+    Pool limitat de fire de execuție pentru randare, cu o coadă limitată la `max_pending` randări.
+    Cererile pentru aceeași cheie aflate în lucru sunt comasate (un singur render).
+    """
+
+    def __init__(self, cache: ImageCache, workers: int = MINMAX_RENDER_WORKERS,
+                 max_pending: int = MINMAX_RENDER_MAX_PENDING):
+        self.cache = cache
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="minmax-render")
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _run(self, key: str, render: Callable[[], Tuple[bytes, str]]) -> CachedImage:
+        try:
+            content, media_type = render()
+            item = CachedImage(content, media_type)
+            self.cache.put(key, item)
+            return item
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def submit(self, key: str, render: Callable[[], Tuple[bytes, str]], optional: bool = False) -> Optional[Future]:
+        """
+        Programează randarea (dacă imaginea nu e deja în cache sau în lucru).
+        Întoarce None când coada este plină: `max_pending` randări pentru cererile obligatorii,
+        jumătate pentru cele cu optional=True (pre-randare la generare).
+        """
+        cached = self.cache.get(key)
+        if cached is not None:
+            future: Future = Future()
+            future.set_result(cached)
+            return future
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future
+            cached = self.cache.get(key)
+            if cached is not None:
+                # Randarea s-a terminat între timp
+                future = Future()
+                future.set_result(cached)
+                return future
+            limit = self.max_pending // 2 if optional else self.max_pending
+            if len(self._in_flight) >= limit:
+                return None
+            future = self._executor.submit(self._run, key, render)
+            self._in_flight[key] = future
+            return future
+
+
+def minmax_image_key(seed: int, depth: int, root_type: str, image_format: str,
+                     source: str = MINMAX_SOURCE_RANDOM, chance_nodes: bool = False,
+                     target_visited: Optional[int] = None, min_cutoffs: Optional[int] = None,
+                     lod_depth: Optional[int] = None, expand: Optional[str] = None) -> str:
+    kind = f"{source}+chance" if chance_nodes else source
+    if target_visited is not None:
+        kind += f"+visited{target_visited}"
+    if min_cutoffs is not None:
+        kind += f"+cutoffs{min_cutoffs}"
+    if lod_depth is not None:
+        kind += f"+lod{lod_depth}"
+    if expand is not None:
+        kind += f"+expand{expand}"
+    return f"{kind}-{seed}-{depth}-{root_type}.{image_format}"
+
+
+def render_minmax_image(seed: int, depth: int, root_type: str, image_format: str,
+                        tree: Optional[FlatTree] = None, source: str = MINMAX_SOURCE_RANDOM,
+                        chance_nodes: bool = False, target_visited: Optional[int] = None,
+                        min_cutoffs: Optional[int] = None, lod_depth: Optional[int] = None,
+                        expand: Optional[str] = None) -> Tuple[bytes, str]:
+    """
+    Randează imaginea, regenerând arborele din seed dacă nu este primit deja.
+    Arborii adânci (sau cererile cu `lod_depth` / `expand`) sunt randați rezumat (LOD);
+    ceilalți, complet. Ambele variante pleacă direct de la `FlatTree`, fără modelele imbricate
+    ale răspunsului JSON (și deci indiferent de formatul cerut de client).
+    """
+    if tree is None:
+        params = fixed_tree_params(depth, root_type, source, chance_nodes,
+                                   target_visited=target_visited, min_cutoffs=min_cutoffs)
+        tree = solve_minmax(seed, params).tree
+
+    if lod_depth is None and expand is None and tree.depth < MINMAX_LOD_AUTO_DEPTH:
+        return render_tree_image(build_plain_tree(tree), image_format=image_format)
+
+    # Tăierile Alpha-Beta au sens doar fără noduri de șansă
+    annotations = None if NODE_CHANCE in tree.types else annotate_alpha_beta(tree)
+    tree_dict = build_lod_tree(tree, lod_depth or MINMAX_LOD_DEFAULT_DEPTH, expand, annotations)
+    return render_tree_image(tree_dict, image_format=image_format)
+
+
+minmax_image_cache = ImageCache()
+minmax_render_pool = ImageRenderPool(minmax_image_cache)
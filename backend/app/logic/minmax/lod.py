@@ -0,0 +1,164 @@
+"""
+Randare cu nivel de detaliu (LOD) pentru arborii MinMax mari.
+
+În loc de toți cei câteva mii de noduri, imaginea conține:
+  - nodurile până la adâncimea `lod_depth`, la detaliu complet;
+  - câte un nod agregat pentru fiecare subarbore mai adânc (tipul, valoarea întoarsă de
+    Alpha-Beta, numărul de frunze și intervalul valorilor lor);
+  - câte un nod agregat pentru fiecare grup consecutiv de frați tăiați de Alpha-Beta;
+  - opțional, drumul până la un nod ales (`expand`, ex. "R213") și subarborele lui,
+    pe încă `lod_depth` niveluri sub el.
+Rezultatul este un dicționar de același tip ca `build_schema_tree(...).model_dump()`, deci
+este randat de aceleași funcții SVG / Graphviz, iar layout-ul costă doar cât nodurile afișate.
+Statisticile subarborilor se calculează vectorizat, câte un nivel odată.
+"""
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.logic.minmax.tree import FlatTree, NODE_TYPE_NAMES
+
+# Arborii de la această adâncime în sus sunt randați implicit rezumat
+MINMAX_LOD_AUTO_DEPTH = 8
+# Numărul implicit de niveluri afișate complet (de la rădăcină sau de la nodul extins)
+MINMAX_LOD_DEFAULT_DEPTH = 4
+
+
+def _subtree_stats(tree: FlatTree):
+    """Numărul de frunze și minimul / maximul valorilor frunzelor din subarborele fiecărui nod."""
+    arity = np.frombuffer(tree.arity, dtype=np.int32)
+    values = np.frombuffer(tree.values, dtype=np.int32)
+    leaves = (arity == 0).astype(np.int64)
+    low = values.astype(np.int64)
+    high = low.copy()
+
+    bounds = tree.level_starts + [len(tree)]
+    # Copiii nodurilor de pe nivelul d ocupă, în ordine, intervale contigue pe nivelul d + 1
+    for depth in range(len(bounds) - 3, -1, -1):
+        level = slice(bounds[depth], bounds[depth + 1])
+        below = slice(bounds[depth + 1], bounds[depth + 2])
+        level_arity = arity[level]
+        internal = np.flatnonzero(level_arity)
+        if len(internal) == 0:
+            continue
+        starts = np.concatenate(([0], np.cumsum(level_arity[internal])[:-1]))
+        nodes = internal + bounds[depth]
+        leaves[nodes] = np.add.reduceat(leaves[below], starts)
+        low[nodes] = np.minimum.reduceat(low[below], starts)
+        high[nodes] = np.maximum.reduceat(high[below], starts)
+    return leaves, low, high
+
+
+def resolve_expand_path(tree: FlatTree, name: str) -> List[int]:
+    """Indicii nodurilor de pe drumul rădăcină -> `name` (R, R1, R12, ...)."""
+    if not name.startswith("R") or (len(name) > 1 and not name[1:].isdigit()):
+        raise ValueError(f"Nume de nod invalid: {name}")
+    path = [0]
+    for digit in name[1:]:
+        node = path[-1]
+        k = int(digit) - 1
+        if not 0 <= k < tree.arity[node]:
+            raise ValueError(f"Nodul {name} nu există în arbore.")
+        path.append(tree.offsets[node] + k)
+    return path
+
+
+def build_plain_tree(tree: FlatTree) -> Dict[str, Any]:
+    """
+    Dicționarul complet al arborelui (aceleași chei ca `build_schema_tree(...).model_dump()`),
+    construit direct din tablourile compacte, fără modele Pydantic: varianta fără rezumare
+    folosită la randarea imaginilor.
+    """
+    arity, offsets, values, types = tree.arity, tree.offsets, tree.values, tree.types
+    nodes = [None] * len(tree)
+    nodes[0] = {"name": "R", "node_type": NODE_TYPE_NAMES[types[0]],
+                "value": values[0] if arity[0] == 0 else None, "children": []}
+    # În ordine BFS părintele este creat înaintea copiilor
+    for node in range(len(tree)):
+        parent = nodes[node]
+        first = offsets[node]
+        for k in range(arity[node]):
+            child = first + k
+            child_dict = {"name": f"{parent['name']}{k + 1}", "node_type": NODE_TYPE_NAMES[types[child]],
+                          "value": values[child] if arity[child] == 0 else None, "children": []}
+            nodes[child] = child_dict
+            parent["children"].append(child_dict)
+    return nodes[0]
+
+
+def build_lod_tree(tree: FlatTree, lod_depth: int = MINMAX_LOD_DEFAULT_DEPTH, expand: Optional[str] = None,
+                   annotations=None) -> Dict[str, Any]:
+    """
+    Dicționarul rezumat al arborelui (vezi docstring-ul modulului).
+    Cu `annotations` (AlphaBetaAnnotations), frații tăiați sunt comasați și nodurile agregate
+    își afișează valoarea întoarsă; fără ele (ex. arbori cu noduri CHANCE) se rezumă doar adâncimea.
+    """
+    leaves, low, high = _subtree_stats(tree)
+    arity, offsets, values, types = tree.arity, tree.offsets, tree.values, tree.types
+    path = resolve_expand_path(tree, expand) if expand else [0]
+    on_path = set(path)
+    expanded, expanded_depth = path[-1], len(path) - 1
+    pruned = annotations.pruned if annotations is not None else None
+
+    def aggregate(first: int, last: int, name: str, is_pruned: bool) -> Dict[str, Any]:
+        span = slice(first, last + 1)
+        node_value = None
+        if annotations is not None and not is_pruned:
+            node_value = int(annotations.values[first])
+        return {
+            "name": name,
+            "node_type": NODE_TYPE_NAMES[types[first]],
+            "value": None,
+            "children": [],
+            "aggregate": {
+                "nodes": last - first + 1,
+                "leaves": int(leaves[span].sum()),
+                "min": int(low[span].min()),
+                "max": int(high[span].max()),
+                "value": node_value,
+                "pruned": is_pruned,
+            },
+        }
+
+    def plain(node: int, name: str) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "node_type": NODE_TYPE_NAMES[types[node]],
+            "value": values[node] if arity[node] == 0 else None,
+            "children": [],
+        }
+
+    root = plain(0, "R")
+    # Stivă: (nod, dicționar, adâncime, în subarborele extins)
+    stack = [(0, root, 0, expanded == 0)]
+    while stack:
+        node, node_dict, depth, inside = stack.pop()
+        if arity[node] == 0:
+            continue
+
+        children = node_dict["children"]
+        first = offsets[node]
+        limit = expanded_depth + lod_depth if inside else lod_depth
+        k = 0
+        while k < arity[node]:
+            child = first + k
+            name = f"{node_dict['name']}{k + 1}"
+            if pruned is not None and pruned[child] and child not in on_path:
+                # Grup de frați tăiați (un sufix, cu excepția unui eventual nod de pe drum)
+                last = child
+                while last + 1 < first + arity[node] and pruned[last + 1] and last + 1 not in on_path:
+                    last += 1
+                children.append(aggregate(child, last, name, True))
+                k += last - child + 1
+                continue
+
+            child_inside = inside or child == expanded
+            if arity[child] > 0 and depth + 1 >= limit and child not in on_path:
+                children.append(aggregate(child, child, name, False))
+            else:
+                child_dict = plain(child, name)
+                children.append(child_dict)
+                stack.append((child, child_dict, depth + 1, child_inside))
+            k += 1
+
+    return root
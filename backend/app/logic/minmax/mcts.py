@@ -0,0 +1,137 @@
+"""
+Monte Carlo Tree Search (UCT) pe arborii MinMax compacți (FlatTree).
+
+Spre deosebire de Alpha-Beta, MCTS nu parcurge arborele exhaustiv: pentru un buget
+fix de simulări (playouts) estimează valoarea fiecărui copil al rădăcinii.
+Cu cât bugetul este mai mare, cu atât estimările se apropie de valorile MinMax exacte,
+ceea ce permite probleme "aproximativ vs exact" și compararea bugetului de noduri
+cu numărul de frunze vizitate de Alpha-Beta.
+
+Recompensele sunt normalizate în [0, 1] din perspectiva lui MAX (pe baza valorilor
+minime/maxime ale frunzelor), iar la nodurile MIN selecția minimizează estimarea.
+"""
+import math
+import random
+from array import array
+from typing import List, Optional
+
+from app.logic.minmax.tree import FlatTree, NODE_MAX
+
+# Bugetul implicit de simulări și constanta de explorare UCT (sqrt(2) pentru recompense în [0, 1])
+MCTS_DEFAULT_PLAYOUTS = 1000
+MCTS_MAX_PLAYOUTS = 100_000
+MCTS_EXPLORATION = math.sqrt(2)
+
+
+class MCTSChildStats:
+    """Statisticile unui copil al rădăcinii după căutare."""
+
+    def __init__(self, name: str, visits: int, value_estimate: Optional[float]):
+        self.name = name
+        self.visits = visits
+        self.value_estimate = value_estimate  # media valorilor frunzelor atinse (None dacă nevizitat)
+
+
+class MCTSResult:
+    def __init__(self, children: List[MCTSChildStats], best_child: Optional[str], root_value_estimate: float,
+                 playouts: int, leaves_evaluated: int, nodes_expanded: int):
+        self.children = children
+        self.best_child = best_child  # copilul cel mai vizitat (alegerea robustă UCT)
+        self.root_value_estimate = root_value_estimate  # estimarea copilului ales
+        self.playouts = playouts
+        self.leaves_evaluated = leaves_evaluated  # frunze distincte atinse (comparabil cu `leaves_visited`)
+        self.nodes_expanded = nodes_expanded
+
+
+def mcts_search(tree: FlatTree, playouts: int = MCTS_DEFAULT_PLAYOUTS, rng: Optional[random.Random] = None,
+                exploration: float = MCTS_EXPLORATION) -> MCTSResult:
+    """
+    Rulează `playouts` iterații UCT: selecție, expandare, simulare aleatoare până la o frunză
+    și propagarea recompensei înapoi spre rădăcină.
+    """
+    if rng is None:
+        rng = random.Random(0)
+
+    arity, offsets, types, values = tree.arity, tree.offsets, tree.types, tree.values
+    n = len(arity)
+    visits = array("i", bytes(4 * n))
+    reward_sum = array("d", bytes(8 * n))
+    value_sum = array("d", bytes(8 * n))
+
+    leaf_values = tree.leaf_values()
+    low, high = min(leaf_values), max(leaf_values)
+    scale = (high - low) or 1
+
+    leaves_seen = set()
+    nodes_expanded = 0
+    path: List[int] = []
+
+    for _ in range(playouts):
+        # --- Selecție: coborâm cu UCT cât timp nodul este complet expandat ---
+        node = 0
+        path.clear()
+        path.append(node)
+        while arity[node]:
+            first = offsets[node]
+            children = range(first, first + arity[node])
+            unvisited = [child for child in children if visits[child] == 0]
+            if unvisited:
+                # --- Expandare: primul copil nevizitat ---
+                node = unvisited[0]
+                path.append(node)
+                nodes_expanded += 1
+                break
+
+            log_parent = math.log(visits[node])
+            maximizing = types[node] == NODE_MAX
+            best, best_score = first, -float('inf')
+            for child in children:
+                mean = reward_sum[child] / visits[child]
+                if not maximizing:
+                    mean = 1.0 - mean
+                score = mean + exploration * math.sqrt(log_parent / visits[child])
+                if score > best_score:
+                    best, best_score = child, score
+            node = best
+            path.append(node)
+
+        # --- Simulare: coborâre aleatoare până la o frunză ---
+        while arity[node]:
+            node = offsets[node] + rng.randrange(arity[node])
+        leaves_seen.add(node)
+        value = values[node]
+        reward = (value - low) / scale
+
+        # --- Propagare ---
+        for visited in path:
+            visits[visited] += 1
+            reward_sum[visited] += reward
+            value_sum[visited] += value
+
+    names = tree.node_names()
+    first = offsets[0]
+    children_stats = [
+        MCTSChildStats(
+            names[child],
+            visits[child],
+            value_sum[child] / visits[child] if visits[child] else None
+        )
+        for child in range(first, first + arity[0])
+    ]
+
+    # Estimarea rădăcinii este cea a copilului ales (cel mai vizitat), nu media tuturor simulărilor
+    best_child, root_estimate = None, float(values[0])
+    if children_stats:
+        best = max(children_stats, key=lambda stats: stats.visits)
+        best_child = best.name
+        if best.value_estimate is not None:
+            root_estimate = best.value_estimate
+
+    return MCTSResult(
+        children=children_stats,
+        best_child=best_child,
+        root_value_estimate=root_estimate,
+        playouts=playouts,
+        leaves_evaluated=len(leaves_seen),
+        nodes_expanded=nodes_expanded
+    )
@@ -0,0 +1,273 @@
+"""
+Alpha-Beta paralel pentru arbori MinMax mari (Young Brothers Wait, împărțire pe varianta principală).
+
+În fiecare nod de pe varianta principală (primul copil, recursiv, până la `split_depth`):
+  1. primul copil este căutat secvențial, cu fereastra nodului, și dă o margine;
+  2. frații lui sunt căutați în paralel, toți cu fereastra (alpha, beta) îngustată de primul copil.
+Sub `split_depth`, și pentru grupurile de frați a căror căutare estimată nu acoperă copierea
+lor în worker, căutarea este secvențială, direct în arborele complet (`_alpha_beta` pornit
+din nod, fără copiere).
+
+Contoarele raportate (frunze vizitate, tăieri, adâncime) sunt cele ale căutării SECVENȚIALE,
+folosite la notare, și provin din aceeași trecere: un frate căutat cu fereastra primului copil
+își întoarce valoarea fail-soft, iar fereastra secvențială a fratelui k este
+    alpha_k = max(alpha', valorile fraților 2..k-1)   (simetric pentru beta la MIN),
+adică se deduce exact din rezultatele paralele; la fel și fratele la care apare tăierea
+(primul cu valoarea >= beta). Frații a căror fereastră secvențială coincide cu cea primită
+(cazul obișnuit) nu se mai caută; doar cei cu fereastra îngustată de un frate anterior sunt
+căutați încă o dată, tot în paralel. Frații de după tăiere sunt munca speculativă a paralelizării.
+
+Frații trimiși unui worker sunt consecutivi, deci descendenții lor formează câte un interval
+contiguu pe fiecare nivel: un grup este copiat și serializat o singură dată, ca "pădure".
+"""
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.logic.minmax.solver import AlphaBetaStats, _alpha_beta
+from app.logic.minmax.tree import FlatTree, NODE_MAX
+
+# Un grup de frați este trimis executorului doar dacă munca estimată (frunzele primului copil
+# x numărul fraților) acoperă un drum dus-întors până la worker...
+MINMAX_PARALLEL_MIN_TASK_LEAVES = 2_000
+# ...și dacă pădurea copiată are cel mult atâtea noduri per frunză estimată: copierea și
+# serializarea costă ~35 ns / nod, căutarea ~0.5 µs / frunză. Pe arborii aleatori Alpha-Beta
+# vizitează ~1% din frunze, deci acolo căutarea rămâne pe loc (copierea ar costa mai mult).
+MINMAX_PARALLEL_MAX_NODES_PER_LEAF = 4
+
+
+class ParallelSearchResult:
+    def __init__(self, root_value: int, stats: AlphaBetaStats, split_depth: int, tasks: int, leaves_searched: int):
+        self.root_value = root_value
+        self.stats = stats  # contoarele căutării secvențiale (identice cu `_alpha_beta`)
+        self.split_depth = split_depth
+        self.tasks = tasks  # sarcini trimise executorului
+        self.leaves_searched = leaves_searched  # toată munca, inclusiv frații speculativi și recăutările
+
+    @property
+    def leaves_visited(self) -> int:
+        return self.stats.leaves_visited
+
+
+def _merge_stats(total: AlphaBetaStats, part: AlphaBetaStats, depth_offset: int) -> None:
+    """Adaugă contoarele unui subarbore aflat la adâncimea `depth_offset` în arborele complet."""
+    total.leaves_visited += part.leaves_visited
+    for depth, count in enumerate(part.cutoffs_per_depth):
+        while len(total.cutoffs_per_depth) <= depth + depth_offset:
+            total.cutoffs_per_depth.append(0)
+        total.cutoffs_per_depth[depth + depth_offset] += count
+    if part.max_depth_reached or part.leaves_visited:
+        total.max_depth_reached = max(total.max_depth_reached, part.max_depth_reached + depth_offset)
+
+
+def _forest_levels(tree: FlatTree, first: int, last: int) -> List[Tuple[int, int]]:
+    """Intervalele [lo, hi) ocupate pe fiecare nivel de descendenții nodurilor consecutive first..last."""
+    levels = []
+    lo, hi = first, last + 1
+    while lo < hi:
+        levels.append((lo, hi))
+        lo, hi = tree.offsets[lo], tree.offsets[hi - 1] + tree.arity[hi - 1]
+    return levels
+
+
+def _forest(tree: FlatTree, levels: List[Tuple[int, int]]) -> FlatTree:
+    """
+    Subarborii nodurilor consecutive first..last, sub o rădăcină artificială (nodul 0):
+    nodul first devine 1, first + 1 devine 2 etc. Se copiază câte o felie per nivel, iar
+    offset-urile sunt translatate vectorizat, fără bucla Python a constructorului.
+    """
+    offsets = np.frombuffer(tree.offsets, dtype=np.int32)
+    first, last = levels[0][0], levels[0][1] - 1
+    forest_arity = array("i", [last - first + 1])
+    forest_values = array("i", [0])
+    forest_types = array("b", [tree.types[first]])
+    forest_offsets = array("i", [1])
+    level_starts = [0]
+    for lo, hi in levels:
+        start = len(forest_arity)
+        level_starts.append(start)
+        forest_arity.extend(tree.arity[lo:hi])
+        forest_values.extend(tree.values[lo:hi])
+        forest_types.extend(tree.types[lo:hi])
+        # Copiii nivelului (de la offsets[lo] în arbore) încep, în pădure, imediat după el
+        shift = offsets[lo] - (start + hi - lo)
+        forest_offsets.frombytes((offsets[lo:hi] - shift).astype(np.int32).tobytes())
+
+    forest = FlatTree.__new__(FlatTree)
+    forest.__setstate__((forest_arity, forest_values, forest_types, forest_offsets, level_starts))
+    return forest
+
+
+def _search_forest(task: Tuple[FlatTree, List[Tuple[int, float, float]]]) -> List[Tuple[int, AlphaBetaStats]]:
+    """Sarcina unui worker: caută, pe rând, rădăcinile cerute din pădure, fiecare cu fereastra sa."""
+    forest, windows = task
+    results = []
+    for node, alpha, beta in windows:
+        stats = AlphaBetaStats()
+        results.append((_alpha_beta(forest, stats, alpha, beta, root=node), stats))
+    return results
+
+
+class _SiblingSearch:
+    """Căutarea YBWC a unui arbore, cu executorul și contoarele ei."""
+
+    def __init__(self, tree: FlatTree, executor: Executor, workers: int, split_depth: int,
+                 min_task_leaves: float, max_nodes_per_leaf: float):
+        self.tree = tree
+        self.executor = executor
+        self.workers = workers
+        self.split_depth = split_depth
+        self.min_task_leaves = min_task_leaves
+        self.max_nodes_per_leaf = max_nodes_per_leaf
+        self.stats = AlphaBetaStats()
+        self.tasks = 0
+        self.leaves_searched = 0
+
+    def _inline(self, node: int, alpha: float, beta: float) -> Tuple[int, AlphaBetaStats]:
+        stats = AlphaBetaStats()
+        return _alpha_beta(self.tree, stats, alpha, beta, root=node), stats
+
+    def _dispatch(self, windows: List[Tuple[int, float, float]], leaves_per_sibling: int) -> bool:
+        """Merită trimis grupul executorului? (vezi MINMAX_PARALLEL_MIN_TASK_LEAVES)"""
+        work = leaves_per_sibling * len(windows)
+        if len(windows) < 2 or work < self.min_task_leaves:
+            return False
+        nodes = sum(hi - lo for lo, hi in _forest_levels(self.tree, windows[0][0], windows[-1][0]))
+        return nodes <= self.max_nodes_per_leaf * work
+
+    def search_siblings(self, windows: List[Tuple[int, float, float]]) -> List[Tuple[int, AlphaBetaStats]]:
+        """
+        Caută în paralel frații (nod, alpha, beta), dați în ordinea crescătoare a indicilor, și
+        întoarce (valoare, contoare) pentru fiecare: câte o pădure de frați consecutivi per worker.
+        """
+        chunks = min(self.workers, len(windows))
+        bounds = [len(windows) * i // chunks for i in range(chunks + 1)]
+        futures = []
+        for lo, hi in zip(bounds, bounds[1:]):
+            chunk = windows[lo:hi]
+            base = chunk[0][0] - 1  # nodul chunk[0] devine 1 în pădure
+            forest = _forest(self.tree, _forest_levels(self.tree, chunk[0][0], chunk[-1][0]))
+            task = (forest, [(node - base, alpha, beta) for node, alpha, beta in chunk])
+            futures.append(self.executor.submit(_search_forest, task))
+        self.tasks += len(futures)
+        results = [result for future in futures for result in future.result()]
+        self.leaves_searched += sum(stats.leaves_visited for _, stats in results)
+        return results
+
+    def _search_inline(self, node: int, depth: int, alpha: float, beta: float) -> int:
+        value, stats = self._inline(node, alpha, beta)
+        self.leaves_searched += stats.leaves_visited
+        _merge_stats(self.stats, stats, depth)
+        return value
+
+    def search(self, node: int, depth: int, alpha: float, beta: float) -> int:
+        """Valoarea nodului (ca `_alpha_beta`); contoarele secvențiale se adaugă în `self.stats`."""
+        tree = self.tree
+        if tree.arity[node] == 0 or depth >= self.split_depth:
+            return self._search_inline(node, depth, alpha, beta)
+
+        maximizing = tree.types[node] == NODE_MAX
+        first, count = tree.offsets[node], tree.arity[node]
+
+        # 1. Primul copil, secvențial (recursiv pe varianta principală)
+        searched = self.leaves_searched
+        value = self.search(first, depth + 1, alpha, beta)
+        # Munca primului copil estimează munca fiecărui frate
+        leaves_per_sibling = self.leaves_searched - searched
+        if maximizing:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        siblings = range(first + 1, first + count)
+
+        if alpha < beta and not self._dispatch([(child, alpha, beta) for child in siblings], leaves_per_sibling):
+            # Grup prea mic pentru executor: bucla secvențială obișnuită, fără muncă speculativă
+            explored = 1
+            for child in siblings:
+                explored += 1
+                child_value = self._search_inline(child, depth + 1, alpha, beta)
+                if maximizing:
+                    value = max(value, child_value)
+                    alpha = max(alpha, value)
+                else:
+                    value = min(value, child_value)
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    break
+            self._record_cutoff(depth, explored, count)
+            return value
+
+        if alpha >= beta:
+            self._record_cutoff(depth, 1, count)
+            return value
+
+        # 2. Frații, în paralel, cu fereastra dată de primul copil
+        results = self.search_siblings([(child, alpha, beta) for child in siblings])
+
+        # Fereastra secvențială a fiecărui frate, dedusă din valorile fail-soft
+        windows = []
+        bound = alpha if maximizing else beta
+        for child, (child_value, _) in zip(siblings, results):
+            windows.append((child, bound, beta) if maximizing else (child, alpha, bound))
+            bound = max(bound, child_value) if maximizing else min(bound, child_value)
+            if (bound >= beta) if maximizing else (bound <= alpha):
+                break
+        explored = 1 + len(windows)
+
+        # 3. Recăutarea fraților cu fereastra îngustată de un frate anterior
+        narrowed = [i for i, window in enumerate(windows) if window[1:] != (alpha, beta)]
+        if narrowed:
+            retry = [windows[i] for i in narrowed]
+            if self._dispatch(retry, leaves_per_sibling):
+                retry_results = self.search_siblings(retry)
+            else:
+                retry_results = [self._inline(*window) for window in retry]
+                self.leaves_searched += sum(stats.leaves_visited for _, stats in retry_results)
+            for i, result in zip(narrowed, retry_results):
+                results[i] = result
+
+        for child_value, stats in results[:len(windows)]:
+            value = max(value, child_value) if maximizing else min(value, child_value)
+            _merge_stats(self.stats, stats, depth + 1)
+        self._record_cutoff(depth, explored, count)
+        return value
+
+    def _record_cutoff(self, depth: int, explored: int, count: int) -> None:
+        if explored < count:
+            cutoffs = self.stats.cutoffs_per_depth
+            while len(cutoffs) <= depth:
+                cutoffs.append(0)
+            cutoffs[depth] += 1
+
+
+def parallel_alpha_beta(tree: FlatTree, executor: Optional[Executor] = None, workers: int = 4,
+                        split_depth: Optional[int] = None,
+                        min_task_leaves: float = MINMAX_PARALLEL_MIN_TASK_LEAVES,
+                        max_nodes_per_leaf: float = MINMAX_PARALLEL_MAX_NODES_PER_LEAF) -> ParallelSearchResult:
+    """
+    Rezolvă arborele în paralel. Frații sunt împărțiți pe varianta principală până la
+    adâncimea `split_depth` (implicit: toate nivelurile interne). Dacă nu primește un
+    executor, creează un pool de procese temporar cu `workers` procese.
+    """
+    if tree.depth < 2:
+        stats = AlphaBetaStats()
+        value = _alpha_beta(tree, stats)
+        return ParallelSearchResult(value, stats, 0, 0, stats.leaves_visited)
+
+    if split_depth is None:
+        split_depth = tree.depth - 1
+    split_depth = max(1, min(split_depth, tree.depth - 1))
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        search = _SiblingSearch(tree, executor, workers, split_depth, min_task_leaves, max_nodes_per_leaf)
+        root_value = search.search(0, 0, -float('inf'), float('inf'))
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    return ParallelSearchResult(root_value, search.stats, split_depth, search.tasks, search.leaves_searched)
@@ -1,9 +1,17 @@
 import random
-from typing import Tuple, List, Optional, Dict, Any
-
-from app.logic.common.seed import set_seed
-from app.schemas.minmax_schemas import MinMaxNode
-from app.logic.minmax.strings import MINMAX_TEXT_RO
+from array import array
+from concurrent.futures import Executor
+from typing import Tuple, List, Optional, Dict, Any, Iterator
+
+from app.logic.common.seed import get_rng
+from app.schemas.minmax_schemas import MinMaxNode, MinMaxCompactTree
+from app.logic.minmax.strings import (
+    MINMAX_TEXT_RO,
+    MINMAX_GAME_TEXT_RO,
+    MINMAX_CHANCE_TEXT_RO,
+    MINMAX_ALGORITHM_REQUIREMENTS_RO
+)
+from app.logic.minmax.tree import FlatTree, NODE_MAX, NODE_MIN, NODE_CHANCE, NODE_TYPE_NAMES, level_types
 from app.logic.common.difficulty import (
     MINMAX_L6_MIN_BREADTH,
     MINMAX_L6_MAX_BREADTH,
@@ -11,40 +19,101 @@ from app.logic.common.difficulty import (
     MINMAX_L6_MAX_DEPTH
 )
 
-leaf_nodes_visited_count = 0
+# Sursele de arbori: arbori aleatori sau poziții din jocuri reale (vezi games.py)
+MINMAX_SOURCE_RANDOM = "random"
+# Algoritmul implicit; variantele PVS și MTD(f) se află în variants.py
+MINMAX_ALGORITHM_ALPHABETA = "alphabeta"
 
 
 class SolverNode:
     def __init__(self, name: str, node_type: str, value: Optional[int] = None, children: List['SolverNode'] = None):
         self.name = name
-        self.node_type = node_type  # "MIN" sau "MAX"
+        self.node_type = node_type  # "MIN", "MAX" sau "CHANCE"
         self.value = value
         self.children = children if children else []
 
 
-def _generate_tree_recursive(depth: int, max_depth: int, name_prefix: str, is_max: bool) -> SolverNode:
-    # Determinăm tipul nodului curent
-    current_type = "MAX" if is_max else "MIN"
+class AlphaBetaStats:
+    """Contoarele unei singure rezolvări Alpha-Beta (înlocuiesc contorul global)."""
 
-    # Cazul de bază: am ajuns la adâncimea maximă -> generăm o frunză cu valoare
-    if depth == max_depth:
-        # Frunzele au valori, tipul părintelui dictează ce se întâmplă, dar nodul în sine e doar valoare
-        return SolverNode(name=name_prefix, node_type=current_type, value=random.randint(1, 20))
+    def __init__(self):
+        self.leaves_visited = 0
+        self.cutoffs_per_depth: List[int] = []  # cutoffs_per_depth[d] = tăieri la nodurile de adâncime d
+        self.max_depth_reached = 0
 
-    children = []
-    current_node_breadth = random.randint(
-        MINMAX_L6_MIN_BREADTH,
-        MINMAX_L6_MAX_BREADTH
-    )
+    @property
+    def total_cutoffs(self) -> int:
+        return sum(self.cutoffs_per_depth)
 
-    for i in range(current_node_breadth):
-        child_name = f"{name_prefix}{i + 1}"
-        # Copiii vor avea tipul opus (negăm is_max)
-        children.append(
-            _generate_tree_recursive(depth + 1, max_depth, child_name, not is_max)
-        )
 
-    return SolverNode(name=name_prefix, node_type=current_type, children=children)
+class MinMaxSolution:
+    """Rezultatul complet al unei probleme MinMax: arborele compact, valoarea și contoarele."""
+
+    def __init__(self, tree: FlatTree, root_value: float, stats: AlphaBetaStats, depth: int, root_type: str,
+                 source: str = MINMAX_SOURCE_RANDOM, position: Optional[str] = None, chance_nodes: bool = False,
+                 algorithm: str = MINMAX_ALGORITHM_ALPHABETA, annotations=None):
+        self.tree = tree
+        self.root_value = root_value
+        self.stats = stats
+        self.depth = depth
+        self.root_type = root_type
+        self.source = source  # "random" sau numele jocului din care provine arborele
+        self.position = position  # descrierea poziției de joc (doar pentru jocuri)
+        self.chance_nodes = chance_nodes  # arbore expectiminimax (valoarea rădăcinii poate fi fracționară)
+        self.algorithm = algorithm  # algoritmul după care sunt numărate frunzele vizitate
+        self.annotations = annotations  # AlphaBetaAnnotations, doar la cerere (notare per nod)
+
+
+def _generate_flat_tree(max_depth: int, is_max: bool, rng: random.Random = random,
+                        min_breadth: int = MINMAX_L6_MIN_BREADTH,
+                        max_breadth: int = MINMAX_L6_MAX_BREADTH,
+                        chance_nodes: bool = False) -> FlatTree:
+    """
+    Generează arborele direct în formă compactă (FlatTree), iterativ.
+
+    Ordinea apelurilor către `random` este identică cu cea a generării recursive
+    (pre-ordine: lățimea nodului, apoi subarborii copiilor, de la stânga la dreapta),
+    deci același seed produce același arbore.
+    Lățimile pot fi suprascrise (ex. pentru benchmark-uri pe arbori mai lați).
+    Cu `chance_nodes`, nivelurile impare devin noduri de șansă (doar tipurile se schimbă).
+    """
+    # În pre-ordine, nodurile de pe același nivel apar de la stânga la dreapta,
+    # exact ca în parcurgerea BFS => construim direct câte un tablou per nivel.
+    level_arity = [array("i") for _ in range(max_depth + 1)]
+    level_values = [array("i") for _ in range(max_depth + 1)]
+    randint = rng.randint
+
+    stack = [0]
+    while stack:
+        depth = stack.pop()
+
+        # Cazul de bază: am ajuns la adâncimea maximă -> generăm o frunză cu valoare
+        if depth == max_depth:
+            level_arity[depth].append(0)
+            level_values[depth].append(randint(1, 20))
+            continue
+
+        current_node_breadth = randint(min_breadth, max_breadth)
+        level_arity[depth].append(current_node_breadth)
+        level_values[depth].append(0)
+        # Copiii sunt identici pe stivă, deci ordinea LIFO nu schimbă pre-ordinea
+        stack.extend([depth + 1] * current_node_breadth)
+
+    arity = array("i")
+    values = array("i")
+    types = array("b")
+    level_starts = []
+    # Tipul este determinat de nivel, pornind de la tipul rădăcinii
+    types_per_level = level_types(NODE_MAX if is_max else NODE_MIN, max_depth + 1, chance_nodes)
+    for depth in range(max_depth + 1):
+        if not level_arity[depth]:
+            break
+        level_starts.append(len(arity))
+        arity.extend(level_arity[depth])
+        values.extend(level_values[depth])
+        types.extend([types_per_level[depth]] * len(level_arity[depth]))
+
+    return FlatTree(arity, values, types, level_starts)
 
 
 def _convert_to_schema(node: SolverNode) -> MinMaxNode:
@@ -58,54 +127,242 @@ def _convert_to_schema(node: SolverNode) -> MinMaxNode:
     )
 
 
-def _alpha_beta(node: SolverNode, alpha: float, beta: float) -> int:
+def build_schema_tree(tree: FlatTree) -> MinMaxNode:
+    """Formatul imbricat (implicit) al arborelui pentru răspunsurile API."""
+    return _convert_to_schema(tree.to_solver_node())
+
+
+def build_compact_tree(tree: FlatTree) -> MinMaxCompactTree:
+    """Formatul compact: aritățile în ordine BFS, valorile frunzelor și tipul rădăcinii."""
+    return MinMaxCompactTree(
+        root_type=NODE_TYPE_NAMES[tree.types[0]],
+        arity=tree.arity.tolist(),
+        values=tree.leaf_values(),
+        chance_nodes=NODE_CHANCE in tree.types
+    )
+
+
+class AlphaBetaVisitor:
     """
-    Implementare Alpha-Beta Pruning care decide strategia (MIN/MAX)
-    bazându-se strict pe tipul nodului din arbore (node.node_type).
+    Cârligele parcurgerii Alpha-Beta din `_walk_alpha_beta`. Fiecare cârlig poate întoarce
+    un eveniment (emis de parcurgere, ca la trace) sau None. Adâncimea este cea din arbore.
+      enter  - intrarea într-un nod intern, cu fereastra primită
+      leaf   - evaluarea unei frunze, cu fereastra în care este evaluată
+      update - integrarea valorii unui copil (valoarea curentă și fereastra nodului)
+      cut    - tăiere Alpha-Beta (`remaining` copii neexplorați)
+      exit   - întoarcerea din nod (valoarea returnată și fereastra finală)
     """
-    global leaf_nodes_visited_count
 
-    # 1. Cazul de bază: Nod frunză (sau nod fără copii)
-    if not node.children:
-        leaf_nodes_visited_count += 1
-        return node.value if node.value is not None else 0
-
-    # 2. Logică bazată pe tipul nodului
-    # Verificăm explicit tipul stocat în nod pentru a garanta consistența cu vizualizarea
-    if node.node_type == "MAX":
-        value = -float('inf')
-        for child in node.children:
-            # Apel recursiv
-            value = max(value, _alpha_beta(child, alpha, beta))
-            alpha = max(alpha, value)
-
-            # Pruning Alpha-Beta
-            if alpha >= beta:
-                break
-        return value
-
-    else:  # node.node_type == "MIN"
-        value = float('inf')
-        for child in node.children:
-            # Apel recursiv
-            value = min(value, _alpha_beta(child, alpha, beta))
-            beta = min(beta, value)
-
-            # Pruning Alpha-Beta
-            if alpha >= beta:
-                break
-        return value
-
-
-def generate_and_solve_minmax(seed: int, params: Dict[str, Any] = None) -> Tuple[
-    MinMaxNode, int, int, int, Dict[str, str], str]:
-    global leaf_nodes_visited_count
-
-    set_seed(seed)
+    def enter(self, node: int, depth: int, alpha: float, beta: float):
+        return None
+
+    def leaf(self, node: int, depth: int, alpha: float, beta: float, value: int):
+        return None
+
+    def update(self, node: int, depth: int, value: float, alpha: float, beta: float):
+        return None
+
+    def cut(self, node: int, depth: int, remaining: int):
+        return None
+
+    def exit(self, node: int, depth: int, value: float, alpha: float, beta: float):
+        return None
+
+
+def _walk_alpha_beta(tree: FlatTree, stats: AlphaBetaStats, alpha: float, beta: float,
+                     visitor: Optional[AlphaBetaVisitor], root: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Singura implementare a buclei Alpha-Beta iterative (generator): emite evenimentele
+    întoarse de cârligele lui `visitor` și întoarce (StopIteration.value) valoarea lui `root`.
+    Fără vizitator nu emite nimic, deci rulează dintr-un singur `next`.
+    Cu `root` != 0 se caută doar subarborele acelui nod, fără copiere; adâncimile din
+    contoare și din cârlige sunt atunci relative la `root`.
+    """
+    arity = tree.arity
+    offsets = tree.offsets
+    values = tree.values
+    types = tree.types
+
+    # Cazul de bază: rădăcina este frunză
+    if arity[root] == 0:
+        stats.leaves_visited += 1
+        if visitor is not None:
+            event = visitor.leaf(root, 0, alpha, beta, values[root])
+            if event is not None:
+                yield event
+        return values[root]
+
+    if visitor is not None:
+        event = visitor.enter(root, 0, alpha, beta)
+        if event is not None:
+            yield event
+
+    leaves_visited = 0
+    max_depth_reached = 0
+    cutoffs = stats.cutoffs_per_depth
+    # Cadru pe stivă: [nod, alpha, beta, valoare curentă, indexul următorului copil]
+    stack = [[root, alpha, beta,
+              -float('inf') if types[root] == NODE_MAX else float('inf'), 0]]
+    returned = None
+
+    while stack:
+        frame = stack[-1]
+        node = frame[0]
+
+        if returned is not None:
+            # Integrăm valoarea întoarsă de copil
+            if types[node] == NODE_MAX:
+                if returned > frame[3]:
+                    frame[3] = returned
+                if frame[3] > frame[1]:
+                    frame[1] = frame[3]
+            else:
+                if returned < frame[3]:
+                    frame[3] = returned
+                if frame[3] < frame[2]:
+                    frame[2] = frame[3]
+            returned = None
+            if visitor is not None:
+                event = visitor.update(node, len(stack) - 1, frame[3], frame[1], frame[2])
+                if event is not None:
+                    yield event
+
+            # Pruning Alpha-Beta sau copii epuizați -> ne întoarcem în părinte
+            if frame[1] >= frame[2] or frame[4] == arity[node]:
+                depth = len(stack) - 1
+                if frame[4] < arity[node]:
+                    # Tăiere efectivă: au rămas copii neexplorați
+                    while len(cutoffs) <= depth:
+                        cutoffs.append(0)
+                    cutoffs[depth] += 1
+                    if visitor is not None:
+                        event = visitor.cut(node, depth, arity[node] - frame[4])
+                        if event is not None:
+                            yield event
+                stack.pop()
+                returned = frame[3]
+                if visitor is not None:
+                    event = visitor.exit(node, depth, returned, frame[1], frame[2])
+                    if event is not None:
+                        yield event
+                continue
+
+        child = offsets[node] + frame[4]
+        frame[4] += 1
+
+        if arity[child] == 0:
+            leaves_visited += 1
+            if len(stack) > max_depth_reached:
+                max_depth_reached = len(stack)
+            returned = values[child]
+            if visitor is not None:
+                event = visitor.leaf(child, len(stack), frame[1], frame[2], returned)
+                if event is not None:
+                    yield event
+        else:
+            if visitor is not None:
+                event = visitor.enter(child, len(stack), frame[1], frame[2])
+                if event is not None:
+                    yield event
+            initial = -float('inf') if types[child] == NODE_MAX else float('inf')
+            stack.append([child, frame[1], frame[2], initial, 0])
+
+    stats.leaves_visited += leaves_visited
+    stats.max_depth_reached = max(stats.max_depth_reached, max_depth_reached)
+    return returned
+
+
+def run_alpha_beta_visitor(tree: FlatTree, visitor: AlphaBetaVisitor, stats: Optional[AlphaBetaStats] = None,
+                           alpha: float = -float('inf'), beta: float = float('inf')):
+    """Parcurge tot arborele cu `visitor`, ignorând evenimentele; întoarce valoarea rădăcinii."""
+    walk = _walk_alpha_beta(tree, stats if stats is not None else AlphaBetaStats(), alpha, beta, visitor)
+    while True:
+        try:
+            next(walk)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _alpha_beta(tree: FlatTree, stats: Optional[AlphaBetaStats] = None,
+                alpha: float = -float('inf'), beta: float = float('inf'), root: int = 0) -> int:
+    """
+    Implementare iterativă Alpha-Beta Pruning peste arborele compact.
+    Strategia (MIN/MAX) este decisă strict pe baza tipului nodului din arbore.
+
+    Contoarele (frunze vizitate, tăieri, adâncime) se scriu în `stats`, care
+    aparține apelantului => funcția este reentrantă și poate rula în paralel.
+    Fereastra inițială (alpha, beta) și nodul de start `root` permit căutarea unui subarbore
+    exact cum ar fi fost căutat în interiorul arborelui complet.
+    """
+    try:
+        next(_walk_alpha_beta(tree, stats if stats is not None else AlphaBetaStats(), alpha, beta, None, root))
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("Parcurgerea fără vizitator nu emite evenimente.")
+
+
+def _trace_bound(bound: float) -> Optional[int]:
+    # ±infinit nu există în JSON => îl codificăm ca null
+    return None if bound in (float('inf'), -float('inf')) else bound
+
 
+class _TraceVisitor(AlphaBetaVisitor):
+    """
+    Evenimentele compacte ale trace-ului NDJSON. Numele nodurilor (R, R1, R12, ...) se
+    calculează pe drum, dintr-o stivă de nume, deci memoria rămâne proporțională cu adâncimea.
+    """
+
+    def __init__(self, tree: FlatTree):
+        self.tree = tree
+        self.names = []  # (nod, nume) pentru nodurile interne de pe stivă
+
+    def _name(self, node: int) -> str:
+        if not self.names:
+            return "R"
+        parent, parent_name = self.names[-1]
+        return f"{parent_name}{node - self.tree.offsets[parent] + 1}"
+
+    def enter(self, node, depth, alpha, beta):
+        name = self._name(node)
+        self.names.append((node, name))
+        return {"t": "enter", "n": name, "k": NODE_TYPE_NAMES[self.tree.types[node]],
+                "a": _trace_bound(alpha), "b": _trace_bound(beta)}
+
+    def leaf(self, node, depth, alpha, beta, value):
+        return {"t": "leaf", "n": self._name(node), "v": value}
+
+    def update(self, node, depth, value, alpha, beta):
+        return {"t": "update", "n": self.names[-1][1], "v": value, "a": _trace_bound(alpha), "b": _trace_bound(beta)}
+
+    def cut(self, node, depth, remaining):
+        return {"t": "cut", "n": self.names[-1][1], "p": remaining}
+
+    def exit(self, node, depth, value, alpha, beta):
+        _, name = self.names.pop()
+        return {"t": "exit", "n": name, "v": value}
+
+
+def iter_alpha_beta_trace(tree: FlatTree) -> Iterator[Dict[str, Any]]:
+    """
+    Parcurgerea `_walk_alpha_beta`, cu evenimente compacte emise pe rând:
+      enter  - intrarea într-un nod intern (n=nume, k=tip, a=alpha, b=beta)
+      leaf   - evaluarea unei frunze (v=valoare)
+      update - integrarea valorii unui copil (v=valoarea curentă, a, b)
+      cut    - tăiere Alpha-Beta (p=numărul de copii neexplorați)
+      exit   - întoarcerea din nod (v=valoarea returnată)
+      done   - rezultatul final (v=valoarea rădăcinii, leaves=frunze vizitate)
+    Memoria folosită este proporțională doar cu adâncimea arborelui.
+    """
+    stats = AlphaBetaStats()
+    value = yield from _walk_alpha_beta(tree, stats, -float('inf'), float('inf'), _TraceVisitor(tree))
+    yield {"t": "done", "v": value, "leaves": stats.leaves_visited}
+
+
+def _resolve_tree_params(rng: random.Random, params: Optional[Dict[str, Any]]) -> Tuple[int, bool]:
+    """Alege adâncimea și tipul rădăcinii (consumând mereu RNG-ul în aceeași ordine)."""
     # --- 1. Configurare ADÂNCIME (Depth) ---
     # IMPORTANT: Consumăm întotdeauna numărul aleator pentru a păstra sincronizarea RNG
-    random_depth = random.randint(MINMAX_L6_MIN_DEPTH, MINMAX_L6_MAX_DEPTH)
+    random_depth = rng.randint(MINMAX_L6_MIN_DEPTH, MINMAX_L6_MAX_DEPTH)
     random_depth = max(1, random_depth)
 
     chosen_depth = random_depth
@@ -117,7 +374,7 @@ def generate_and_solve_minmax(seed: int, params: Dict[str, Any] = None) -> Tuple
 
     # --- 2. Configurare RĂDĂCINĂ (Root Type) ---
     # IMPORTANT: Consumăm întotdeauna numărul aleator pentru a păstra sincronizarea RNG
-    random_is_max = random.choice([True, False])
+    random_is_max = rng.choice([True, False])
 
     start_is_maximizing = random_is_max
     if params:
@@ -130,24 +387,143 @@ def generate_and_solve_minmax(seed: int, params: Dict[str, Any] = None) -> Tuple
             if user_choice is not None:
                 start_is_maximizing = user_choice
 
-    # --- 3. Generare Arbore ---
-    internal_tree = _generate_tree_recursive(
-        depth=0,
-        max_depth=chosen_depth,
-        name_prefix="R",
-        is_max=start_is_maximizing
-    )
+    return chosen_depth, start_is_maximizing
+
 
-    # --- 4. Rezolvare ---
-    leaf_nodes_visited_count = 0
-    # Algoritmul citește tipul direct din rădăcina arborelui
-    root_value = _alpha_beta(
-        internal_tree, -float('inf'), float('inf')
+def fixed_tree_params(depth: int, root_type: str, source: str = MINMAX_SOURCE_RANDOM,
+                      chance_nodes: bool = False, algorithm: str = MINMAX_ALGORITHM_ALPHABETA,
+                      target_visited: Optional[int] = None, min_cutoffs: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Parametrii care reproduc exact arborele unui seed cunoscând adâncimea, tipul rădăcinii,
+    sursa și prezența nodurilor de șansă (RNG-ul este consumat la fel indiferent de parametri).
+    Algoritmul nu schimbă arborele, doar numărul de frunze vizitate; țintele de tăiere
+    schimbă doar valorile frunzelor.
+    """
+    return {
+        "random_depth": False,
+        "depth": depth,
+        "random_root": False,
+        "is_maximizing_player": root_type == "MAX",
+        "source": source,
+        "chance_nodes": chance_nodes,
+        "algorithm": algorithm,
+        "target_visited": target_visited,
+        "min_cutoffs": min_cutoffs,
+    }
+
+
+def solve_minmax(seed: int, params: Dict[str, Any] = None, executor: Optional[Executor] = None,
+                 annotate: bool = False) -> MinMaxSolution:
+    """
+    Generează și rezolvă arborele pentru seed-ul dat, fără stare globală:
+    RNG-ul și contoarele aparțin exclusiv acestui apel.
+    Cu un `executor` (pool de procese), căutarea rulează în paralel și dă aceleași contoare.
+    Cu `annotate`, căutarea Alpha-Beta produce în aceeași trecere și tabelul de adnotări per nod.
+    """
+    rng = get_rng(seed)
+    chosen_depth, start_is_maximizing = _resolve_tree_params(rng, params)
+    source = (params or {}).get("source") or MINMAX_SOURCE_RANDOM
+    # Nodurile de șansă există doar în arborii aleatori (jocurile sunt deterministe)
+    chance_nodes = bool((params or {}).get("chance_nodes")) and source == MINMAX_SOURCE_RANDOM
+    # Expectiminimax are propriul algoritm (*-minimax), deci varianta aleasă se aplică doar fără noduri de șansă
+    algorithm = (params or {}).get("algorithm") or MINMAX_ALGORITHM_ALPHABETA
+    if chance_nodes:
+        algorithm = MINMAX_ALGORITHM_ALPHABETA
+
+    position = None
+    if source == MINMAX_SOURCE_RANDOM:
+        flat_tree = _generate_flat_tree(
+            max_depth=chosen_depth,
+            is_max=start_is_maximizing,
+            rng=rng,
+            chance_nodes=chance_nodes
+        )
+        # Ținte de tăiere: aceeași formă, valori ale frunzelor construite (fără reîncercarea altor seed-uri)
+        target_visited = (params or {}).get("target_visited")
+        min_cutoffs = (params or {}).get("min_cutoffs")
+        if not chance_nodes and (target_visited is not None or min_cutoffs is not None):
+            from app.logic.minmax.constructive import construct_leaf_values
+
+            flat_tree = construct_leaf_values(flat_tree, target_visited, min_cutoffs)
+    else:
+        from app.logic.minmax.games import generate_game_problem
+
+        flat_tree, position = generate_game_problem(source, rng, chosen_depth, start_is_maximizing)
+        # Vederea poate fi mai scurtă (limită de adâncime sau poziții terminale)
+        chosen_depth = flat_tree.depth
+
+    annotations = None
+    if chance_nodes:
+        from app.logic.minmax.expectimax import EXPECTIMAX_VALUE_DECIMALS, star_minimax
+
+        stats = AlphaBetaStats()
+        root_value = round(float(star_minimax(flat_tree, stats)), EXPECTIMAX_VALUE_DECIMALS)
+    elif algorithm != MINMAX_ALGORITHM_ALPHABETA:
+        from app.logic.minmax.variants import SEARCH_VARIANTS, SearchStats
+
+        stats = SearchStats()
+        root_value = SEARCH_VARIANTS[algorithm](flat_tree, stats)
+    elif annotate:
+        from app.logic.minmax.annotations import annotate_alpha_beta
+
+        stats = AlphaBetaStats()
+        annotations = annotate_alpha_beta(flat_tree, stats)
+        root_value = annotations.root_value
+    elif executor is not None:
+        from app.logic.minmax.parallel import parallel_alpha_beta
+
+        result = parallel_alpha_beta(flat_tree, executor)
+        root_value, stats = result.root_value, result.stats
+    else:
+        stats = AlphaBetaStats()
+        # Algoritmul citește tipul direct din nodurile arborelui
+        root_value = _alpha_beta(flat_tree, stats)
+
+    return MinMaxSolution(
+        tree=flat_tree,
+        root_value=root_value,
+        stats=stats,
+        depth=chosen_depth,
+        root_type="MAX" if start_is_maximizing else "MIN",
+        source=source,
+        position=position,
+        chance_nodes=chance_nodes,
+        algorithm=algorithm,
+        annotations=annotations
     )
 
-    schema_tree = _convert_to_schema(internal_tree)
 
-    text_data = MINMAX_TEXT_RO.copy()
-    root_type_str = "MAX" if start_is_maximizing else "MIN"
+def minmax_problem_text(solution: MinMaxSolution) -> Dict[str, str]:
+    if solution.chance_nodes:
+        return MINMAX_CHANCE_TEXT_RO.copy()
+
+    if solution.position is None:
+        text = MINMAX_TEXT_RO.copy()
+    else:
+        text = {
+            "title": MINMAX_GAME_TEXT_RO["title"],
+            "description": MINMAX_GAME_TEXT_RO["description"].format(position=solution.position),
+            "requirement": MINMAX_GAME_TEXT_RO["requirement"]
+        }
+
+    if solution.algorithm != MINMAX_ALGORITHM_ALPHABETA:
+        text["requirement"] = MINMAX_ALGORITHM_REQUIREMENTS_RO[solution.algorithm]
+    return text
+
+
+def generate_and_solve_minmax(seed: int, params: Dict[str, Any] = None, build_tree: bool = True) -> Tuple[
+    Optional[MinMaxNode], float, int, int, Dict[str, str], str]:
+    """
+    Generează și rezolvă problema MinMax pentru seed-ul dat.
+    Dacă build_tree=False (ex. la evaluare), arborele Pydantic nu mai este construit
+    și primul element returnat este None.
+    """
+    solution = solve_minmax(seed, params)
+
+    # Arborele de obiecte se construiește doar dacă răspunsul are nevoie de el
+    schema_tree = build_schema_tree(solution.tree) if build_tree else None
+
+    text_data = minmax_problem_text(solution)
 
-    return schema_tree, root_value, leaf_nodes_visited_count, chosen_depth, text_data, root_type_str
+    return (schema_tree, solution.root_value, solution.stats.leaves_visited,
+            solution.depth, text_data, solution.root_type)
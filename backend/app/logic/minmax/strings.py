@@ -14,4 +14,42 @@ MINMAX_TEXT_RO = {
         "numărul de noduri frunză evaluate în timpul procesului "
         "de parcurgere folosind algoritmul Alpha-Beta Pruning."
     )
-}
\ No newline at end of file
+}
+
+MINMAX_GAME_TEXT_RO = {
+    "title": "Problemă MinMax pe un joc real",
+    "description": (
+        "{position}\n"
+        "Arborele de mai jos desfășoară primele mutări din această poziție. Frunzele au "
+        "valoarea exactă a poziției pentru jucătorul MAX (pozitiv = câștig MAX, negativ = câștig MIN, 0 = remiză)."
+    ),
+    "requirement": MINMAX_TEXT_RO["requirement"]
+}
+
+MINMAX_CHANCE_TEXT_RO = {
+    "title": "Problemă Expectiminimax cu tăieri Star1/Star2",
+    "description": (
+        "Se consideră arborele de mai jos, în care nodurile frunză au valori numerice între 1 și 20, "
+        "iar celelalte noduri sunt de tip MAX, MIN sau CHANCE. Copiii unui nod CHANCE sunt "
+        "echiprobabili, iar valoarea lui este media valorilor copiilor."
+    ),
+    "requirement": (
+        "Determinați valoarea calculată în rădăcina arborelui (cu două zecimale) și "
+        "numărul de noduri frunză distincte evaluate folosind algoritmul *-Minimax "
+        "(Star1, cu sondarea Star2 la nodurile CHANCE)."
+    )
+}
+
+# Cerința pentru variantele Alpha-Beta (frunzele se numără o singură dată, chiar dacă sunt re-evaluate)
+MINMAX_ALGORITHM_REQUIREMENTS_RO = {
+    "pvs": (
+        "Determinați valoarea calculată în rădăcina arborelui și numărul de noduri frunză distincte "
+        "evaluate folosind Principal Variation Search (NegaScout): primul copil cu fereastra completă, "
+        "ceilalți cu fereastră nulă și re-căutare când fereastra nulă este depășită."
+    ),
+    "mtdf": (
+        "Determinați valoarea calculată în rădăcina arborelui și numărul de noduri frunză distincte "
+        "evaluate folosind MTD(f) cu tabelă de transpoziții, pornind de la estimarea f = mijlocul "
+        "intervalului valorilor frunzelor."
+    ),
+}
@@ -0,0 +1,174 @@
+"""
+Reprezentarea compactă a arborilor MinMax.
+
+Arborele este stocat pe niveluri (ordine BFS), ca în formatul CSR:
+copiii nodului `i` ocupă indicii `offsets[i] .. offsets[i] + arity[i] - 1`.
+Frunzele au `arity[i] == 0`, iar valoarea lor se află în `values[i]`.
+Obiectele `SolverNode` / `MinMaxNode` se construiesc doar la cerere.
+"""
+from array import array
+from typing import List, Optional
+
+# Codificarea tipului de nod în tabloul `types`
+NODE_MAX = 1
+NODE_MIN = -1
+# Nod de șansă (expectiminimax): copiii au probabilități egale, valoarea este media lor
+NODE_CHANCE = 0
+
+NODE_TYPE_NAMES = {
+    NODE_MAX: "MAX",
+    NODE_MIN: "MIN",
+    NODE_CHANCE: "CHANCE",
+}
+NODE_TYPE_CODES = {name: code for code, name in NODE_TYPE_NAMES.items()}
+
+
+def level_types(root_type: int, levels: int, chance_nodes: bool = False) -> List[int]:
+    """
+    Tipul nodurilor de pe fiecare nivel. Fără noduri de șansă tipul alternează (MAX, MIN, ...);
+    cu noduri de șansă, între oricare două niveluri de decizie apare un nivel CHANCE
+    (MAX, CHANCE, MIN, CHANCE, MAX, ...).
+    """
+    types = []
+    decision = root_type
+    for level in range(levels):
+        if chance_nodes and level % 2 == 1:
+            types.append(NODE_CHANCE)
+            continue
+        types.append(decision)
+        decision = -decision
+    return types
+
+
+class FlatTree:
+    """
+    Arbore MinMax stocat în tablouri tipizate, fără un obiect Python per nod.
+
+    arity:  numărul de copii al fiecărui nod (0 pentru frunze)
+    values: valoarea frunzelor (0 pentru nodurile interne)
+    types:  NODE_MAX / NODE_MIN / NODE_CHANCE pentru fiecare nod
+    offsets: indexul primului copil al fiecărui nod (calculat)
+    level_starts: indexul primului nod de pe fiecare nivel (calculat)
+    """
+    __slots__ = ("arity", "values", "types", "offsets", "level_starts")
+
+    def __init__(self, arity: array, values: array, types: array, level_starts: Optional[List[int]] = None):
+        self.arity = arity
+        self.values = values
+        self.types = types
+
+        offsets = array("i", bytes(4 * len(arity)))
+        next_child = 1
+        for i, a in enumerate(arity):
+            offsets[i] = next_child
+            next_child += a
+        self.offsets = offsets
+
+        if level_starts is None:
+            level_starts = self._compute_level_starts()
+        self.level_starts = level_starts
+
+    def __len__(self) -> int:
+        return len(self.arity)
+
+    def __getstate__(self):
+        return self.arity, self.values, self.types, self.offsets, self.level_starts
+
+    def __setstate__(self, state):
+        self.arity, self.values, self.types, self.offsets, self.level_starts = state
+
+    def _compute_level_starts(self) -> List[int]:
+        # Nivelul d+1 începe imediat după ultimul nod de pe nivelul d,
+        # iar numărul de noduri de pe nivelul d+1 este suma arităților nivelului d.
+        starts = [0]
+        start, end = 0, min(1, len(self.arity))
+        while start < end:
+            width = sum(self.arity[start:end])
+            if width == 0:
+                break
+            start, end = end, end + width
+            starts.append(start)
+        return starts
+
+    @property
+    def depth(self) -> int:
+        return len(self.level_starts) - 1
+
+    @property
+    def leaf_count(self) -> int:
+        return sum(1 for a in self.arity if a == 0)
+
+    def node_names(self) -> List[str]:
+        """Numele nodurilor (R, R1, R12, ...) în ordinea indicilor, derivate din poziție."""
+        names = [""] * len(self.arity)
+        if names:
+            names[0] = "R"
+        for i, a in enumerate(self.arity):
+            first = self.offsets[i]
+            prefix = names[i]
+            for k in range(a):
+                names[first + k] = f"{prefix}{k + 1}"
+        return names
+
+    def subtree(self, node: int) -> "FlatTree":
+        """
+        Extrage subarborele cu rădăcina în `node` ca FlatTree independent.
+        Descendenții unui interval contiguu de pe un nivel formează tot un interval
+        contiguu pe nivelul următor, deci copiem câte o felie per nivel.
+        """
+        arity = array("i")
+        values = array("i")
+        types = array("b")
+        level_starts = []
+        lo, hi = node, node + 1
+        while lo < hi:
+            level_starts.append(len(arity))
+            arity.extend(self.arity[lo:hi])
+            values.extend(self.values[lo:hi])
+            types.extend(self.types[lo:hi])
+            lo, hi = self.offsets[lo], self.offsets[hi - 1] + self.arity[hi - 1]
+        return FlatTree(arity, values, types, level_starts)
+
+    def leaf_values(self) -> List[int]:
+        """Valorile frunzelor, în ordine BFS."""
+        return [v for a, v in zip(self.arity, self.values) if a == 0]
+
+    @classmethod
+    def from_compact(cls, arity: List[int], leaf_values: List[int], root_type: str,
+                     chance_nodes: bool = False) -> "FlatTree":
+        """Reconstruiește arborele din formatul compact (aritate BFS, valori frunze, tip rădăcină)."""
+        arity_arr = array("i", arity)
+        values = array("i", bytes(4 * len(arity_arr)))
+        leaves = iter(leaf_values)
+        for i, a in enumerate(arity_arr):
+            if a == 0:
+                values[i] = next(leaves)
+
+        tree = cls(arity_arr, values, array("b", bytes(len(arity_arr))))
+        # Tipul este determinat de nivel, pornind de la tipul rădăcinii
+        starts = tree.level_starts + [len(arity_arr)]
+        types = level_types(NODE_TYPE_CODES[root_type], len(tree.level_starts), chance_nodes)
+        for level, level_type in enumerate(types):
+            for i in range(starts[level], starts[level + 1]):
+                tree.types[i] = level_type
+        return tree
+
+    def to_solver_node(self):
+        """Construiește arborele de obiecte `SolverNode` (doar când este necesar)."""
+        from app.logic.minmax.solver import SolverNode
+
+        names = self.node_names()
+        nodes: List[Optional[SolverNode]] = [None] * len(self.arity)
+
+        # Construcție de jos în sus: copiii sunt mereu la indici mai mari decât părintele.
+        for i in range(len(self.arity) - 1, -1, -1):
+            a = self.arity[i]
+            node_type = NODE_TYPE_NAMES[self.types[i]]
+            if a == 0:
+                nodes[i] = SolverNode(name=names[i], node_type=node_type, value=self.values[i])
+            else:
+                first = self.offsets[i]
+                nodes[i] = SolverNode(name=names[i], node_type=node_type, children=nodes[first:first + a])
+                # Eliberăm referințele pe măsură ce urcăm
+                nodes[first:first + a] = [None] * a
+        return nodes[0]
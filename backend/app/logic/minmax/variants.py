@@ -0,0 +1,186 @@
+"""
+Variante ale căutării Alpha-Beta: Principal Variation Search (NegaScout) și MTD(f).
+
+Ambele pot evalua aceeași frunză de mai multe ori (re-căutări PVS, treceri MTD(f)),
+deci contorizăm separat:
+  leaves_visited   - frunze distincte evaluate (numărul cerut în problemă și notat)
+  leaf_evaluations - totalul evaluărilor de frunze (costul real, pentru benchmark-uri)
+Valorile frunzelor sunt întregi, deci ferestrele nule au forma (v, v + 1).
+"""
+from typing import Dict, List, Optional
+
+from app.logic.minmax.solver import AlphaBetaStats
+from app.logic.minmax.tree import FlatTree, NODE_MAX
+
+ALGORITHM_PVS = "pvs"
+ALGORITHM_MTDF = "mtdf"
+
+# Tabela de transpoziții MTD(f) este mică: peste această limită, intrările noi nu mai sunt păstrate
+MTDF_TT_MAX_ENTRIES = 1 << 14
+
+
+class SearchStats(AlphaBetaStats):
+    """Contoarele `AlphaBetaStats`, plus costul real al variantelor cu re-căutări."""
+
+    def __init__(self):
+        super().__init__()
+        self.leaf_evaluations = 0
+        self.researches = 0  # PVS: re-căutări cu fereastră completă; MTD(f): treceri cu fereastră nulă
+
+
+class _LeafCounter:
+    """Numără frunzele distincte și evaluările totale pentru un arbore."""
+
+    def __init__(self, tree: FlatTree, stats: SearchStats):
+        self.tree = tree
+        self.stats = stats
+        self.seen = bytearray(len(tree))
+
+    def evaluate(self, node: int, depth: int) -> int:
+        stats = self.stats
+        stats.leaf_evaluations += 1
+        if not self.seen[node]:
+            self.seen[node] = 1
+            stats.leaves_visited += 1
+        stats.max_depth_reached = max(stats.max_depth_reached, depth)
+        return self.tree.values[node]
+
+    def cutoff(self, node: int, depth: int, explored: int) -> None:
+        if explored < self.tree.arity[node]:
+            cutoffs = self.stats.cutoffs_per_depth
+            while len(cutoffs) <= depth:
+                cutoffs.append(0)
+            cutoffs[depth] += 1
+
+
+def principal_variation_search(tree: FlatTree, stats: Optional[SearchStats] = None) -> int:
+    """
+    NegaScout: primul copil este căutat cu fereastra completă, ceilalți cu o fereastră nulă
+    care doar verifică dacă sunt mai slabi decât varianta principală; un copil care
+    o depășește este re-căutat cu fereastra (valoare, beta) pentru MAX sau (alpha, valoare) pentru MIN.
+    """
+    if stats is None:
+        stats = SearchStats()
+    arity, offsets, types = tree.arity, tree.offsets, tree.types
+    leaves = _LeafCounter(tree, stats)
+
+    def search(node: int, depth: int, alpha: float, beta: float) -> float:
+        if arity[node] == 0:
+            return leaves.evaluate(node, depth)
+
+        first = offsets[node]
+        maximizing = types[node] == NODE_MAX
+        best = search(first, depth + 1, alpha, beta)
+        if maximizing:
+            alpha = max(alpha, best)
+        else:
+            beta = min(beta, best)
+
+        explored = 1
+        for child in range(first + 1, first + arity[node]):
+            if alpha >= beta:
+                break
+            explored += 1
+            if maximizing:
+                value = search(child, depth + 1, alpha, alpha + 1)
+                if alpha < value < beta and arity[child] > 0:
+                    stats.researches += 1
+                    value = search(child, depth + 1, value, beta)
+                best = max(best, value)
+                alpha = max(alpha, value)
+            else:
+                value = search(child, depth + 1, beta - 1, beta)
+                if alpha < value < beta and arity[child] > 0:
+                    stats.researches += 1
+                    value = search(child, depth + 1, alpha, value)
+                best = min(best, value)
+                beta = min(beta, value)
+
+        if alpha >= beta:
+            leaves.cutoff(node, depth, explored)
+        return best
+
+    return search(0, 0, -float('inf'), float('inf'))
+
+
+def mtdf(tree: FlatTree, stats: Optional[SearchStats] = None, first_guess: Optional[int] = None) -> int:
+    """
+    MTD(f): o serie de căutări Alpha-Beta cu fereastră nulă (cu memorie) care strâng
+    marginile valorii rădăcinii până când se întâlnesc. Tabela de transpoziții păstrează
+    marginile nodurilor interne între treceri, deci trecerile următoare sunt ieftine.
+    Prima estimare implicită este mijlocul intervalului valorilor frunzelor.
+    """
+    if stats is None:
+        stats = SearchStats()
+    arity, offsets, types = tree.arity, tree.offsets, tree.types
+    leaves = _LeafCounter(tree, stats)
+    table: Dict[int, List[float]] = {}  # nod -> [margine inferioară, margine superioară]
+
+    def search(node: int, depth: int, alpha: float, beta: float) -> float:
+        if arity[node] == 0:
+            return leaves.evaluate(node, depth)
+
+        bounds = table.get(node)
+        if bounds is not None:
+            if bounds[0] >= beta:
+                return bounds[0]
+            if bounds[1] <= alpha:
+                return bounds[1]
+            alpha, beta = max(alpha, bounds[0]), min(beta, bounds[1])
+
+        first = offsets[node]
+        explored = 0
+        if types[node] == NODE_MAX:
+            value, a = -float('inf'), alpha
+            for child in range(first, first + arity[node]):
+                if value >= beta:
+                    break
+                explored += 1
+                value = max(value, search(child, depth + 1, a, beta))
+                a = max(a, value)
+            if value >= beta:
+                leaves.cutoff(node, depth, explored)
+        else:
+            value, b = float('inf'), beta
+            for child in range(first, first + arity[node]):
+                if value <= alpha:
+                    break
+                explored += 1
+                value = min(value, search(child, depth + 1, alpha, b))
+                b = min(b, value)
+            if value <= alpha:
+                leaves.cutoff(node, depth, explored)
+
+        if bounds is None:
+            if len(table) >= MTDF_TT_MAX_ENTRIES:
+                return value
+            bounds = table[node] = [-float('inf'), float('inf')]
+        if value <= alpha:
+            bounds[1] = value
+        elif value >= beta:
+            bounds[0] = value
+        else:
+            bounds[0] = bounds[1] = value
+        return value
+
+    if first_guess is None:
+        leaf_values = tree.leaf_values()
+        first_guess = (min(leaf_values) + max(leaf_values)) // 2
+
+    guess = first_guess
+    lower, upper = -float('inf'), float('inf')
+    while lower < upper:
+        beta = guess + 1 if guess == lower else guess
+        stats.researches += 1
+        guess = search(0, 0, beta - 1, beta)
+        if guess < beta:
+            upper = guess
+        else:
+            lower = guess
+    return guess
+
+
+SEARCH_VARIANTS = {
+    ALGORITHM_PVS: principal_variation_search,
+    ALGORITHM_MTDF: mtdf,
+}
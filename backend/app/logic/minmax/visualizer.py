@@ -1,8 +1,72 @@
 from graphviz import Digraph
+from xml.sax.saxutils import escape
+from typing import Dict, List, Tuple
 import base64
 
+# Formatele de imagine suportate și tipurile MIME corespunzătoare
+IMAGE_FORMAT_SVG = "svg"
+IMAGE_FORMAT_PNG = "png"
+IMAGE_MIME_TYPES = {
+    IMAGE_FORMAT_SVG: "image/svg+xml",
+    IMAGE_FORMAT_PNG: "image/png",
+}
 
-def generate_tree_image_base64(tree_dict):
+# Dimensiuni pentru randarea SVG (în pixeli)
+SVG_NODE_RX = 27
+SVG_NODE_RY = 18
+SVG_H_SPACING = 62
+SVG_V_SPACING = 72
+SVG_MARGIN = 10
+# Nodurile agregate (randarea LOD) sunt dreptunghiuri cu trei rânduri de text
+SVG_AGGREGATE_HALF_WIDTH = 29
+SVG_AGGREGATE_FONT_SIZE = 10
+SVG_AGGREGATE_LINE_HEIGHT = 11
+
+AGGREGATE_FILL = "#EEEEEE"
+AGGREGATE_PRUNED_FILL = "#BDBDBD"
+
+
+def _aggregate_lines(node) -> List[str]:
+    """Textul unui nod agregat: tipul / valoarea sau "tăiat", numărul de frunze, intervalul valorilor."""
+    info = node["aggregate"]
+    if info["pruned"]:
+        head = "tăiat" if info["nodes"] == 1 else f"tăiat x{info['nodes']}"
+    elif info["value"] is not None:
+        head = f"{node['node_type']}={info['value']}"
+    else:
+        head = node["node_type"]
+    return [head, f"{info['leaves']} fr.", f"{info['min']}..{info['max']}"]
+
+
+def _node_style(node) -> Tuple[str, str, str]:
+    """Eticheta, culoarea și forma unui nod, comune pentru Graphviz și SVG."""
+    # Dacă are valoare (frunză), afișăm valoarea.
+    # Dacă este nod intern, afișăm tipul (MIN sau MAX).
+    if node.get("aggregate"):
+        label = "\n".join(_aggregate_lines(node))
+        fillcolor = AGGREGATE_PRUNED_FILL if node["aggregate"]["pruned"] else AGGREGATE_FILL
+        shape = "box"
+    elif node.get("value") is not None:
+        label = str(node["value"])
+        # Frunzele: alb simplu sau gri deschis
+        fillcolor = "#ffffff"
+        shape = "ellipse"  # MODIFICAT: Frunzele rotunde, la fel ca nodurile interne
+    else:
+        label = node["node_type"]  # "MIN", "MAX" sau "CHANCE"
+        shape = "ellipse"  # Nodurile interne ca cercuri/elipse
+
+        # Culori distincte pentru MIN vs MAX vs CHANCE
+        if node["node_type"] == "MAX":
+            fillcolor = "#A0D8F1"  # Albastru deschis pentru MAX
+        elif node["node_type"] == "CHANCE":
+            fillcolor = "#C8E6C9"  # Verde deschis pentru nodurile de șansă
+        else:
+            fillcolor = "#FFD6A5"  # Portocaliu deschis pentru MIN
+
+    return label, fillcolor, shape
+
+
+def _render_graphviz_png(tree_dict) -> bytes:
     dot = Digraph(format="png")
     # Setări implicite pentru noduri
     dot.attr("node", shape="ellipse", style="filled", fontname="Arial", fontsize="12")
@@ -10,25 +74,7 @@ def generate_tree_image_base64(tree_dict):
     def add_nodes_edges(node):
         # Identificatorul unic rămâne name-ul intern (R, R1, R2...) pentru structura grafului
         node_id = node["name"]
-        
-        # Determinăm eticheta vizuală (Label)
-        # Dacă are valoare (frunză), afișăm valoarea.
-        # Dacă este nod intern, afișăm tipul (MIN sau MAX).
-        if node.get("value") is not None:
-            label = str(node["value"])
-            # Frunzele: alb simplu sau gri deschis
-            fillcolor = "#ffffff"
-            shape = "ellipse" # MODIFICAT: Frunzele rotunde, la fel ca nodurile interne
-        else:
-            label = node["node_type"] # "MIN" sau "MAX"
-            shape = "ellipse" # Nodurile interne ca cercuri/elipse
-            
-            # Culori distincte pentru MIN vs MAX
-            if node["node_type"] == "MAX":
-                fillcolor = "#A0D8F1" # Albastru deschis pentru MAX
-            else:
-                fillcolor = "#FFD6A5" # Portocaliu deschis pentru MIN
-
+        label, fillcolor, shape = _node_style(node)
         dot.node(node_id, label=label, fillcolor=fillcolor, shape=shape)
 
         for child in node.get("children", []):
@@ -36,5 +82,120 @@ def generate_tree_image_base64(tree_dict):
             add_nodes_edges(child)
 
     add_nodes_edges(tree_dict)
-    img_bytes = dot.pipe(format="png")
-    return base64.b64encode(img_bytes).decode("utf-8")
\ No newline at end of file
+    return dot.pipe(format="png")
+
+
+def _layout_tree(tree_dict) -> Tuple[List[Tuple[Dict, float, int]], List[Tuple[int, int]]]:
+    """
+    Layout ordonat (tidy) calculat iterativ, în timp liniar:
+    frunzele sunt așezate consecutiv de la stânga la dreapta, iar fiecare nod
+    intern este centrat deasupra primului și ultimului copil.
+    Pentru arborii MinMax (toate frunzele pe ultimul nivel) lățimea rezultată
+    este minimă, iar subarborii nu se suprapun niciodată.
+
+    Returnează lista (nod, x, adâncime) în pre-ordine și muchiile (părinte, copil) ca indici.
+    """
+    nodes: List[Dict] = []
+    depths: List[int] = []
+    x_positions: List[float] = []
+    children_ids: List[List[int]] = []
+    edges: List[Tuple[int, int]] = []
+    next_leaf_x = 0
+
+    # Pre-ordine iterativă: (nod, adâncime, indexul părintelui)
+    stack = [(tree_dict, 0, -1)]
+    while stack:
+        node, depth, parent = stack.pop()
+        index = len(nodes)
+        nodes.append(node)
+        depths.append(depth)
+        x_positions.append(0.0)
+        children_ids.append([])
+        if parent >= 0:
+            edges.append((parent, index))
+            children_ids[parent].append(index)
+
+        children = node.get("children") or []
+        if not children:
+            x_positions[index] = next_leaf_x
+            next_leaf_x += 1
+        for child in reversed(children):
+            stack.append((child, depth + 1, index))
+
+    # Post-ordine: în pre-ordine copiii au indici mai mari decât părintele
+    for index in range(len(nodes) - 1, -1, -1):
+        kids = children_ids[index]
+        if kids:
+            x_positions[index] = (x_positions[kids[0]] + x_positions[kids[-1]]) / 2
+
+    return list(zip(nodes, x_positions, depths)), edges
+
+
+def generate_tree_svg(tree_dict) -> str:
+    """Randare SVG în Python pur (fără subprocese), cu aceleași culori și forme ca Graphviz."""
+    placed, edges = _layout_tree(tree_dict)
+
+    def center(x: float, depth: int) -> Tuple[float, float]:
+        return (SVG_MARGIN + SVG_NODE_RX + x * SVG_H_SPACING,
+                SVG_MARGIN + SVG_NODE_RY + depth * SVG_V_SPACING)
+
+    max_x = max(x for _, x, _ in placed)
+    max_depth = max(depth for _, _, depth in placed)
+    width, height = center(max_x, max_depth)
+    width += SVG_NODE_RX + SVG_MARGIN
+    height += SVG_NODE_RY + SVG_MARGIN
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+        f'viewBox="0 0 {width:.0f} {height:.0f}">',
+        '<g stroke="#000000" stroke-width="1">',
+    ]
+    for parent, child in edges:
+        px, py = center(placed[parent][1], placed[parent][2])
+        cx, cy = center(placed[child][1], placed[child][2])
+        parts.append(f'<line x1="{px:.1f}" y1="{py + SVG_NODE_RY:.1f}" x2="{cx:.1f}" y2="{cy - SVG_NODE_RY:.1f}"/>')
+    parts.append('</g>')
+
+    parts.append('<g font-family="Arial" font-size="12" text-anchor="middle" dominant-baseline="central">')
+    for node, x, depth in placed:
+        label, fillcolor, _ = _node_style(node)
+        cx, cy = center(x, depth)
+        if node.get("aggregate"):
+            # Subarbore rezumat: dreptunghi (punctat dacă a fost tăiat); se extinde prin parametrul `expand`
+            dash = ' stroke-dasharray="4 2"' if node["aggregate"]["pruned"] else ""
+            lines = _aggregate_lines(node)
+            top = cy - SVG_AGGREGATE_LINE_HEIGHT * (len(lines) - 1) / 2
+            parts.append(
+                f'<rect x="{cx - SVG_AGGREGATE_HALF_WIDTH:.1f}" y="{cy - SVG_NODE_RY:.1f}" '
+                f'width="{2 * SVG_AGGREGATE_HALF_WIDTH}" height="{2 * SVG_NODE_RY}" '
+                f'fill="{fillcolor}" stroke="#000000"{dash}/>'
+                f'<text x="{cx:.1f}" y="{top:.1f}" font-size="{SVG_AGGREGATE_FONT_SIZE}">'
+                + "".join(
+                    f'<tspan x="{cx:.1f}" dy="{0 if i == 0 else SVG_AGGREGATE_LINE_HEIGHT}">{escape(line)}</tspan>'
+                    for i, line in enumerate(lines))
+                + '</text>'
+            )
+            continue
+        parts.append(
+            f'<ellipse cx="{cx:.1f}" cy="{cy:.1f}" rx="{SVG_NODE_RX}" ry="{SVG_NODE_RY}" '
+            f'fill="{fillcolor}" stroke="#000000"/>'
+            f'<text x="{cx:.1f}" y="{cy:.1f}">{escape(label)}</text>'
+        )
+    parts.append('</g>')
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def render_tree_image(tree_dict, image_format: str = IMAGE_FORMAT_SVG) -> Tuple[bytes, str]:
+    """
+    Randează arborele în formatul cerut și returnează (octeți, tip MIME).
+    SVG-ul este generat în proces; PNG-ul folosește Graphviz (`dot`) ca variantă alternativă.
+    """
+    if image_format == IMAGE_FORMAT_PNG:
+        return _render_graphviz_png(tree_dict), IMAGE_MIME_TYPES[IMAGE_FORMAT_PNG]
+    return generate_tree_svg(tree_dict).encode("utf-8"), IMAGE_MIME_TYPES[IMAGE_FORMAT_SVG]
+
+
+def generate_tree_image_base64(tree_dict, image_format: str = IMAGE_FORMAT_PNG):
+    img_bytes, _ = render_tree_image(tree_dict, image_format)
+    return base64.b64encode(img_bytes).decode("utf-8")
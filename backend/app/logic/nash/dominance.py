@@ -0,0 +1,169 @@
+"""
+Eliminarea iterată a strategiilor dominate (IESDS), ca etapă de preprocesare.
+
+Dominanța este între strategii pure: rândul i domină strict rândul k dacă P1 câștigă strict
+mai mult cu i pe fiecare coloană rămasă; slab, dacă nu câștigă mai puțin nicăieri și câștigă
+mai mult pe cel puțin o coloană. Analog pentru coloane, cu plățile lui P2.
+
+Indexul de candidați: pentru fiecare jucător se păstrează perechile (dominator, dominat) care
+încalcă dominanța pe cel mult NASH_DOMINANCE_SLACK coloane rămase, cu numărul exact de încălcări
+și de coloane strict mai bune. Eliminarea unei strategii a adversarului doar scade aceste
+contoare (O(perechi)); o pereche din afara indexului poate deveni dominanță abia după
+NASH_DOMINANCE_SLACK + 1 eliminări, așa că indexul se reconstruiește doar atunci (sau direct,
+când o rundă elimină mai multe strategii). Reconstrucția filtrează perechile coloană cu coloană,
+deci pe jocurile fără multe dominanțe costul real scade rapid sub r^2 · c.
+"""
+from typing import List
+
+import numpy as np
+
+# Câte încălcări poate avea o pereche ca să rămână candidat (între două reconstrucții)
+NASH_DOMINANCE_SLACK = 2
+
+NASH_PLAYER_ROWS = 1
+NASH_PLAYER_COLS = 2
+
+
+class Elimination:
+    """O strategie eliminată: jucătorul (1 = rând, 2 = coloană), indexul ei și cine o domină."""
+
+    def __init__(self, player: int, index: int, dominated_by: int, strict: bool):
+        self.player = player
+        self.index = index
+        self.dominated_by = dominated_by
+        self.strict = strict
+
+    def to_dict(self):
+        return {
+            "player": self.player,
+            "index": self.index,
+            "dominated_by": self.dominated_by,
+            "strict": self.strict,
+        }
+
+
+class DominanceResult:
+    """Strategiile rămase (indici în jocul original, crescător) și ordinea eliminărilor."""
+
+    def __init__(self, rows: List[int], cols: List[int], eliminations: List[Elimination]):
+        self.rows = rows
+        self.cols = cols
+        self.eliminations = eliminations
+
+    def reduce(self, p1: np.ndarray, p2: np.ndarray):
+        """Plățile jocului redus."""
+        grid = np.ix_(self.rows, self.cols)
+        return p1[grid], p2[grid]
+
+
+def expand_strategy(strategy, kept: List[int], size: int) -> List[float]:
+    """O strategie mixtă a jocului redus, extinsă cu probabilitate 0 pe strategiile eliminate."""
+    full = [0.0] * size
+    for index, probability in zip(kept, strategy):
+        full[index] = probability
+    return full
+
+
+class _DominanceIndex:
+    """Candidații de dominanță ai unui jucător; `payoffs` are forma (strategii proprii x ale adversarului)."""
+
+    def __init__(self, payoffs: np.ndarray):
+        self.payoffs = payoffs
+        self.dominators = np.empty(0, dtype=np.int32)
+        self.dominated = np.empty(0, dtype=np.int32)
+        self.violations = np.empty(0, dtype=np.int16)
+        self.better = np.empty(0, dtype=np.int16)
+        # Eliminări ale adversarului de la ultima reconstrucție (None = index neconstruit)
+        self.stale = None
+
+    def rebuild(self, own_alive: np.ndarray, opponent_alive: np.ndarray):
+        own = np.flatnonzero(own_alive).astype(np.int32)
+        dominators = np.repeat(own, len(own))
+        dominated = np.tile(own, len(own))
+        distinct = dominators != dominated
+        dominators, dominated = dominators[distinct], dominated[distinct]
+        violations = np.zeros(len(dominators), dtype=np.int16)
+        better = np.zeros(len(dominators), dtype=np.int16)
+
+        for column in np.flatnonzero(opponent_alive):
+            if len(dominators) == 0:
+                break
+            values = self.payoffs[:, column]
+            dominator_values, dominated_values = values[dominators], values[dominated]
+            violations += dominator_values < dominated_values
+            better += dominator_values > dominated_values
+            keep = violations <= NASH_DOMINANCE_SLACK
+            if not keep.all():
+                dominators, dominated = dominators[keep], dominated[keep]
+                violations, better = violations[keep], better[keep]
+
+        self.dominators, self.dominated = dominators, dominated
+        self.violations, self.better = violations, better
+        self.stale = 0
+
+    def remove_opponents(self, columns: List[int]):
+        if self.stale is None:
+            return
+        self.stale += len(columns)
+        if self.stale > NASH_DOMINANCE_SLACK:
+            return  # indexul se reconstruiește oricum la următoarea căutare
+        for column in columns:
+            values = self.payoffs[:, column]
+            dominator_values, dominated_values = values[self.dominators], values[self.dominated]
+            self.violations -= dominator_values < dominated_values
+            self.better -= dominator_values > dominated_values
+
+    def find(self, own_alive: np.ndarray, opponent_alive: np.ndarray, weak: bool):
+        """Strategiile dominate (crescător), fiecare cu un dominator (strict, dacă există) și tipul dominanței."""
+        if self.stale is None or self.stale > NASH_DOMINANCE_SLACK:
+            self.rebuild(own_alive, opponent_alive)
+        opponents = int(opponent_alive.sum())
+        alive = own_alive[self.dominators] & own_alive[self.dominated] & (self.violations == 0)
+        strict = alive & (self.better == opponents)
+        found = strict | (alive & (self.better > 0)) if weak else strict
+
+        pairs = np.flatnonzero(found)
+        # Pentru fiecare strategie dominată: întâi dominanțele stricte, apoi dominatorul cel mai mic
+        order = np.lexsort((self.dominators[pairs], ~strict[pairs], self.dominated[pairs]))
+        pairs = pairs[order]
+        first = np.ones(len(pairs), dtype=bool)
+        first[1:] = self.dominated[pairs][1:] != self.dominated[pairs][:-1]
+        pairs = pairs[first]
+        return self.dominated[pairs], self.dominators[pairs], strict[pairs]
+
+
+def iterated_elimination(p1: np.ndarray, p2: np.ndarray, weak: bool = False) -> DominanceResult:
+    """
+    Elimină iterativ rândurile și coloanele dominate (strict; cu `weak=True`, și slab).
+    La fiecare rundă se elimină toate rândurile dominate, apoi toate coloanele dominate
+    (tranzitivitatea garantează că rămâne mereu un dominator nedominat).
+    Eliminarea strictă păstrează toate echilibrele Nash; cea slabă poate pierde unele, iar
+    rezultatul ei depinde de ordine.
+    """
+    p1, p2 = np.asarray(p1), np.asarray(p2)
+    rows_alive = np.ones(p1.shape[0], dtype=bool)
+    cols_alive = np.ones(p1.shape[1], dtype=bool)
+    row_index = _DominanceIndex(p1)
+    col_index = _DominanceIndex(p2.T)
+    eliminations = []
+
+    changed = True
+    while changed:
+        changed = False
+        for player, index, other, own_alive, opponent_alive in (
+                (NASH_PLAYER_ROWS, row_index, col_index, rows_alive, cols_alive),
+                (NASH_PLAYER_COLS, col_index, row_index, cols_alive, rows_alive)):
+            if own_alive.sum() <= 1:
+                continue
+            dominated, dominators, strict = index.find(own_alive, opponent_alive, weak)
+            own_alive[dominated] = False
+            other.remove_opponents(dominated.tolist())
+            for k, i, is_strict in zip(dominated.tolist(), dominators.tolist(), strict.tolist()):
+                eliminations.append(Elimination(player, k, i, is_strict))
+            changed = changed or len(dominated) > 0
+
+    return DominanceResult(
+        rows=np.flatnonzero(rows_alive).tolist(),
+        cols=np.flatnonzero(cols_alive).tolist(),
+        eliminations=eliminations,
+    )
@@ -0,0 +1,148 @@
+"""
+Dinamici evolutive pe jocuri bimatriceale: replicator și cel mai bun răspuns, pe un lot de
+populații inițiale simulate simultan.
+
+Starea lotului este (x, y): x de forma (populații, rows), y de forma (populații, cols), fiecare
+linie fiind o distribuție. Plățile sunt aduse în [0, 1] (o transformare afină nu schimbă
+echilibrele), iar un pas costă două produse matriciale pentru tot lotul:
+  replicator:        x <- x · (1 + h · (f - x·f)),  f = A y  (rămâne pe simplex pentru h <= 1)
+  best_response:     x <- (1 - h) · x + h · BR(y)   (BR = strategia pură cea mai bună, indexul
+                     cel mai mic la egalitate)
+și analog pentru y, cu plățile lui P2.
+
+Istoricul nu se păstrează: `iter_dynamics` emite eșantioane din câteva traiectorii la fiecare
+`stride` pași, iar memoria rămâne O(populații · (rows + cols)) oricât de lungă e simularea.
+La final, fiecare traiectorie staționară (pas mai mic decât toleranța) cu regret aproape nul
+pentru ambii jucători este un echilibru Nash: pur dacă stă într-un vârf al simplexului, altfel mixt.
+"""
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+
+NASH_DYNAMICS_REPLICATOR = "replicator"
+NASH_DYNAMICS_BEST_RESPONSE = "best_response"
+NASH_DYNAMICS_RULES = (NASH_DYNAMICS_REPLICATOR, NASH_DYNAMICS_BEST_RESPONSE)
+
+# O traiectorie este staționară dacă nicio probabilitate nu se mai mișcă cu atât într-un pas
+NASH_DYNAMICS_TOLERANCE = 1e-7
+# Regretul maxim (pe plățile aduse în [0, 1]) al unui punct staționar acceptat ca echilibru
+NASH_DYNAMICS_REGRET_TOLERANCE = 1e-3
+# O strategie cu probabilitatea cel puțin 1 - atât este considerată pură
+NASH_DYNAMICS_VERTEX_TOLERANCE = 1e-3
+# Limita de pași a unei simulări
+NASH_DYNAMICS_MAX_STEPS = 100_000
+# Echilibrele mixte distincte se raportează doar pentru jocurile cu cel mult atâtea celule
+NASH_DYNAMICS_REPORT_MAX_CELLS = 64
+# Starea lotului: cel mult atâtea probabilități (populații x (rows + cols)), ~32 MB în float64
+NASH_DYNAMICS_MAX_STATE = 1 << 22
+
+
+def _normalized(payoffs: np.ndarray) -> np.ndarray:
+    payoffs = np.asarray(payoffs, dtype=np.float64)
+    low, high = payoffs.min(), payoffs.max()
+    return (payoffs - low) / (high - low) if high > low else np.zeros_like(payoffs)
+
+
+def _best_response(fitness: np.ndarray) -> np.ndarray:
+    response = np.zeros_like(fitness)
+    response[np.arange(len(fitness)), fitness.argmax(axis=1)] = 1.0
+    return response
+
+
+def _step(state: np.ndarray, fitness: np.ndarray, rule: str, step_size: float) -> np.ndarray:
+    if rule == NASH_DYNAMICS_REPLICATOR:
+        average = np.einsum("ij,ij->i", state, fitness)[:, None]
+        new_state = state * (1 + step_size * (fitness - average))
+    else:
+        new_state = (1 - step_size) * state + step_size * _best_response(fitness)
+    # Renormalizare: erorile de rotunjire nu se acumulează pe simulări lungi
+    return new_state / new_state.sum(axis=1, keepdims=True)
+
+
+def max_populations(rows: int, cols: int) -> int:
+    """Câte populații încap în NASH_DYNAMICS_MAX_STATE pentru un joc rows x cols."""
+    return max(1, NASH_DYNAMICS_MAX_STATE // (rows + cols))
+
+
+def iter_dynamics(p1: np.ndarray, p2: np.ndarray, rule: str = NASH_DYNAMICS_REPLICATOR,
+                  populations: int = 32, steps: int = 1000, step_size: float = 0.5,
+                  stride: int = 10, sampled: int = 4, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Simulează `populations` traiectorii pornind din stări aleatoare (uniform pe simplex,
+    deterministe din `seed`) și emite evenimente:
+      sample - la fiecare `stride` pași: pasul și stările primelor `sampled` traiectorii
+      done   - rezumatul final (vezi `_summarize`)
+    Simularea se oprește mai devreme dacă toate traiectoriile sunt staționare.
+    """
+    if rule not in NASH_DYNAMICS_RULES:
+        raise ValueError(f"Dinamica trebuie să fie una dintre {', '.join(NASH_DYNAMICS_RULES)}.")
+    A, B = _normalized(p1), _normalized(p2)
+    rows, cols = A.shape
+    populations = max(1, min(populations, max_populations(rows, cols)))
+    steps = max(0, min(steps, NASH_DYNAMICS_MAX_STEPS))
+    step_size = min(max(step_size, 0.0), 1.0)
+    stride = max(1, stride)
+    sampled = max(0, min(sampled, populations))
+
+    rng = np.random.default_rng(seed)
+    x = rng.dirichlet(np.ones(rows), size=populations)
+    y = rng.dirichlet(np.ones(cols), size=populations)
+    moved = np.full(populations, np.inf)
+
+    step = 0
+    while step < steps and moved.max() >= NASH_DYNAMICS_TOLERANCE:
+        row_fitness, col_fitness = y @ A.T, x @ B  # f_x = A y, f_y = B^T x (pe linii)
+        new_x = _step(x, row_fitness, rule, step_size)
+        new_y = _step(y, col_fitness, rule, step_size)
+        moved = np.maximum(np.abs(new_x - x).max(axis=1), np.abs(new_y - y).max(axis=1))
+        x, y = new_x, new_y
+        step += 1
+        if sampled and step % stride == 0:
+            yield {"t": "sample", "step": step,
+                   "x": x[:sampled].round(4).tolist(), "y": y[:sampled].round(4).tolist()}
+
+    yield {"t": "done", "steps": step, **_summarize(A, B, x, y, moved)}
+
+
+def _summarize(A: np.ndarray, B: np.ndarray, x: np.ndarray, y: np.ndarray, moved: np.ndarray) -> Dict[str, Any]:
+    """
+    Clasificarea vectorizată a stărilor finale:
+      pure   - echilibrele pure atinse și câte traiectorii converg la fiecare
+      mixed  - câte traiectorii converg la un echilibru mixt (și, pentru jocurile mici,
+               echilibrele distincte rotunjite la 2 zecimale)
+      rest   - puncte staționare care nu sunt echilibre (ex. vârfuri ale simplexului)
+      not_converged - traiectorii încă în mișcare după ultimul pas (ex. cicluri)
+    """
+    row_fitness, col_fitness = y @ A.T, x @ B
+    row_regret = row_fitness.max(axis=1) - np.einsum("ij,ij->i", x, row_fitness)
+    col_regret = col_fitness.max(axis=1) - np.einsum("ij,ij->i", y, col_fitness)
+    converged = moved < NASH_DYNAMICS_TOLERANCE
+    equilibrium = converged & (np.maximum(row_regret, col_regret) <= NASH_DYNAMICS_REGRET_TOLERANCE)
+    vertex = ((x.max(axis=1) >= 1 - NASH_DYNAMICS_VERTEX_TOLERANCE)
+              & (y.max(axis=1) >= 1 - NASH_DYNAMICS_VERTEX_TOLERANCE))
+    pure, mixed = equilibrium & vertex, equilibrium & ~vertex
+
+    profiles, counts = np.unique(np.stack([x[pure].argmax(axis=1), y[pure].argmax(axis=1)], axis=1),
+                                 axis=0, return_counts=True)
+    summary = {
+        "pure": [{"profile": profile, "count": count}
+                 for profile, count in zip(profiles.tolist(), counts.tolist())],
+        "mixed": int(mixed.sum()),
+        "rest": int((converged & ~equilibrium).sum()),
+        "not_converged": int((~converged).sum()),
+    }
+    if A.size <= NASH_DYNAMICS_REPORT_MAX_CELLS and mixed.any():
+        strategies, counts = np.unique(np.hstack([x[mixed], y[mixed]]).round(2), axis=0, return_counts=True)
+        summary["mixed_equilibria"] = [
+            {"row_strategy": s[:A.shape[0]], "col_strategy": s[A.shape[0]:], "count": count}
+            for s, count in zip(strategies.tolist(), counts.tolist())
+        ]
+    return summary
+
+
+def run_dynamics(p1: np.ndarray, p2: np.ndarray, **options) -> Optional[Dict[str, Any]]:
+    """Rezumatul final al lui `iter_dynamics`, fără eșantioane."""
+    summary = None
+    for event in iter_dynamics(p1, p2, **{**options, "sampled": 0}):
+        summary = event
+    return summary
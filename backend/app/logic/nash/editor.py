@@ -0,0 +1,124 @@
+"""
+Modul editor: echilibrele Nash pure actualizate incremental când se schimbă o celulă.
+
+`BestResponseIndex` păstrează maximul plăților lui P1 pe fiecare coloană și al lui P2 pe
+fiecare rând. O celulă (r, c) este echilibru dacă își atinge ambele maxime, deci o modificare
+a celulei (r, c) poate schimba doar maximul coloanei c și al rândului r, adică doar starea
+celulelor din coloana c și din rândul r: actualizarea costă O(rows + cols).
+
+Sesiunile de editare sunt păstrate în memorie, într-un cache LRU limitat ca dimensiune
+totală (ca imaginile MinMax); o sesiune evacuată trebuie pur și simplu recreată.
+"""
+import secrets
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.logic.nash.packed import NASH_PAYOFF_DTYPE, PackedNashMatrix
+
+# Memoria totală a sesiunilor de editare (o sesiune 2000 x 2000 ocupă ~20 MB)
+NASH_EDITOR_MAX_BYTES = 128 * 1024 * 1024
+
+NASH_PAYOFF_MIN = int(np.iinfo(NASH_PAYOFF_DTYPE).min)
+NASH_PAYOFF_MAX = int(np.iinfo(NASH_PAYOFF_DTYPE).max)
+
+
+class CellUpdate:
+    """Rezultatul unei modificări: echilibrele apărute și cele dispărute."""
+
+    def __init__(self, added: List[Tuple[int, int]], removed: List[Tuple[int, int]]):
+        self.added = added
+        self.removed = removed
+
+
+class BestResponseIndex:
+    """Maximele de cel mai bun răspuns și mulțimea echilibrelor pure ale unei matrici editabile."""
+
+    def __init__(self, matrix: PackedNashMatrix):
+        # Copie proprie: celulele se modifică pe loc
+        self.matrix = PackedNashMatrix(matrix.payoffs.copy())
+        p1, p2 = self.matrix.p1, self.matrix.p2
+        self.col_max = p1.max(axis=0)  # cel mai bun răspuns al lui P1 la fiecare coloană
+        self.row_max = p2.max(axis=1)  # cel mai bun răspuns al lui P2 la fiecare rând
+        self.is_equilibrium = (p1 == self.col_max) & (p2 == self.row_max[:, None])
+        rows, cols = np.nonzero(self.is_equilibrium)
+        self._equilibria: Set[Tuple[int, int]] = set(zip(rows.tolist(), cols.tolist()))
+
+    @property
+    def nbytes(self) -> int:
+        return (self.matrix.payoffs.nbytes + self.col_max.nbytes + self.row_max.nbytes
+                + self.is_equilibrium.nbytes)
+
+    def equilibria(self) -> List[Tuple[int, int]]:
+        """Echilibrele pure, în ordinea parcurgerii pe rânduri (ca `solve_pure_nash`)."""
+        return sorted(self._equilibria)
+
+    def update(self, row: int, col: int, p1_payoff: int, p2_payoff: int) -> CellUpdate:
+        p1, p2 = self.matrix.p1, self.matrix.p2
+        p1[row, col] = p1_payoff
+        p2[row, col] = p2_payoff
+        self.col_max[col] = p1[:, col].max()
+        self.row_max[row] = p2[row].max()
+
+        column_state = (p1[:, col] == self.col_max[col]) & (p2[:, col] == self.row_max)
+        row_state = (p1[row] == self.col_max) & (p2[row] == self.row_max[row])
+
+        changed_rows = np.flatnonzero(self.is_equilibrium[:, col] != column_state).tolist()
+        changed_cols = np.flatnonzero(self.is_equilibrium[row] != row_state).tolist()
+        added, removed = set(), set()
+        # Celula (row, col) poate apărea în ambele liste; mulțimile elimină dublura
+        for cell, state in ([((r, col), column_state[r]) for r in changed_rows]
+                            + [((row, c), row_state[c]) for c in changed_cols]):
+            if state:
+                self._equilibria.add(cell)
+                added.add(cell)
+            else:
+                self._equilibria.discard(cell)
+                removed.add(cell)
+        self.is_equilibrium[:, col] = column_state
+        self.is_equilibrium[row] = row_state
+        return CellUpdate(added=sorted(added), removed=sorted(removed))
+
+
+class EditorSession:
+    def __init__(self, index: BestResponseIndex):
+        self.index = index
+        self.lock = threading.Lock()
+
+
+class EditorSessionStore:
+    """Sesiuni de editare, într-un cache LRU thread-safe limitat de memoria indexurilor."""
+
+    def __init__(self, max_bytes: int = NASH_EDITOR_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items: "OrderedDict[str, EditorSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def create(self, matrix: PackedNashMatrix) -> Tuple[str, EditorSession]:
+        session = EditorSession(BestResponseIndex(matrix))
+        session_id = secrets.token_hex(16)
+        size = session.index.nbytes
+        with self._lock:
+            self._items[session_id] = session
+            self.total_bytes += size
+            # Cea mai nouă sesiune rămâne chiar dacă singură depășește limita
+            while self.total_bytes > self.max_bytes and len(self._items) > 1:
+                _, evicted = self._items.popitem(last=False)
+                self.total_bytes -= evicted.index.nbytes
+        return session_id, session
+
+    def get(self, session_id: str) -> Optional[EditorSession]:
+        with self._lock:
+            session = self._items.get(session_id)
+            if session is not None:
+                self._items.move_to_end(session_id)
+            return session
+
+
+nash_editor_sessions = EditorSessionStore()
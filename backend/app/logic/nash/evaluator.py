@@ -1,11 +1,34 @@
-from typing import List, Tuple
-from app.schemas.nash_schemas import NashAnswerRequest, NashEvaluationResponse
+from typing import List, Optional, Tuple
 
+import numpy as np
 
-def evaluate_nash(user_answer: NashAnswerRequest, correct_equilibria: List[Tuple[int, int]]) -> NashEvaluationResponse:
+from app.logic.nash.dominance import DominanceResult, NASH_PLAYER_ROWS
+from app.logic.nash.extensive import SubgamePerfectEquilibrium
+from app.logic.nash.mixed import MixedEquilibrium
+from app.logic.nash.zero_sum import ZeroSumSolution
+from app.schemas.nash_schemas import (
+    NashAnswerRequest,
+    NashEvaluationResponse,
+    NashExtensiveAnswerRequest,
+    NashIesdsAnswerRequest,
+    NashMixedAnswerRequest,
+    NashTensorAnswerRequest,
+    NashZeroSumAnswerRequest
+)
+
+# Toleranța răspunsurilor mixte, ca fracțiune din intervalul plăților:
+# un jucător poate câștiga prin deviere cel mult atât (rotunjirea probabilităților la 2 zecimale)
+NASH_MIXED_TOLERANCE = 0.02
+# Valoarea unui joc de sumă nulă se dă cu două zecimale
+NASH_ZERO_SUM_VALUE_TOLERANCE = 0.01
+
+
+def evaluate_nash(user_answer: NashAnswerRequest, correct_equilibria: List[Tuple[int, int]],
+                  mixed_equilibrium: Optional[MixedEquilibrium] = None) -> NashEvaluationResponse:
     """
     Compares the user's answer against the calculated correct equilibria.
     Returns a structured NashEvaluationResponse.
+    When there is no pure equilibrium, `mixed_equilibrium` (if given) is mentioned in the explanation.
     """
     has_eq_correct = (len(correct_equilibria) > 0)
     percentage = 0
@@ -44,8 +67,237 @@ def evaluate_nash(user_answer: NashAnswerRequest, correct_equilibria: List[Tuple
             percentage = 0
             explanation = f"Greșit. Există cel puțin un echilibru la: {correct_equilibria}"
 
+    if not has_eq_correct and mixed_equilibrium is not None:
+        rounded = mixed_equilibrium.rounded()
+        explanation += (
+            f" Există însă un echilibru în strategii mixte: Jucătorul 1 {rounded['row_strategy']}, "
+            f"Jucătorul 2 {rounded['col_strategy']}."
+        )
+
+    return NashEvaluationResponse(
+        percentage=percentage,
+        correct_answer=correct_equilibria,
+        explanation=explanation
+    )
+
+
+def evaluate_tensor_nash(user_answer: NashTensorAnswerRequest,
+                         correct_equilibria: List[Tuple[int, ...]]) -> NashEvaluationResponse:
+    """Ca `evaluate_nash`, pentru un profil cu câte o strategie per jucător."""
+    if not user_answer.has_equilibrium:
+        if correct_equilibria:
+            percentage = 0
+            explanation = f"Greșit. Există cel puțin un echilibru la: {correct_equilibria}"
+        else:
+            percentage = 100
+            explanation = "Corect! Nu există niciun Echilibru Nash Pur."
+    elif not correct_equilibria:
+        percentage = 0
+        explanation = "Greșit. Nu există niciun Echilibru Nash Pur în acest joc."
+    elif not user_answer.equilibrium_profile:
+        percentage = 50
+        explanation = "Parțial corect. Există echilibru, dar nu ați specificat profilul de strategii."
+    else:
+        profile = tuple(user_answer.equilibrium_profile)
+        if profile in correct_equilibria:
+            percentage = 100
+            explanation = f"Corect! Profilul {profile} este un Echilibru Nash."
+        else:
+            percentage = 50
+            explanation = (
+                f"Parțial corect. Există un echilibru, dar profilul {profile} "
+                f"este greșit. Soluții posibile: {correct_equilibria}"
+            )
+
     return NashEvaluationResponse(
         percentage=percentage,
         correct_answer=correct_equilibria,
         explanation=explanation
-    )
\ No newline at end of file
+    )
+
+
+def evaluate_extensive(user_answer: NashExtensiveAnswerRequest, equilibrium: SubgamePerfectEquilibrium,
+                       normal_form_equilibria: Optional[int] = None) -> NashEvaluationResponse:
+    """
+    Drumul corect primește 100%; un alt drum care duce la aceleași plăți, 50%.
+    `normal_form_equilibria` (dacă este dat) este numărul de echilibre Nash pure ale formei normale.
+    """
+    game = equilibrium.game
+    correct_path = equilibrium.path()
+    payoffs = equilibrium.payoffs
+
+    # Frunza la care duce drumul propus (None dacă drumul nu există în arbore)
+    node = 0
+    for action in user_answer.path:
+        if game.arity[node] == 0 or not 0 <= action < game.arity[node]:
+            node = None
+            break
+        node = int(game.offsets[node]) + action
+    reached = None
+    if node is not None and game.arity[node] == 0:
+        reached = game.leaf_payoffs[game.leaf_indices()[node]].tolist()
+
+    if user_answer.path == correct_path:
+        percentage = 100
+        explanation = f"Corect! Drumul {correct_path} duce la plățile {payoffs}."
+    elif reached == payoffs:
+        percentage = 50
+        explanation = (
+            f"Parțial corect. Plățile {payoffs} sunt corecte, dar inducția inversă "
+            f"(cu indexul cel mai mic la egalitate) alege drumul {correct_path}."
+        )
+    else:
+        percentage = 0
+        explanation = f"Greșit. Echilibrul perfect în subjocuri urmează drumul {correct_path}, cu plățile {payoffs}."
+
+    if normal_form_equilibria is not None:
+        explanation += (
+            f" Forma normală a jocului are {normal_form_equilibria} echilibre Nash pure; "
+            f"nu toate sunt perfecte în subjocuri."
+        )
+
+    return NashEvaluationResponse(
+        percentage=percentage,
+        correct_answer={"path": correct_path, "payoffs": payoffs},
+        explanation=explanation
+    )
+
+
+def _is_distribution(strategy: np.ndarray, size: int) -> bool:
+    return len(strategy) == size and (strategy >= -NASH_MIXED_TOLERANCE).all() and \
+        abs(strategy.sum() - 1) <= NASH_MIXED_TOLERANCE
+
+
+def _mixed_tolerance(p1: np.ndarray, p2: np.ndarray) -> float:
+    return NASH_MIXED_TOLERANCE * max(1, int(max(p1.max(), p2.max()) - min(p1.min(), p2.min())))
+
+
+def evaluate_mixed_nash(user_answer: NashMixedAnswerRequest, p1: np.ndarray, p2: np.ndarray,
+                        reference: MixedEquilibrium) -> NashEvaluationResponse:
+    """
+    Notează o pereche de strategii mixte, fără a cere un anumit echilibru (pot exista mai multe):
+    50% dacă strategia Jucătorului 1 este un cel mai bun răspuns la cea a Jucătorului 2
+    (în limita toleranței) și 50% pentru situația simetrică.
+    """
+    rows, cols = p1.shape
+    x = np.asarray(user_answer.row_strategy, dtype=np.float64)
+    y = np.asarray(user_answer.col_strategy, dtype=np.float64)
+    correct_answer = reference.rounded()
+
+    if not _is_distribution(x, rows) or not _is_distribution(y, cols):
+        return NashEvaluationResponse(
+            percentage=0,
+            correct_answer=correct_answer,
+            explanation=(
+                f"Greșit. Fiecare strategie trebuie să fie o distribuție de probabilitate "
+                f"({rows} valori pentru Jucătorul 1, {cols} pentru Jucătorul 2, cu suma 1)."
+            )
+        )
+
+    tolerance = _mixed_tolerance(p1, p2)
+    row_payoffs, col_payoffs = p1 @ y, x @ p2
+    row_regret = float(row_payoffs.max() - x @ row_payoffs)
+    col_regret = float(col_payoffs.max() - col_payoffs @ y)
+
+    percentage = 0
+    explanation = ""
+    if row_regret <= tolerance:
+        percentage += 50
+        explanation += "Strategia Jucătorului 1 este un cel mai bun răspuns. "
+    else:
+        explanation += f"Jucătorul 1 poate câștiga încă {row_regret:.2f} schimbând strategia. "
+    if col_regret <= tolerance:
+        percentage += 50
+        explanation += "Strategia Jucătorului 2 este un cel mai bun răspuns."
+    else:
+        explanation += f"Jucătorul 2 poate câștiga încă {col_regret:.2f} schimbând strategia."
+    if percentage < 100:
+        explanation += (
+            f" Un echilibru corect: Jucătorul 1 {correct_answer['row_strategy']}, "
+            f"Jucătorul 2 {correct_answer['col_strategy']}."
+        )
+
+    return NashEvaluationResponse(
+        percentage=percentage,
+        correct_answer=correct_answer,
+        explanation=explanation
+    )
+
+
+def evaluate_zero_sum(user_answer: NashZeroSumAnswerRequest, p1: np.ndarray,
+                      solution: ZeroSumSolution) -> NashEvaluationResponse:
+    """
+    Notează un răspuns la un joc de sumă nulă: 50% pentru valoarea jocului (două zecimale)
+    și 50% dacă strategia Jucătorului 1 îi garantează valoarea jocului împotriva oricărei coloane
+    (în limita toleranței), deci orice strategie optimă este acceptată.
+    """
+    rows = p1.shape[0]
+    x = np.asarray(user_answer.row_strategy, dtype=np.float64)
+    correct_answer = solution.rounded()
+
+    percentage = 0
+    explanation = ""
+    if abs(user_answer.value - solution.value) <= NASH_ZERO_SUM_VALUE_TOLERANCE + 1e-9:
+        percentage += 50
+        explanation += "Valoarea jocului este corectă. "
+    else:
+        explanation += f"Valoarea jocului este {solution.value:.2f}. "
+
+    if not _is_distribution(x, rows):
+        explanation += f"Strategia trebuie să fie o distribuție de probabilitate ({rows} valori, cu suma 1)."
+    else:
+        guaranteed = float((x @ p1).min())
+        if guaranteed >= solution.value - _mixed_tolerance(p1, -p1):
+            percentage += 50
+            explanation += "Strategia Jucătorului 1 este optimă."
+        else:
+            explanation += (
+                f"Strategia Jucătorului 1 garantează doar {guaranteed:.2f} "
+                f"(o strategie optimă garantează {solution.value:.2f})."
+            )
+
+    return NashEvaluationResponse(
+        percentage=percentage,
+        correct_answer=correct_answer,
+        explanation=explanation
+    )
+
+
+def _describe_eliminations(result: DominanceResult) -> str:
+    steps = []
+    for elimination in result.eliminations:
+        kind = "rândul" if elimination.player == NASH_PLAYER_ROWS else "coloana"
+        steps.append(f"{kind} {elimination.index} (dominat de {elimination.dominated_by})")
+    return ", ".join(steps) if steps else "nicio strategie nu este strict dominată"
+
+
+def evaluate_iesds(user_answer: NashIesdsAnswerRequest, result: DominanceResult) -> NashEvaluationResponse:
+    """
+    Notează strategiile rămase după eliminarea iterată a strategiilor strict dominate:
+    50% pentru rândurile rămase și 50% pentru coloanele rămase (ordinea indexurilor nu contează).
+    Rezultatul eliminării stricte nu depinde de ordinea pașilor, deci răspunsul corect este unic.
+    """
+    percentage = 0
+    explanation = ""
+    if sorted(set(user_answer.rows_remaining)) == result.rows:
+        percentage += 50
+        explanation += "Rândurile rămase sunt corecte. "
+    else:
+        explanation += f"Rândurile rămase sunt {result.rows}. "
+    if sorted(set(user_answer.cols_remaining)) == result.cols:
+        percentage += 50
+        explanation += "Coloanele rămase sunt corecte. "
+    else:
+        explanation += f"Coloanele rămase sunt {result.cols}. "
+    explanation += f"Ordinea eliminărilor: {_describe_eliminations(result)}."
+
+    return NashEvaluationResponse(
+        percentage=percentage,
+        correct_answer={
+            "rows": result.rows,
+            "cols": result.cols,
+            "eliminations": [elimination.to_dict() for elimination in result.eliminations],
+        },
+        explanation=explanation
+    )
+
@@ -0,0 +1,280 @@
+"""
+Jocuri secvențiale (în formă extinsă) cu informație perfectă: echilibrul perfect în subjocuri,
+prin inducție inversă.
+
+Arborele este stocat ca arborii MinMax (`minmax.tree.FlatTree`): pe niveluri, în ordine BFS,
+copiii nodului i ocupând indicii offsets[i] .. offsets[i] + arity[i] - 1. În locul tipului
+MAX / MIN, fiecare nod intern are jucătorul care mută (`movers`), iar fiecare frunză are un
+vector de plăți (`leaf_payoffs`, câte o linie per frunză, în ordinea BFS a frunzelor).
+
+Inducția inversă parcurge nivelurile de jos în sus; pe un nivel, alegerea fiecărui nod intern
+(maximul plății jucătorului care mută, pe segmentul copiilor lui) se calculează vectorizat,
+deci buclele Python sunt doar pe niveluri: arbori de 10^5 – 10^6 noduri, fără recursivitate.
+La egalitate se alege acțiunea cu indexul cel mai mic.
+
+Forma normală (o strategie = câte o acțiune în fiecare nod al jucătorului) crește exponențial
+cu numărul de noduri, așa că este doar o vedere opțională, construită la cerere
+(`ExtensiveGame.normal_form`); tensorul dens se materializează numai pentru jocurile mici.
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.logic.common.difficulty import (
+    NASH_EXTENSIVE_MIN_BREADTH,
+    NASH_EXTENSIVE_MAX_BREADTH,
+    NASH_EXTENSIVE_MIN_DEPTH,
+    NASH_EXTENSIVE_MAX_DEPTH,
+    NASH_EXTENSIVE_MAX_NODES,
+    NASH_EXTENSIVE_MAX_PLAYERS,
+    NASH_EXTENSIVE_MAX_REQUEST_DEPTH,
+    NASH_MIN_PAYOFF,
+    NASH_MAX_PAYOFF,
+    NASH_TENSOR_MAX_PROFILES
+)
+from app.logic.nash.packed import NASH_PAYOFF_DTYPE
+from app.logic.nash.strings import NASH_EXTENSIVE_TEXT_RO
+from app.logic.nash.tensor import TensorGame
+from app.schemas.nash_schemas import NashExtensiveTree
+
+NASH_LEAF = -1  # valoarea din `movers` pentru frunze
+
+
+class ExtensiveGame:
+    """
+    Arbore de joc în tablouri NumPy, fără un obiect Python per nod.
+
+    arity:  numărul de copii al fiecărui nod (0 pentru frunze)
+    movers: jucătorul care mută în fiecare nod intern (NASH_LEAF pentru frunze)
+    leaf_payoffs: plățile tuturor jucătorilor în fiecare frunză, forma (frunze, jucători)
+    offsets: indexul primului copil al fiecărui nod (calculat)
+    level_starts: indexul primului nod de pe fiecare nivel (calculat)
+    """
+
+    def __init__(self, arity: np.ndarray, movers: np.ndarray, leaf_payoffs: np.ndarray):
+        self.arity = np.ascontiguousarray(arity, dtype=np.int32)
+        self.movers = np.ascontiguousarray(movers, dtype=np.int8)
+        self.leaf_payoffs = np.ascontiguousarray(leaf_payoffs, dtype=NASH_PAYOFF_DTYPE)
+        if int(self.arity.sum(dtype=np.int64)) != len(self.arity) - 1:
+            raise ValueError("Aritățile nu descriu un arbore (numărul de copii diferă de numărul de noduri - 1).")
+        if np.count_nonzero(self.arity == 0) != len(self.leaf_payoffs):
+            raise ValueError("Fiecare frunză trebuie să aibă exact un vector de plăți.")
+
+        self.offsets = np.empty(len(self.arity), dtype=np.int64)
+        self.offsets[0] = 1
+        np.cumsum(self.arity[:-1], out=self.offsets[1:])
+        self.offsets[1:] += 1
+        self.level_starts = self._compute_level_starts()
+        self._normal_form = None
+
+    def __len__(self) -> int:
+        return len(self.arity)
+
+    def _compute_level_starts(self) -> List[int]:
+        # Nivelul d+1 începe imediat după nivelul d și are atâtea noduri câte copii are nivelul d
+        starts = [0]
+        start, end = 0, 1
+        while True:
+            width = int(self.arity[start:end].sum(dtype=np.int64))
+            if width == 0:
+                return starts
+            start, end = end, end + width
+            starts.append(start)
+
+    @property
+    def players(self) -> int:
+        return self.leaf_payoffs.shape[1]
+
+    @property
+    def depth(self) -> int:
+        return len(self.level_starts) - 1
+
+    @property
+    def normal_form(self) -> "NormalFormView":
+        """Vederea în formă normală, creată la prima folosire."""
+        if self._normal_form is None:
+            self._normal_form = NormalFormView(self)
+        return self._normal_form
+
+    def leaf_indices(self) -> np.ndarray:
+        """Pentru fiecare nod, indexul lui printre frunze (valid doar pentru frunze)."""
+        return np.cumsum(self.arity == 0) - 1
+
+    def to_schema(self) -> NashExtensiveTree:
+        return NashExtensiveTree(
+            players=self.players,
+            arity=self.arity.tolist(),
+            movers=self.movers.tolist(),
+            payoffs=self.leaf_payoffs.ravel().tolist()
+        )
+
+
+class SubgamePerfectEquilibrium:
+    """
+    Rezultatul inducției inverse: acțiunea aleasă în fiecare nod intern (-1 pentru frunze) și
+    vectorul de plăți al fiecărui subjoc. Strategia unui jucător este alegerea din nodurile lui.
+    """
+
+    def __init__(self, game: ExtensiveGame, choices: np.ndarray, values: np.ndarray):
+        self.game = game
+        self.choices = choices
+        self.values = values
+
+    @property
+    def payoffs(self) -> List[int]:
+        """Plățile echilibrului (ale subjocului de la rădăcină)."""
+        return self.values[0].tolist()
+
+    def path(self) -> List[int]:
+        """Acțiunile de pe drumul de echilibru, de la rădăcină la frunză."""
+        actions = []
+        node = 0
+        while self.game.arity[node] > 0:
+            action = int(self.choices[node])
+            actions.append(action)
+            node = int(self.game.offsets[node]) + action
+        return actions
+
+    def strategy(self, player: int) -> np.ndarray:
+        """Acțiunile jucătorului în nodurile lui (în ordinea indicilor), inclusiv în afara drumului."""
+        return self.choices[self.game.movers == player]
+
+
+def backward_induction(game: ExtensiveGame) -> SubgamePerfectEquilibrium:
+    """Echilibrul perfect în subjocuri, nivel cu nivel de jos în sus, vectorizat pe fiecare nivel."""
+    values = np.empty((len(game), game.players), dtype=NASH_PAYOFF_DTYPE)
+    values[game.arity == 0] = game.leaf_payoffs
+    choices = np.full(len(game), -1, dtype=np.int32)
+    bounds = game.level_starts + [len(game)]
+
+    for depth in range(game.depth - 1, -1, -1):
+        start, end, below_end = bounds[depth], bounds[depth + 1], bounds[depth + 2]
+        internal = start + np.flatnonzero(game.arity[start:end])
+        counts = game.arity[internal]
+        # Copiii nodurilor interne ale nivelului formează, în ordine, tot nivelul următor
+        segment = np.repeat(np.arange(len(internal)), counts)
+        segment_starts = np.zeros(len(internal), dtype=np.int64)
+        np.cumsum(counts[:-1], out=segment_starts[1:])
+
+        child_values = values[end:below_end]
+        mover_values = child_values[np.arange(len(segment)), game.movers[internal][segment]]
+        maxima = np.maximum.reduceat(mover_values, segment_starts)
+        # Primul copil care atinge maximul segmentului său
+        hits = np.flatnonzero(mover_values == maxima[segment])
+        first = np.ones(len(hits), dtype=bool)
+        first[1:] = segment[hits][1:] != segment[hits][:-1]
+        best = hits[first]
+
+        choices[internal] = best - segment_starts
+        values[internal] = child_values[best]
+
+    return SubgamePerfectEquilibrium(game, choices, values)
+
+
+class NormalFormView:
+    """
+    Forma normală a unui joc în formă extinsă, fără a o materializa.
+
+    O strategie pură a jucătorului p este un tablou cu câte o acțiune pentru fiecare nod al lui
+    (`decision_nodes[p]`, în ordinea indicilor). `outcome` urmează un singur drum (O(adâncime));
+    `to_tensor` construiește tensorul dens (ca un joc cu N jucători) doar dacă are cel mult
+    NASH_TENSOR_MAX_PROFILES profiluri.
+    """
+
+    def __init__(self, game: ExtensiveGame):
+        self.game = game
+        self.decision_nodes = [np.flatnonzero(game.movers == player) for player in range(game.players)]
+
+    def log10_strategy_counts(self) -> List[float]:
+        """log10 din numărul de strategii pure ale fiecărui jucător (numerele exacte pot fi uriașe)."""
+        return [float(np.log10(self.game.arity[nodes].astype(np.float64)).sum()) for nodes in self.decision_nodes]
+
+    def strategy_counts(self) -> List[int]:
+        if sum(self.log10_strategy_counts()) > math.log10(NASH_TENSOR_MAX_PROFILES):
+            raise ValueError("Forma normală este prea mare pentru a fi enumerată.")
+        return [math.prod(self.game.arity[nodes].tolist()) for nodes in self.decision_nodes]
+
+    def outcome(self, strategies: Sequence[np.ndarray]) -> List[int]:
+        """Plățile profilului de strategii pure (câte un tablou de acțiuni per jucător)."""
+        game = self.game
+        node = 0
+        while game.arity[node] > 0:
+            player = int(game.movers[node])
+            local = int(np.searchsorted(self.decision_nodes[player], node))
+            node = int(game.offsets[node]) + int(strategies[player][local])
+        return game.leaf_payoffs[game.leaf_indices()[node]].tolist()
+
+    def to_tensor(self) -> TensorGame:
+        """
+        Tensorul plăților formei normale: strategiile fiecărui jucător sunt numerotate în bază mixtă
+        (acțiunea din ultimul nod variază cel mai repede); toate profilurile urmează arborele
+        împreună, câte un nivel pe iterație.
+        """
+        game = self.game
+        counts = self.strategy_counts()
+        # strategies[p][s] = acțiunile strategiei s a jucătorului p
+        strategies = [np.indices(game.arity[nodes]).reshape(len(nodes), -1).T if len(nodes)
+                      else np.zeros((1, 0), dtype=np.int64) for nodes in self.decision_nodes]
+        profiles = np.indices(counts).reshape(game.players, -1)
+
+        nodes = np.zeros(profiles.shape[1], dtype=np.int64)
+        for _ in range(game.depth):
+            for player in range(game.players):
+                moving = np.flatnonzero((game.movers[nodes] == player) & (game.arity[nodes] > 0))
+                if len(moving) == 0:
+                    continue
+                local = np.searchsorted(self.decision_nodes[player], nodes[moving])
+                actions = strategies[player][profiles[player, moving], local]
+                nodes[moving] = game.offsets[nodes[moving]] + actions
+
+        payoffs = game.leaf_payoffs[game.leaf_indices()[nodes]]
+        return TensorGame(payoffs.reshape(tuple(counts) + (game.players,)))
+
+
+def _generate_tree(rng: np.random.Generator, players: int, depth: int, max_breadth: int) -> ExtensiveGame:
+    """Arbore complet de adâncime `depth`, generat nivel cu nivel; la nivelul d mută jucătorul d mod N."""
+    level_arity = []
+    level_movers = []
+    width, total = 1, 1
+    for level in range(depth):
+        arity = rng.integers(NASH_EXTENSIVE_MIN_BREADTH, max_breadth + 1, size=width, dtype=np.int32)
+        level_arity.append(arity)
+        level_movers.append(np.full(width, level % players, dtype=np.int8))
+        width = int(arity.sum(dtype=np.int64))
+        total += width
+        if total > NASH_EXTENSIVE_MAX_NODES:
+            raise ValueError(f"Arborele are prea multe noduri (maxim {NASH_EXTENSIVE_MAX_NODES}).")
+    level_arity.append(np.zeros(width, dtype=np.int32))
+    level_movers.append(np.full(width, NASH_LEAF, dtype=np.int8))
+
+    leaf_payoffs = rng.integers(NASH_MIN_PAYOFF, NASH_MAX_PAYOFF + 1, size=(width, players), dtype=np.int16)
+    return ExtensiveGame(np.concatenate(level_arity), np.concatenate(level_movers), leaf_payoffs)
+
+
+def generate_and_solve_extensive(seed: int, params: Optional[Dict[str, Any]] = None):
+    """
+    params: dict cu 'players', 'depth' (lipsă = aleator, între NASH_EXTENSIVE_MIN_DEPTH și
+    NASH_EXTENSIVE_MAX_DEPTH) și 'max_breadth' (numărul maxim de acțiuni într-un nod).
+    Întoarce (ExtensiveGame, SubgamePerfectEquilibrium, text); ValueError dacă arborele ar depăși
+    NASH_EXTENSIVE_MAX_NODES noduri.
+    """
+    params = params or {}
+    rng = np.random.default_rng(seed)
+    players = max(2, min(NASH_EXTENSIVE_MAX_PLAYERS, params.get("players") or 2))
+    depth = params.get("depth")
+    if depth is None:
+        depth = int(rng.integers(NASH_EXTENSIVE_MIN_DEPTH, NASH_EXTENSIVE_MAX_DEPTH + 1))
+    depth = max(1, min(NASH_EXTENSIVE_MAX_REQUEST_DEPTH, depth))
+    max_breadth = params.get("max_breadth") or NASH_EXTENSIVE_MIN_BREADTH + 1
+    max_breadth = max(NASH_EXTENSIVE_MIN_BREADTH, min(NASH_EXTENSIVE_MAX_BREADTH, max_breadth))
+
+    game = _generate_tree(rng, players, depth, max_breadth)
+    equilibrium = backward_induction(game)
+
+    text_data = {
+        "title": NASH_EXTENSIVE_TEXT_RO["title"],
+        "description": NASH_EXTENSIVE_TEXT_RO["description"].format(players=players, depth=depth),
+        "requirement": NASH_EXTENSIVE_TEXT_RO["requirement"]
+    }
+    return game, equilibrium, text_data
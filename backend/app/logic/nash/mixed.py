@@ -0,0 +1,169 @@
+"""
+Echilibre Nash mixte pentru jocuri bimatriceale: algoritmul Lemke–Howson.
+
+Cu plățile făcute strict pozitive, echilibrele corespund perechilor complet etichetate ale
+poliedrelor  P = {x >= 0 : B^T x <= 1}  și  Q = {y >= 0 : A y <= 1}.
+Etichete: 0..m-1 pentru strategiile jucătorului 1 (x_i în P, variabila de ecart r_i în Q),
+m..m+n-1 pentru strategiile jucătorului 2 (ecartul s_j în P, y_j în Q).
+Pornind de la (0, 0), eticheta inițială intră în baza tabloului ei; eticheta care iese
+intră în celălalt tablou și așa mai departe, până când iese chiar eticheta inițială.
+
+Tablourile sunt tablouri NumPy dense. Întâi rulăm în float64; dacă rezultatul nu trece
+verificarea de echilibru (degenerări, erori de rotunjire), repetăm exact, cu fracții
+(același cod, dtype=object). Regula lexicografică de ieșire garantează terminarea.
+"""
+from fractions import Fraction
+from typing import List, Optional
+
+import numpy as np
+
+from app.logic.nash.dominance import expand_strategy, iterated_elimination
+
+# Toleranța pentru verificarea unui echilibru calculat în virgulă mobilă
+NASH_MIXED_FLOAT_TOLERANCE = 1e-9
+
+
+class MixedEquilibrium:
+    """Strategiile mixte ale celor doi jucători și câștigurile așteptate."""
+
+    def __init__(self, row_strategy: List[float], col_strategy: List[float],
+                 row_value: float, col_value: float, exact: bool):
+        self.row_strategy = row_strategy
+        self.col_strategy = col_strategy
+        self.row_value = row_value
+        self.col_value = col_value
+        self.exact = exact  # True dacă a fost nevoie de aritmetica rațională
+
+    def rounded(self, digits: int = 2):
+        return {
+            "row_strategy": [round(p, digits) for p in self.row_strategy],
+            "col_strategy": [round(q, digits) for q in self.col_strategy],
+        }
+
+
+class _Tableau:
+    """Un tablou simplex cu baza ținută ca etichete (basis[linie] = eticheta variabilei bazice)."""
+
+    def __init__(self, matrix: np.ndarray, variable_labels: List[int], slack_labels: List[int], exact: bool):
+        rows = matrix.shape[0]
+        total = len(variable_labels) + len(slack_labels)
+        dtype = object if exact else np.float64
+        self.exact = exact
+        self.table = np.empty((rows, total + 1), dtype=dtype)
+        zero, one = (Fraction(0), Fraction(1)) if exact else (0.0, 1.0)
+        self.table[:] = zero
+        for column, label in enumerate(variable_labels):
+            self.table[:, label] = [Fraction(int(v)) if exact else float(v) for v in matrix[:, column]]
+        for row, label in enumerate(slack_labels):
+            self.table[row, label] = one
+        self.table[:, -1] = one
+        self.basis = list(slack_labels)
+        # Coloanele bazei inițiale (pentru regula lexicografică)
+        self.slack_columns = list(slack_labels)
+
+    def pivot(self, entering: int) -> int:
+        """Eticheta `entering` intră în bază; întoarce eticheta care iese."""
+        table = self.table
+        column = table[:, entering]
+        eps = 0 if self.exact else NASH_MIXED_FLOAT_TOLERANCE
+        candidates = np.flatnonzero(column > eps)
+        if len(candidates) == 0:
+            raise ArithmeticError("Tablou nemărginit (nu poate apărea pentru plăți pozitive).")
+
+        # Regula lexicografică: minim după (rhs, coloanele bazei inițiale) / pivot;
+        # coloanele următoare contează doar pentru liniile încă la egalitate
+        for key_column in [-1] + self.slack_columns:
+            ratios = table[candidates, key_column] / column[candidates]
+            best = ratios.min()
+            candidates = candidates[ratios <= best + eps]
+            if len(candidates) == 1:
+                break
+        leaving_row = int(candidates[0])
+
+        pivot_row = table[leaving_row] / table[leaving_row, entering]
+        table -= np.outer(table[:, entering], pivot_row)
+        table[leaving_row] = pivot_row
+        leaving = self.basis[leaving_row]
+        self.basis[leaving_row] = entering
+        return leaving
+
+    def strategy(self, labels: range) -> list:
+        values = [self.table[self.basis.index(label), -1] if label in self.basis else 0 for label in labels]
+        total = sum(values)
+        return [value / total for value in values]
+
+
+def _run(A: np.ndarray, B: np.ndarray, initial_label: int, exact: bool, max_pivots: Optional[int]):
+    m, n = A.shape
+    # P: variabile x (etichete 0..m-1), ecarturi s (etichete m..m+n-1), constrângeri B^T x + s = 1
+    p_tableau = _Tableau(B.T, list(range(m)), list(range(m, m + n)), exact)
+    # Q: variabile y (etichete m..m+n-1), ecarturi r (etichete 0..m-1), constrângeri A y + r = 1
+    q_tableau = _Tableau(A, list(range(m, m + n)), list(range(m)), exact)
+
+    tableau = p_tableau if initial_label < m else q_tableau
+    entering = initial_label
+    pivots = 0
+    while True:
+        leaving = tableau.pivot(entering)
+        pivots += 1
+        if leaving == initial_label:
+            break
+        if max_pivots is not None and pivots > max_pivots:
+            raise ArithmeticError("Prea multe pivotări (ciclare numerică).")
+        entering = leaving
+        tableau = q_tableau if tableau is p_tableau else p_tableau
+
+    return p_tableau.strategy(range(m)), q_tableau.strategy(range(m, m + n))
+
+
+def is_mixed_equilibrium(A: np.ndarray, B: np.ndarray, x, y, tolerance: float) -> bool:
+    """Niciun jucător nu câștigă mai mult de `tolerance` deviind la o strategie pură."""
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if (x < -tolerance).any() or (y < -tolerance).any():
+        return False
+    if abs(x.sum() - 1) > tolerance or abs(y.sum() - 1) > tolerance:
+        return False
+    row_payoffs, col_payoffs = A @ y, x @ B
+    return row_payoffs.max() - x @ row_payoffs <= tolerance and col_payoffs.max() - col_payoffs @ y <= tolerance
+
+
+def lemke_howson(A: np.ndarray, B: np.ndarray, initial_label: int = 0, reduce: bool = False) -> MixedEquilibrium:
+    """
+    Un echilibru Nash (posibil mixt) al jocului (A, B), cu plăți întregi de dimensiune m x n.
+    Eticheta inițială (0..m+n-1) alege unul dintre drumurile Lemke–Howson.
+    Cu `reduce=True`, algoritmul rulează pe jocul rămas după eliminarea strategiilor strict
+    dominate (care păstrează toate echilibrele); eticheta inițială se referă atunci la jocul redus.
+    """
+    A = np.asarray(A, dtype=np.int64)
+    B = np.asarray(B, dtype=np.int64)
+    if reduce:
+        result = iterated_elimination(A, B)
+        equilibrium = lemke_howson(*result.reduce(A, B), initial_label=initial_label)
+        equilibrium.row_strategy = expand_strategy(equilibrium.row_strategy, result.rows, A.shape[0])
+        equilibrium.col_strategy = expand_strategy(equilibrium.col_strategy, result.cols, A.shape[1])
+        return equilibrium
+
+    # Plăți strict pozitive (translația nu schimbă echilibrele)
+    A_pos = A - A.min() + 1
+    B_pos = B - B.min() + 1
+    m, n = A.shape
+
+    exact = False
+    try:
+        x, y = _run(A_pos, B_pos, initial_label, exact=False, max_pivots=20 * (m + n) ** 2)
+        if not is_mixed_equilibrium(A, B, x, y, NASH_MIXED_FLOAT_TOLERANCE * 100):
+            raise ArithmeticError("Verificarea echilibrului a eșuat în virgulă mobilă.")
+    except (ArithmeticError, ZeroDivisionError, ValueError):
+        exact = True
+        x, y = _run(A_pos, B_pos, initial_label, exact=True, max_pivots=None)
+
+    x = [float(p) for p in x]
+    y = [float(q) for q in y]
+    xa, ya = np.array(x), np.array(y)
+    return MixedEquilibrium(
+        row_strategy=x,
+        col_strategy=y,
+        row_value=float(xa @ A @ ya),
+        col_value=float(xa @ B @ ya),
+        exact=exact,
+    )
@@ -0,0 +1,81 @@
+"""
+Reprezentarea compactă a matricei de plăți: un singur tablou int16 little-endian de forma
+(rows, cols, 2), cu plățile celor doi jucători intercalate pe fiecare celulă.
+
+Solverele primesc vederi (fără copiere) ale plăților fiecărui jucător. `NashMatrix` (grila JSON
+de tupluri, validată de Pydantic celulă cu celulă) se construiește doar la cerere, pentru
+răspunsurile în formatul implicit; jocurile mari pot fi trimise ca base64 sau ca listă plată.
+"""
+import base64
+from typing import List, Tuple
+
+import numpy as np
+
+from app.schemas.nash_schemas import NashCompactMatrix, NashMatrix
+
+NASH_PAYOFF_DTYPE = np.dtype("<i2")
+
+# Formatele matricei în răspunsuri
+NASH_MATRIX_FORMAT_GRID = "grid"  # NashMatrix: grid[row][col] = (p1, p2)
+NASH_MATRIX_FORMAT_BASE64 = "base64"  # octeții tabloului int16 little-endian, în base64
+NASH_MATRIX_FORMAT_FLAT = "flat"  # aceleași valori, ca listă plată de întregi
+NASH_COMPACT_FORMATS = (NASH_MATRIX_FORMAT_BASE64, NASH_MATRIX_FORMAT_FLAT)
+
+
+class PackedNashMatrix:
+    """Plățile unui joc bimatriceal într-un tablou contiguu int16 (rows, cols, 2)."""
+
+    def __init__(self, payoffs: np.ndarray):
+        self.payoffs = np.ascontiguousarray(payoffs, dtype=NASH_PAYOFF_DTYPE)
+
+    @classmethod
+    def from_arrays(cls, p1: np.ndarray, p2: np.ndarray) -> "PackedNashMatrix":
+        payoffs = np.empty(p1.shape + (2,), dtype=NASH_PAYOFF_DTYPE)
+        payoffs[..., 0] = p1
+        payoffs[..., 1] = p2
+        return cls(payoffs)
+
+    @classmethod
+    def from_grid(cls, grid: List[List[Tuple[int, int]]]) -> "PackedNashMatrix":
+        return cls(np.array(grid, dtype=NASH_PAYOFF_DTYPE).reshape(len(grid), -1, 2))
+
+    @property
+    def rows(self) -> int:
+        return self.payoffs.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.payoffs.shape[1]
+
+    @property
+    def p1(self) -> np.ndarray:
+        """Plățile Jucătorului 1 (vedere, fără copiere)."""
+        return self.payoffs[..., 0]
+
+    @property
+    def p2(self) -> np.ndarray:
+        """Plățile Jucătorului 2 (vedere, fără copiere)."""
+        return self.payoffs[..., 1]
+
+    @property
+    def grid(self) -> List[List[Tuple[int, int]]]:
+        return [[tuple(cell) for cell in row] for row in self.payoffs.tolist()]
+
+    def to_schema(self) -> NashMatrix:
+        return NashMatrix(rows=self.rows, cols=self.cols, grid=self.grid)
+
+    def to_compact(self, encoding: str) -> NashCompactMatrix:
+        if encoding == NASH_MATRIX_FORMAT_BASE64:
+            return NashCompactMatrix(rows=self.rows, cols=self.cols, encoding=encoding,
+                                     data=base64.b64encode(self.payoffs.tobytes()).decode("ascii"))
+        return NashCompactMatrix(rows=self.rows, cols=self.cols, encoding=encoding,
+                                 payoffs=self.payoffs.ravel().tolist())
+
+
+def unpack_compact(compact: NashCompactMatrix) -> PackedNashMatrix:
+    """Operația inversă lui `to_compact` (folosită de clienți Python și de teste)."""
+    if compact.encoding == NASH_MATRIX_FORMAT_BASE64:
+        flat = np.frombuffer(base64.b64decode(compact.data), dtype=NASH_PAYOFF_DTYPE)
+    else:
+        flat = np.array(compact.payoffs, dtype=NASH_PAYOFF_DTYPE)
+    return PackedNashMatrix(flat.reshape(compact.rows, compact.cols, 2))
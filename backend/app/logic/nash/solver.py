@@ -1,17 +1,51 @@
 import random
 from typing import List, Tuple, Dict, Any
 
+import numpy as np
+
 from app.logic.common.seed import set_seed
 from app.schemas.nash_schemas import NashMatrix
-from app.logic.nash.strings import NASH_TEXT_RO  # Import templates
+from app.logic.nash.packed import PackedNashMatrix
+from app.logic.nash.tensor import solve_pure_nash_tensor
+from app.logic.nash.strings import (  # Import templates
+    NASH_TEXT_RO,
+    NASH_MIXED_TEXT_RO,
+    NASH_ZERO_SUM_TEXT_RO,
+    NASH_IESDS_TEXT_RO
+)
 
 from app.logic.common.difficulty import (
     NASH_MATRIX_MIN_SIZE,
     NASH_MATRIX_MAX_SIZE,
     NASH_MIN_PAYOFF,
-    NASH_MAX_PAYOFF
+    NASH_MAX_PAYOFF,
+    NASH_REQUEST_MIN_SIZE,
+    NASH_REQUEST_MAX_SIZE,
+    NASH_LARGE_MAX_SIZE,
+    NASH_ZERO_SUM_MAX_SIZE
 )
 
+# Tipurile de probleme Nash
+NASH_PROBLEM_PURE = "pure"
+NASH_PROBLEM_MIXED = "mixed"
+NASH_PROBLEM_ZERO_SUM = "zero_sum"
+NASH_PROBLEM_IESDS = "iesds"
+NASH_PROBLEM_TYPES = (NASH_PROBLEM_PURE, NASH_PROBLEM_MIXED, NASH_PROBLEM_ZERO_SUM, NASH_PROBLEM_IESDS)
+
+# Generarea cu număr fix de echilibre: câte matrici candidate se trag odată (limitat și de
+# numărul total de celule dintr-un lot) și după câte loturi / celule trase în total se renunță
+NASH_BATCH_CANDIDATES = 4096
+NASH_BATCH_MAX_CELLS = 1 << 24
+NASH_BATCH_MAX_ROUNDS = 64
+NASH_BATCH_TOTAL_CELLS = 1 << 26
+
+NASH_TEXTS = {
+    NASH_PROBLEM_PURE: NASH_TEXT_RO,
+    NASH_PROBLEM_MIXED: NASH_MIXED_TEXT_RO,
+    NASH_PROBLEM_ZERO_SUM: NASH_ZERO_SUM_TEXT_RO,
+    NASH_PROBLEM_IESDS: NASH_IESDS_TEXT_RO,
+}
+
 
 def _generate_random_matrix(rows: int, cols: int) -> List[List[Tuple[int, int]]]:
     grid = []
@@ -26,24 +60,76 @@ def _generate_random_matrix(rows: int, cols: int) -> List[List[Tuple[int, int]]]
     return grid
 
 
-def solve_pure_nash(matrix: NashMatrix) -> List[Tuple[int, int]]:
-    equilibria = []
-    grid = matrix.grid
+def _generate_random_arrays(rows: int, cols: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Plățile unui joc mare, generate vectorizat (RNG NumPy propriu, determinist din seed)."""
+    rng = np.random.default_rng(seed)
+    payoffs = rng.integers(NASH_MIN_PAYOFF, NASH_MAX_PAYOFF + 1, size=(2, rows, cols), dtype=np.int64)
+    return payoffs[0], payoffs[1]
+
+
+def count_pure_equilibria(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    """Numărul de echilibre pure pentru un lot de jocuri de forma (batch, rows, cols), într-o singură trecere."""
+    best_rows = p1 == p1.max(axis=1, keepdims=True)
+    best_cols = p2 == p2.max(axis=2, keepdims=True)
+    return np.count_nonzero(best_rows & best_cols, axis=(1, 2))
+
 
-    for r in range(matrix.rows):
-        for c in range(matrix.cols):
-            p1, p2 = grid[r][c]
+def _generate_with_equilibria(rows: int, cols: int, target: int, seed: int,
+                              zero_sum: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Un joc cu exact `target` echilibre pure: loturi de matrici candidate (batch, rows, cols),
+    numărate vectorizat; se alege primul candidat potrivit, deci rezultatul depinde doar de seed.
+    Ridică ValueError dacă niciun lot nu conține un asemenea joc (ținte foarte improbabile, de ex.
+    puține echilibre în jocurile mari, unde plățile egale fac mulțimile de cel mai bun răspuns mari).
+    """
+    rng = np.random.default_rng(seed)
+    batch = max(1, min(NASH_BATCH_CANDIDATES, NASH_BATCH_MAX_CELLS // (rows * cols)))
+    rounds = min(NASH_BATCH_MAX_ROUNDS, max(1, NASH_BATCH_TOTAL_CELLS // (batch * rows * cols)))
+    for _ in range(rounds):
+        payoffs = rng.integers(NASH_MIN_PAYOFF, NASH_MAX_PAYOFF + 1, size=(2, batch, rows, cols), dtype=np.int8)
+        p1 = payoffs[0]
+        p2 = -p1 if zero_sum else payoffs[1]
+        matches = np.flatnonzero(count_pure_equilibria(p1, p2) == target)
+        if len(matches):
+            return p1[matches[0]], p2[matches[0]]
+    raise ValueError(f"Nu s-a găsit un joc {rows}x{cols} cu exact {target} echilibre pure.")
+
+
+def payoff_arrays(matrix) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Plățile celor doi jucători ca două tablouri întregi (rows x cols).
+    Pentru un PackedNashMatrix sunt vederi ale tabloului compact; pentru un NashMatrix, copii.
+    """
+    if isinstance(matrix, PackedNashMatrix):
+        return matrix.p1, matrix.p2
+    grid = np.array(matrix.grid, dtype=np.int64).reshape(matrix.rows, matrix.cols, 2)
+    return grid[..., 0], grid[..., 1]
 
-            if all(p1 >= grid[rr][c][0] for rr in range(matrix.rows)) and \
-                    all(p2 >= grid[r][cc][1] for cc in range(matrix.cols)):
-                equilibria.append((r, c))
 
-    return equilibria
+def solve_pure_nash_arrays(p1: np.ndarray, p2: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Echilibrele Nash pure în O(r·c): o celulă este echilibru dacă P1 nu poate câștiga
+    schimbând rândul (maximul coloanei) și P2 nu poate câștiga schimbând coloana (maximul rândului).
+    Ordinea rezultatelor este cea a parcurgerii pe rânduri (cazul N = 2 al `solve_pure_nash_tensor`).
+    """
+    return solve_pure_nash_tensor((p1, p2))
+
+
+def solve_pure_nash(matrix: NashMatrix) -> List[Tuple[int, int]]:
+    return solve_pure_nash_arrays(*payoff_arrays(matrix))
 
 
 def generate_and_solve_nash(seed: int, params: Dict[str, Any] = None):
     """
-    params: dict with keys 'rows', 'cols', 'random_size'
+    params: dict with keys 'rows', 'cols', 'random_size', 'large_game', 'problem_type'
+    'problem_type' selects the statement text; "zero_sum" also makes the game zero-sum
+    (Player 2's payoff is the negated Player 1 payoff) and caps large games at NASH_ZERO_SUM_MAX_SIZE.
+    In "large game" mode the size limit is NASH_LARGE_MAX_SIZE and payoffs come from
+    a seeded NumPy generator (the small-game RNG sequence is unchanged).
+    With 'target_equilibria' = k the matrix is drawn by `_generate_with_equilibria` (exactly k
+    pure equilibria; ValueError when no candidate batch contains one).
+    Returns (PackedNashMatrix, pure equilibria, text); the Pydantic NashMatrix is built
+    only when a response needs the grid format (`PackedNashMatrix.to_schema`).
     """
     set_seed(seed)
 
@@ -51,6 +137,12 @@ def generate_and_solve_nash(seed: int, params: Dict[str, Any] = None):
     rows = 3
     cols = 3
     is_random = True
+    large_game = bool(params and params.get("large_game"))
+    problem_type = (params or {}).get("problem_type") or NASH_PROBLEM_PURE
+    zero_sum = problem_type == NASH_PROBLEM_ZERO_SUM
+    max_size = NASH_REQUEST_MAX_SIZE
+    if large_game:
+        max_size = NASH_ZERO_SUM_MAX_SIZE if zero_sum else NASH_LARGE_MAX_SIZE
 
     # Process parameters if they exist (Generation mode)
     # If params is None (Evaluation mode), we must rely ONLY on the seed
@@ -65,26 +157,38 @@ def generate_and_solve_nash(seed: int, params: Dict[str, Any] = None):
     if params:
         is_random = params.get("random_size", False)
         if not is_random:
-            # Clamp values to safe limits (2 to 4)
+            # Clamp values to safe limits (2 to 4, or up to NASH_LARGE_MAX_SIZE for large games)
             req_rows = params.get("rows", 3)
             req_cols = params.get("cols", 3)
-            rows = max(2, min(4, req_rows))
-            cols = max(2, min(4, req_cols))
+            rows = max(NASH_REQUEST_MIN_SIZE, min(max_size, req_rows))
+            cols = max(NASH_REQUEST_MIN_SIZE, min(max_size, req_cols))
 
     if is_random:
         # Use the seed to pick size
         rows = random.randint(NASH_MATRIX_MIN_SIZE, NASH_MATRIX_MAX_SIZE)
         cols = random.randint(NASH_MATRIX_MIN_SIZE, NASH_MATRIX_MAX_SIZE)
 
-    grid = _generate_random_matrix(rows, cols)
-    matrix = NashMatrix(rows=rows, cols=cols, grid=grid)
-    equilibria = solve_pure_nash(matrix)
+    target = (params or {}).get("target_equilibria")
+    if target is not None:
+        matrix = PackedNashMatrix.from_arrays(*_generate_with_equilibria(rows, cols, target, seed, zero_sum))
+    elif large_game:
+        p1, p2 = _generate_random_arrays(rows, cols, seed)
+        if zero_sum:
+            p2 = -p1
+        matrix = PackedNashMatrix.from_arrays(p1, p2)
+    else:
+        grid = _generate_random_matrix(rows, cols)
+        if zero_sum:
+            grid = [[(p1_payoff, -p1_payoff) for p1_payoff, _ in row] for row in grid]
+        matrix = PackedNashMatrix.from_grid(grid)
+    equilibria = solve_pure_nash_arrays(matrix.p1, matrix.p2)
 
     # Hydrate the text template
+    template = NASH_TEXTS.get(problem_type, NASH_TEXT_RO)
     text_data = {
-        "title": NASH_TEXT_RO["title"],
-        "description": NASH_TEXT_RO["description"].format(rows=rows, cols=cols),
-        "requirement": NASH_TEXT_RO["requirement"]
+        "title": template["title"],
+        "description": template["description"].format(rows=rows, cols=cols),
+        "requirement": template["requirement"]
     }
 
     return matrix, equilibria, text_data
\ No newline at end of file
@@ -16,4 +16,77 @@ NASH_TEXT_RO = {
         "Dacă există, precizați coordonatele acestuia sub forma (Index Rând, Index Coloană).\n"
         "Dacă nu există, selectați opțiunea corespunzătoare."
     )
-}
\ No newline at end of file
+}
+
+NASH_MIXED_TEXT_RO = {
+    "title": "Teoria Jocurilor: Echilibrul Nash în strategii mixte",
+    "description": (
+        "Se consideră un joc în formă normală cu 2 jucători. "
+        "Jucătorul 1 are {rows} strategii posibile (alege rândul), iar "
+        "Jucătorul 2 are {cols} strategii posibile (alege coloana).\n"
+        "Valorile din fiecare celulă reprezintă (Payoff Jucător 1, Payoff Jucător 2)."
+    ),
+    "requirement": (
+        "Determinați un Echilibru Nash în strategii mixte: probabilitatea cu care Jucătorul 1 "
+        "joacă fiecare rând și probabilitatea cu care Jucătorul 2 joacă fiecare coloană.\n"
+        "Probabilitățile se dau cu cel puțin două zecimale."
+    )
+}
+
+NASH_ZERO_SUM_TEXT_RO = {
+    "title": "Teoria Jocurilor: Joc de sumă nulă",
+    "description": (
+        "Se consideră un joc de sumă nulă cu 2 jucători: ce câștigă Jucătorul 1 pierde Jucătorul 2. "
+        "Jucătorul 1 are {rows} strategii posibile (alege rândul), iar "
+        "Jucătorul 2 are {cols} strategii posibile (alege coloana).\n"
+        "Valorile din fiecare celulă reprezintă (Payoff Jucător 1, Payoff Jucător 2)."
+    ),
+    "requirement": (
+        "Determinați valoarea jocului (câștigul așteptat al Jucătorului 1) și o strategie mixtă "
+        "optimă pentru Jucătorul 1 (probabilitatea fiecărui rând).\n"
+        "Valorile se dau cu cel puțin două zecimale."
+    )
+}
+
+NASH_IESDS_TEXT_RO = {
+    "title": "Teoria Jocurilor: Eliminarea strategiilor dominate",
+    "description": (
+        "Se consideră un joc în formă normală cu 2 jucători. "
+        "Jucătorul 1 are {rows} strategii posibile (alege rândul), iar "
+        "Jucătorul 2 are {cols} strategii posibile (alege coloana).\n"
+        "Valorile din fiecare celulă reprezintă (Payoff Jucător 1, Payoff Jucător 2)."
+    ),
+    "requirement": (
+        "Aplicați eliminarea iterată a strategiilor strict dominate (de strategii pure).\n"
+        "Precizați indexurile rândurilor și ale coloanelor care rămân la final."
+    )
+}
+
+NASH_TENSOR_TEXT_RO = {
+    "title": "Teoria Jocurilor: Echilibrul Nash cu mai mulți jucători",
+    "description": (
+        "Se consideră un joc în formă normală cu {players} jucători, cu {strategies} strategii posibile "
+        "(Jucătorul 1 alege prima coordonată a profilului, Jucătorul 2 a doua etc.).\n"
+        "Pentru fiecare profil de strategii sunt date plățile tuturor jucătorilor, în ordine."
+    ),
+    "requirement": (
+        "Identificați dacă există un Echilibru Nash Pur în acest joc.\n"
+        "Dacă există, precizați profilul de strategii (câte un index pentru fiecare jucător).\n"
+        "Dacă nu există, selectați opțiunea corespunzătoare."
+    )
+}
+
+NASH_EXTENSIVE_TEXT_RO = {
+    "title": "Teoria Jocurilor: Joc secvențial și inducție inversă",
+    "description": (
+        "Se consideră un joc secvențial cu informație perfectă, cu {players} jucători, reprezentat "
+        "ca arbore de adâncime {depth}. În fiecare nod intern mută jucătorul indicat, alegând unul "
+        "dintre copii (acțiunile sunt numerotate de la 0, de la stânga la dreapta).\n"
+        "Frunzele conțin plățile tuturor jucătorilor, în ordine."
+    ),
+    "requirement": (
+        "Determinați echilibrul perfect în subjocuri prin inducție inversă.\n"
+        "Precizați acțiunile de pe drumul de echilibru, de la rădăcină până la frunză.\n"
+        "La egalitate, jucătorul alege acțiunea cu indexul cel mai mic."
+    )
+}
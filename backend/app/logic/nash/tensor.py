@@ -0,0 +1,119 @@
+"""
+Jocuri în formă normală cu N >= 2 jucători: plățile sunt un tensor int16 little-endian de forma
+(s_1, ..., s_N, N), unde payoffs[a_1, ..., a_N, i] este plata jucătorului i pentru profilul
+(a_1, ..., a_N) — generalizarea directă a tabloului (rows, cols, 2) din `packed`.
+
+Un profil este echilibru pur dacă fiecare jucător i își atinge maximul de-a lungul axei i
+(nu câștigă nimic schimbându-și doar propria strategie). Calculul este doar vectorizat: câte un
+maxim pe axă și o comparație pentru fiecare jucător, adică O(N · profiluri), fără bucle Python
+pe profiluri (3 jucători x 20 de strategii = 8000 de profiluri x 3 plăți). Solverul bimatriceal
+(`solve_pure_nash_arrays`) este cazul N = 2 al aceleiași funcții.
+"""
+import base64
+from math import prod
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.logic.common.difficulty import (
+    NASH_MATRIX_MIN_SIZE,
+    NASH_MATRIX_MAX_SIZE,
+    NASH_MIN_PAYOFF,
+    NASH_MAX_PAYOFF,
+    NASH_REQUEST_MIN_SIZE,
+    NASH_TENSOR_MAX_PLAYERS,
+    NASH_TENSOR_MAX_PROFILES,
+    NASH_TENSOR_MAX_STRATEGIES
+)
+from app.logic.nash.packed import NASH_MATRIX_FORMAT_BASE64, NASH_PAYOFF_DTYPE
+from app.logic.nash.strings import NASH_TENSOR_TEXT_RO
+from app.schemas.nash_schemas import NashTensorGame
+
+NASH_TENSOR_DEFAULT_PLAYERS = 3
+
+
+class TensorGame:
+    """Plățile unui joc cu N jucători într-un tablou contiguu int16 (s_1, ..., s_N, N)."""
+
+    def __init__(self, payoffs: np.ndarray):
+        self.payoffs = np.ascontiguousarray(payoffs, dtype=NASH_PAYOFF_DTYPE)
+
+    @property
+    def players(self) -> int:
+        return self.payoffs.shape[-1]
+
+    @property
+    def strategies(self) -> Tuple[int, ...]:
+        return self.payoffs.shape[:-1]
+
+    def player_payoffs(self) -> List[np.ndarray]:
+        """Tensorul plăților fiecărui jucător (vederi, fără copiere)."""
+        return [self.payoffs[..., i] for i in range(self.players)]
+
+    def to_schema(self, encoding: str) -> NashTensorGame:
+        if encoding == NASH_MATRIX_FORMAT_BASE64:
+            return NashTensorGame(players=self.players, strategies=list(self.strategies), encoding=encoding,
+                                  data=base64.b64encode(self.payoffs.tobytes()).decode("ascii"))
+        return NashTensorGame(players=self.players, strategies=list(self.strategies), encoding=encoding,
+                              payoffs=self.payoffs.ravel().tolist())
+
+
+def unpack_tensor(game: NashTensorGame) -> TensorGame:
+    """Operația inversă lui `TensorGame.to_schema` (folosită de clienți Python și de teste)."""
+    if game.encoding == NASH_MATRIX_FORMAT_BASE64:
+        flat = np.frombuffer(base64.b64decode(game.data), dtype=NASH_PAYOFF_DTYPE)
+    else:
+        flat = np.array(game.payoffs, dtype=NASH_PAYOFF_DTYPE)
+    return TensorGame(flat.reshape(tuple(game.strategies) + (game.players,)))
+
+
+def best_response_mask(payoffs: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Masca profilurilor în care fiecare jucător joacă un cel mai bun răspuns.
+    `payoffs[i]` este tensorul plăților jucătorului i (aceeași formă pentru toți jucătorii).
+    """
+    mask = np.ones(payoffs[0].shape, dtype=bool)
+    for axis, player_payoffs in enumerate(payoffs):
+        mask &= player_payoffs == player_payoffs.max(axis=axis, keepdims=True)
+    return mask
+
+
+def solve_pure_nash_tensor(payoffs: Sequence[np.ndarray]) -> List[Tuple[int, ...]]:
+    """Echilibrele Nash pure (profiluri de strategii), în ordine lexicografică."""
+    return [tuple(profile) for profile in np.argwhere(best_response_mask(payoffs)).tolist()]
+
+
+def _resolve_strategies(rng: np.random.Generator, params: Dict[str, Any]) -> Tuple[int, ...]:
+    """Numărul de jucători și de strategii, limitate ca la jocurile bimatriceale (sau trase din seed)."""
+    players = max(2, min(NASH_TENSOR_MAX_PLAYERS, params.get("players") or NASH_TENSOR_DEFAULT_PLAYERS))
+    requested = params.get("strategies")
+    if not requested:
+        return tuple(rng.integers(NASH_MATRIX_MIN_SIZE, NASH_MATRIX_MAX_SIZE + 1, size=players).tolist())
+    if len(requested) != players:
+        raise ValueError(f"Sunt necesare numerele de strategii pentru toți cei {players} jucători.")
+    strategies = tuple(max(NASH_REQUEST_MIN_SIZE, min(NASH_TENSOR_MAX_STRATEGIES, s)) for s in requested)
+    if prod(strategies) > NASH_TENSOR_MAX_PROFILES:
+        raise ValueError(f"Jocul are prea multe profiluri de strategii (maxim {NASH_TENSOR_MAX_PROFILES}).")
+    return strategies
+
+
+def generate_and_solve_tensor(seed: int, params: Dict[str, Any] = None):
+    """
+    params: dict cu 'players' și 'strategies' (câte o valoare per jucător; lipsă = dimensiuni
+    aleatoare mici, determinate de seed). Plățile vin dintr-un generator NumPy cu seed propriu.
+    Întoarce (TensorGame, echilibre pure, text); ValueError pentru dimensiuni invalide.
+    """
+    rng = np.random.default_rng(seed)
+    strategies = _resolve_strategies(rng, params or {})
+    payoffs = rng.integers(NASH_MIN_PAYOFF, NASH_MAX_PAYOFF + 1, size=strategies + (len(strategies),),
+                           dtype=np.int16)
+    game = TensorGame(payoffs)
+    equilibria = solve_pure_nash_tensor(game.player_payoffs())
+
+    text_data = {
+        "title": NASH_TENSOR_TEXT_RO["title"],
+        "description": NASH_TENSOR_TEXT_RO["description"].format(
+            players=game.players, strategies=" x ".join(str(s) for s in strategies)),
+        "requirement": NASH_TENSOR_TEXT_RO["requirement"]
+    }
+    return game, equilibria, text_data
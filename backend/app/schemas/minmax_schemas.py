@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 
 # --- Sub-schemas for Text Content ---
@@ -12,7 +12,7 @@ class MinMaxProblemText(BaseModel):
 # Folosim recursivitate pentru a defini structura arborelui
 class MinMaxNode(BaseModel):
     name: str
-    node_type: str  # "MIN" sau "MAX"
+    node_type: str  # "MIN", "MAX" sau "CHANCE"
     value: Optional[int] = None
     children: List['MinMaxNode'] = []
 
@@ -20,19 +20,41 @@ class MinMaxNode(BaseModel):
 MinMaxNode.update_forward_refs()
 
 
+# Format compact: aritățile nodurilor în ordine BFS + valorile frunzelor (tot BFS).
+# Numele (R, R1, R12, ...) și tipurile se deduc din poziție și din tipul rădăcinii.
+class MinMaxCompactTree(BaseModel):
+    root_type: str
+    arity: List[int]
+    values: List[int]
+    chance_nodes: bool = False  # nivelurile impare sunt noduri CHANCE
+
+
 # --- Request Body for Generation ---
 class MinMaxGenerateRequest(BaseModel):
     random_depth: bool = True
     depth: Optional[int] = None
     random_root: bool = True
     is_maximizing_player: Optional[bool] = None  # True = MAX, False = MIN
+    image_format: str = "svg"  # "svg" (randare în proces) sau "png" (Graphviz)
+    inline_image: bool = False  # True = imaginea este inclusă și în răspuns (base64)
+    tree_format: str = "nested"  # "nested" (MinMaxNode recursiv) sau "compact"
+    source: str = "random"  # "random" (arbore aleator), "tictactoe" sau "nim" (poziție dintr-un joc real)
+    chance_nodes: bool = False  # True = arbore expectiminimax (niveluri CHANCE între MAX și MIN)
+    algorithm: str = "alphabeta"  # "alphabeta", "pvs" (NegaScout) sau "mtdf"
+    # Ținte de tăiere (doar arbori aleatori fără CHANCE): valorile frunzelor sunt construite astfel încât
+    # Alpha-Beta să viziteze exact atâtea frunze (cel mai apropiat număr posibil) sau să facă cel puțin atâtea tăieri
+    target_visited: Optional[int] = None
+    min_cutoffs: Optional[int] = None
 
 
 class MinMaxProblemResponse(BaseModel):
     seed: int
-    tree: MinMaxNode
+    tree: Optional[MinMaxNode] = None
+    tree_compact: Optional[MinMaxCompactTree] = None
     difficulty: str = "EASY"
     tree_image_base64: Optional[str] = None
+    tree_image_mime: str = "image/svg+xml"
+    tree_image_url: Optional[str] = None
     text: MinMaxProblemText
     root_type: str = "MAX" 
 
@@ -40,18 +62,80 @@ class MinMaxProblemResponse(BaseModel):
         orm_mode = True 
 
 
-class MinMaxAnswerRequest(BaseModel):
-    """Ce trimite Frontend-ul când utilizatorul răspunde."""
-    problem_seed: int
-    root_value: int
-    visited_nodes: int
-    
-    # --- MODIFICARE: Adăugăm parametrii de configurare pentru reconstrucția fidelă ---
+class MinMaxGenerationParams(BaseModel):
+    """Parametrii de generare trimiși înapoi de Frontend, pentru reconstrucția fidelă a arborelui."""
     # Aceștia sunt necesari pentru ca validatorul să știe dacă userul a forțat anumite setări
     generated_random_depth: bool = True
     generated_depth: Optional[int] = None
     generated_random_root: bool = True
     generated_is_maximizing: Optional[bool] = None
+    generated_source: str = "random"
+    generated_chance_nodes: bool = False
+    generated_algorithm: str = "alphabeta"
+    generated_target_visited: Optional[int] = None
+    generated_min_cutoffs: Optional[int] = None
+
+
+class MinMaxAnswerRequest(MinMaxGenerationParams):
+    """Ce trimite Frontend-ul când utilizatorul răspunde."""
+    problem_seed: int
+    root_value: float  # fracționară pentru arborii cu noduri CHANCE
+    visited_nodes: int
+
+
+# --- Notare per nod (valoarea întoarsă și starea tăiat / vizitat) ---
+# Tabelul de adnotări este int32: valorile din afara acestui interval nu pot fi corecte
+MINMAX_NODE_VALUE_MIN = -(2 ** 31)
+MINMAX_NODE_VALUE_MAX = 2 ** 31 - 1
+
+
+class MinMaxNodeAnswer(BaseModel):
+    name: str  # R, R1, R12, ...
+    # ignorată pentru nodurile tăiate
+    value: Optional[int] = Field(None, ge=MINMAX_NODE_VALUE_MIN, le=MINMAX_NODE_VALUE_MAX)
+    pruned: bool = False
+
+
+class MinMaxNodeAnswersRequest(MinMaxGenerationParams):
+    problem_seed: int
+    nodes: List[MinMaxNodeAnswer]
+
+
+class MinMaxNodeAnnotation(BaseModel):
+    name: str
+    value: Optional[int] = None
+    alpha: Optional[int] = None  # None = -infinit
+    beta: Optional[int] = None  # None = +infinit
+    pruned: bool
+
+
+class MinMaxNodeEvaluationResponse(BaseModel):
+    percentage: int
+    correct_nodes: int
+    total_nodes: int
+    corrections: List[MinMaxNodeAnnotation] = []  # adnotările corecte ale nodurilor greșite sau lipsă
+    explanation: str
+
+
+# --- Analiză aproximativă (MCTS) vs exactă (Alpha-Beta) ---
+class MinMaxChildEstimate(BaseModel):
+    name: str
+    visits: int
+    value_estimate: Optional[float] = None
+    exact_value: int
+
+
+class MinMaxAnalysisResponse(BaseModel):
+    seed: int
+    root_type: str
+    exact_value: int
+    alpha_beta_leaves_visited: int
+    playouts: int
+    mcts_value_estimate: float
+    mcts_best_child: Optional[str] = None
+    exact_best_child: Optional[str] = None
+    mcts_leaves_evaluated: int
+    children: List[MinMaxChildEstimate] = []
 
 
 class EvaluationResponse(BaseModel):
@@ -24,22 +24,109 @@ class NashMatrix(BaseModel):
     grid: List[List[Tuple[int, int]]]
 
 
+class NashCompactMatrix(BaseModel):
+    """
+    Matricea de plăți ca tablou int16 little-endian de forma (rows, cols, 2), în ordinea
+    rândurilor: p1, p2 pentru celula (0, 0), apoi (0, 1), ...
+    encoding "base64": octeții tabloului în `data`; encoding "flat": valorile în `payoffs`.
+    """
+    rows: int
+    cols: int
+    encoding: str
+    dtype: str = "<i2"
+    data: Optional[str] = None
+    payoffs: Optional[List[int]] = None
+
+
+class NashTensorGame(BaseModel):
+    """
+    Plățile unui joc cu N jucători, ca tablou int16 little-endian de forma (s_1, ..., s_N, N),
+    în ordinea profilurilor (ultimul jucător variază cel mai repede), cu plățile celor N
+    jucători pentru fiecare profil. encoding "base64": octeții în `data`; "flat": valorile în `payoffs`.
+    """
+    players: int
+    strategies: List[int]
+    encoding: str
+    dtype: str = "<i2"
+    data: Optional[str] = None
+    payoffs: Optional[List[int]] = None
+
+
+class NashExtensiveTree(BaseModel):
+    """
+    Arborele unui joc în formă extinsă, în ordine BFS (ca MinMaxCompactTree).
+    arity: numărul de copii al fiecărui nod; movers: jucătorul care mută (-1 pentru frunze);
+    payoffs: plățile tuturor jucătorilor în fiecare frunză, concatenate în ordinea BFS a frunzelor.
+    """
+    players: int
+    arity: List[int]
+    movers: List[int]
+    payoffs: List[int]
+
+
 # --- Request Body for Generation ---
 class NashGenerateRequest(BaseModel):
     rows: int = 3
     cols: int = 3
     random_size: bool = False
+    large_game: bool = False  # True = dimensiuni până la NASH_LARGE_MAX_SIZE (solver vectorizat)
+    # "pure" (echilibru pur), "mixed" (strategii mixte), "zero_sum" (sumă nulă) sau "iesds" (strategii dominate)
+    problem_type: str = "pure"
+    matrix_format: str = "grid"  # "grid" (NashMatrix), "base64" sau "flat" (NashCompactMatrix, pentru jocuri mari)
+    editable: bool = False  # True = se deschide o sesiune de editare (vezi /edit/nash/{session_id})
+    # Numărul exact de echilibre pure cerut (None = matrice aleatoare oarecare)
+    target_equilibria: Optional[int] = None
 
 
 class NashProblemResponse(BaseModel):
     """Ce trimite API-ul când se cere o problemă Nash."""
     seed: int
-    matrix: NashMatrix
+    matrix: Optional[NashMatrix] = None
+    matrix_compact: Optional[NashCompactMatrix] = None
     text: ProblemText
     difficulty: str = "Custom"
+    problem_type: str = "pure"
+    # Doar în modul editor: sesiunea de editare și echilibrele pure curente
+    editor_session: Optional[str] = None
+    editor_equilibria: Optional[List[Tuple[int, int]]] = None
+
+
+class NashTensorGenerateRequest(BaseModel):
+    players: int = 3
+    strategies: Optional[List[int]] = None  # câte o valoare per jucător (None = dimensiuni aleatoare)
+    matrix_format: str = "flat"  # "flat" sau "base64"
+
+
+class NashTensorProblemResponse(BaseModel):
+    seed: int
+    game: NashTensorGame
+    text: ProblemText
+    difficulty: str = "Custom"
+
+
+class NashExtensiveGenerateRequest(BaseModel):
+    players: int = 2
+    depth: Optional[int] = None  # None = adâncime aleatoare (arbori mici)
+    max_breadth: Optional[int] = None  # numărul maxim de acțiuni într-un nod
+
+
+class NashExtensiveProblemResponse(BaseModel):
+    seed: int
+    tree: NashExtensiveTree
+    text: ProblemText
+    difficulty: str = "Custom"
+
+
+class NashGenerationParams(BaseModel):
+    """Parametrii de generare trimiși înapoi de Frontend, pentru reconstrucția exactă a problemei."""
+    rows: int = 3
+    cols: int = 3
+    random_size: bool = False
+    large_game: bool = False
+    target_equilibria: Optional[int] = None
 
 
-class NashAnswerRequest(BaseModel):
+class NashAnswerRequest(NashGenerationParams):
     """
     Ce trimite Frontend-ul când utilizatorul răspunde.
     Include acum și parametrii de configurare pentru a asigura reproductibilitatea.
@@ -47,11 +134,75 @@ class NashAnswerRequest(BaseModel):
     problem_seed: int
     has_equilibrium: bool
     equilibrium_point: Optional[Tuple[int, int]] = None
+    # Modul editor: răspunsul se notează pe matricea editată din sesiune, nu pe cea din seed
+    editor_session: Optional[str] = None
 
-    # Parametri necesari pentru reconstrucția exactă a problemei
-    rows: int = 3
-    cols: int = 3
-    random_size: bool = False
+
+class NashMixedAnswerRequest(NashGenerationParams):
+    """Răspunsul pentru problemele în strategii mixte: câte o distribuție de probabilitate per jucător."""
+    problem_seed: int
+    row_strategy: List[float]
+    col_strategy: List[float]
+
+
+class NashZeroSumAnswerRequest(NashGenerationParams):
+    """Răspunsul pentru jocurile de sumă nulă: valoarea jocului și o strategie optimă a Jucătorului 1."""
+    problem_seed: int
+    value: float
+    row_strategy: List[float]
+
+
+class NashIesdsAnswerRequest(NashGenerationParams):
+    """Răspunsul pentru eliminarea iterată a strategiilor strict dominate: strategiile rămase."""
+    problem_seed: int
+    rows_remaining: List[int]
+    cols_remaining: List[int]
+
+
+class NashTensorAnswerRequest(BaseModel):
+    """Răspunsul pentru jocurile cu N jucători, cu parametrii de generare pentru reconstrucție."""
+    players: int = 3
+    strategies: Optional[List[int]] = None
+    problem_seed: int
+    has_equilibrium: bool
+    equilibrium_profile: Optional[List[int]] = None
+
+
+class NashExtensiveAnswerRequest(BaseModel):
+    """Drumul de echilibru propus (acțiunile de la rădăcină), cu parametrii de generare."""
+    players: int = 2
+    depth: Optional[int] = None
+    max_breadth: Optional[int] = None
+    problem_seed: int
+    path: List[int]
+
+
+class NashDynamicsRequest(NashGenerationParams):
+    """Simularea dinamicilor evolutive pe jocul identificat de seed și parametrii de generare."""
+    problem_seed: int
+    problem_type: str = "pure"
+    rule: str = "replicator"  # "replicator" sau "best_response"
+    populations: int = 32  # traiectorii simulate simultan
+    steps: int = 1000
+    step_size: float = 0.5
+    stride: int = 10  # un eșantion la fiecare `stride` pași
+    sampled: int = 4  # câte traiectorii apar în eșantioane
+    dynamics_seed: int = 0  # stările inițiale
+
+
+class NashCellUpdateRequest(BaseModel):
+    """Modificarea unei celule în modul editor."""
+    row: int
+    col: int
+    p1: int
+    p2: int
+
+
+class NashCellUpdateResponse(BaseModel):
+    session_id: str
+    equilibria: List[Tuple[int, int]]
+    added: List[Tuple[int, int]] = []
+    removed: List[Tuple[int, int]] = []
 
 
 class NashEvaluationResponse(BaseModel):
@@ -0,0 +1,66 @@
+"""
+Benchmark și statistici de calibrare: rezolvarea în lot (NumPy) vs. bucla cu `_alpha_beta`,
+pe aceiași arbori deja generați. Generarea (o buclă Python per seed) este măsurată separat:
+ea nu este accelerată de rezolvarea în lot.
+
+Rulare (din directorul backend/):
+    python -m benchmarks.minmax_batch [--seeds 5000] [--depth 6]
+"""
+import argparse
+import time
+
+from app.logic.minmax.batch import generate_minmax_trees, solve_minmax_batch
+from app.logic.minmax.solver import AlphaBetaStats, _alpha_beta
+
+
+def _best_of(repeats: int, function):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seeds", type=int, default=5000)
+    parser.add_argument("--depth", type=int, default=None, help="adâncime fixă (implicit: aleatoare)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    params = None
+    if args.depth is not None:
+        params = {"random_depth": False, "depth": args.depth, "random_root": True}
+
+    start = time.perf_counter()
+    trees = generate_minmax_trees(range(args.seeds), params)
+    generation_time = time.perf_counter() - start
+
+    def scalar():
+        results = []
+        for tree in trees:
+            stats = AlphaBetaStats()
+            results.append((_alpha_beta(tree, stats), stats.leaves_visited))
+        return results
+
+    loop_time, loop = _best_of(args.repeats, scalar)
+    batch_time, result = _best_of(args.repeats, lambda: solve_minmax_batch(trees))
+
+    batch = list(zip(result.root_values.tolist(), result.leaves_visited.tolist()))
+    assert batch == loop
+
+    print(f"trees: {args.seeds}, nodes: {len(result.node_values)}")
+    print(f"generate_minmax_trees (o dată):  {generation_time:8.3f} s")
+    print(f"_alpha_beta, buclă:              {loop_time:8.3f} s")
+    print(f"solve_minmax_batch:              {batch_time:8.3f} s  (x{loop_time / batch_time:.2f})")
+    print()
+    print(f"{'depth':>5} {'trees':>7} {'visited (mean)':>15} {'p10/p50/p90':>14} {'pruned':>7}")
+    for depth, stats in result.distribution_by_depth().items():
+        percentiles = "/".join(f"{p:g}" for p in stats["leaves_visited_percentiles"])
+        print(f"{depth:>5} {stats['trees']:>7} {stats['leaves_visited_mean']:>15.2f} {percentiles:>14} "
+              f"{stats['pruned_fraction_mean']:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
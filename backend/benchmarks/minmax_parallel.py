@@ -0,0 +1,72 @@
+"""
+Benchmark: Alpha-Beta secvențial (`_alpha_beta`) vs. căutarea paralelă (YBWC) pe pool de procese.
+
+Coloana `work` este raportul dintre frunzele căutate de varianta paralelă (inclusiv frații
+speculativi și recăutările) și frunzele căutării secvențiale; accelerarea maximă posibilă
+este aproximativ workers / work, deci are sens doar cu cel puțin 2 nuclee libere.
+
+Rulare (din directorul backend/):
+    python -m benchmarks.minmax_parallel [--workers 4] [--seeds 3]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.logic.common.seed import get_rng
+from app.logic.minmax.constructive import construct_leaf_values
+from app.logic.minmax.parallel import parallel_alpha_beta
+from app.logic.minmax.solver import AlphaBetaStats, _alpha_beta, _generate_flat_tree
+
+# (adâncime, lățime minimă, lățime maximă, fără tăieri)
+# Arborii aleatori (~0.5-6 milioane de noduri) sunt tăiați puternic: Alpha-Beta vizitează ~1%
+# din frunze, iar căutarea rămâne pe loc. Arborii fără tăieri (valori construite astfel încât
+# toate frunzele să fie vizitate) sunt cei pentru care frații se trimit worker-ilor.
+CONFIGURATIONS = [
+    (12, 2, 4, False),
+    (9, 4, 6, False),
+    (8, 6, 8, False),
+    (7, 3, 5, True),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--seeds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU, {args.workers} workers")
+    print(f"{'depth':>5} {'breadth':>8} {'nodes':>9} {'leaves':>9} {'visited':>9} "
+          f"{'work':>6} {'tasks':>6} {'seq (s)':>9} {'par (s)':>9} {'speedup':>8}")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # Pornim procesele înainte de măsurători
+        list(executor.map(abs, range(args.workers)))
+
+        for depth, min_breadth, max_breadth, no_cutoffs in CONFIGURATIONS:
+            for seed in range(args.seeds):
+                tree = _generate_flat_tree(depth, True, get_rng(seed), min_breadth, max_breadth)
+                if no_cutoffs:
+                    tree = construct_leaf_values(tree, target_visited=tree.leaf_count)
+
+                start = time.perf_counter()
+                stats = AlphaBetaStats()
+                value = _alpha_beta(tree, stats)
+                sequential = time.perf_counter() - start
+
+                start = time.perf_counter()
+                result = parallel_alpha_beta(tree, executor, workers=args.workers)
+                parallel = time.perf_counter() - start
+
+                assert result.root_value == value
+                assert result.leaves_visited == stats.leaves_visited
+
+                print(f"{depth:>5} {f'{min_breadth}-{max_breadth}':>8} {len(tree):>9} {tree.leaf_count:>9} "
+                      f"{stats.leaves_visited:>9} {result.leaves_searched / stats.leaves_visited:>6.2f} "
+                      f"{result.tasks:>6} {sequential:>9.3f} {parallel:>9.3f} "
+                      f"{sequential / parallel:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: Alpha-Beta (`_alpha_beta`) vs. PVS (NegaScout) vs. MTD(f), pe adâncimi crescătoare.
+
+Pentru fiecare variantă se raportează frunzele distincte vizitate, evaluările totale de frunze
+(inclusiv re-căutări / treceri repetate) și timpul total.
+
+Rulare (din directorul backend/):
+    python -m benchmarks.minmax_variants [--seeds 50] [--breadth 2-4]
+"""
+import argparse
+import time
+
+from app.logic.common.seed import get_rng
+from app.logic.minmax.solver import AlphaBetaStats, _alpha_beta, _generate_flat_tree
+from app.logic.minmax.variants import SEARCH_VARIANTS, SearchStats
+
+DEPTHS = [2, 4, 6, 8, 10]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seeds", type=int, default=50)
+    parser.add_argument("--breadth", default="2-4", help="lățimea minimă și maximă, ex. 2-4")
+    args = parser.parse_args()
+    min_breadth, max_breadth = (int(part) for part in args.breadth.split("-"))
+
+    print(f"{'depth':>5} {'algorithm':>10} {'distinct':>10} {'evaluations':>12} {'time (s)':>9}")
+    for depth in DEPTHS:
+        trees = [_generate_flat_tree(depth, seed % 2 == 0, get_rng(seed), min_breadth, max_breadth)
+                 for seed in range(args.seeds)]
+
+        start = time.perf_counter()
+        reference = []
+        visited = 0
+        for tree in trees:
+            stats = AlphaBetaStats()
+            reference.append(_alpha_beta(tree, stats))
+            visited += stats.leaves_visited
+        elapsed = time.perf_counter() - start
+        print(f"{depth:>5} {'alphabeta':>10} {visited:>10} {visited:>12} {elapsed:>9.3f}")
+
+        for name, search in SEARCH_VARIANTS.items():
+            start = time.perf_counter()
+            distinct = evaluations = 0
+            for tree, expected in zip(trees, reference):
+                stats = SearchStats()
+                assert search(tree, stats) == expected
+                distinct += stats.leaves_visited
+                evaluations += stats.leaf_evaluations
+            elapsed = time.perf_counter() - start
+            print(f"{depth:>5} {name:>10} {distinct:>10} {evaluations:>12} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: timpii pe jocurile mari, scoși din teste (acolo se verifică doar rezultatele):
+  - echilibrele pure ale unei matrice N x N (`solve_pure_nash_arrays`)
+  - actualizările incrementale din editor (`BestResponseIndex.update`) vs. o rezolvare completă
+  - inducția inversă pe un arbore extensiv de ~1 milion de noduri (`backward_induction`)
+
+Rulare (din directorul backend/):
+    python -m benchmarks.nash_large [--size 2000] [--updates 200] [--depth 12]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.logic.nash.editor import BestResponseIndex
+from app.logic.nash.extensive import backward_induction, generate_and_solve_extensive
+from app.logic.nash.packed import PackedNashMatrix
+from app.logic.nash.solver import solve_pure_nash_arrays
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=12, help="adâncimea arborelui extensiv (lățime maximă 4)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    p1, p2 = rng.integers(-5, 11, size=(2, args.size, args.size))
+
+    start = time.perf_counter()
+    equilibria = solve_pure_nash_arrays(p1, p2)
+    solve_time = time.perf_counter() - start
+    print(f"solve_pure_nash_arrays {args.size}x{args.size}: {solve_time:8.3f} s  ({len(equilibria)} echilibre)")
+
+    index = BestResponseIndex(PackedNashMatrix.from_arrays(p1, p2))
+    cells = rng.integers(0, args.size, size=(args.updates, 2))
+    start = time.perf_counter()
+    for row, col in cells.tolist():
+        index.update(row, col, 10, 10)
+    update_time = (time.perf_counter() - start) / args.updates
+    print(f"BestResponseIndex.update:          {update_time * 1e3:8.3f} ms / celulă "
+          f"(x{solve_time / update_time:.0f} față de rezolvarea completă)")
+
+    game, _, _ = generate_and_solve_extensive(1, {"players": 3, "depth": args.depth, "max_breadth": 4})
+    start = time.perf_counter()
+    backward_induction(game)
+    print(f"backward_induction, {len(game)} noduri: {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
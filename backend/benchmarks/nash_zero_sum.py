@@ -0,0 +1,49 @@
+"""
+Benchmark: simplexul pentru jocuri de sumă nulă (`solve_zero_sum`) vs. enumerarea suporturilor
+(forță brută), pe matrice pătrate aleatoare de dimensiuni crescătoare.
+
+Enumerarea suporturilor este exponențială și rulează doar până la --max-brute; pentru
+dimensiunile mari se raportează doar simplexul. Valorile celor două metode sunt comparate.
+
+Rulare (din directorul backend/):
+    python -m benchmarks.nash_zero_sum [--games 20] [--max-brute 7]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.logic.common.difficulty import NASH_MAX_PAYOFF, NASH_MIN_PAYOFF
+from app.logic.nash.zero_sum import solve_zero_sum, support_enumeration_zero_sum
+
+SIZES = [3, 5, 7, 10, 50, 100, 200, 500]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--max-brute", type=int, default=7, help="dimensiunea maximă pentru enumerarea suporturilor")
+    args = parser.parse_args()
+
+    print(f"{'size':>5} {'games':>6} {'simplex (s)':>12} {'exact':>6} {'brute (s)':>10}")
+    for size in SIZES:
+        rng = np.random.default_rng(size)
+        games = rng.integers(NASH_MIN_PAYOFF, NASH_MAX_PAYOFF + 1, size=(args.games, size, size))
+
+        start = time.perf_counter()
+        solutions = [solve_zero_sum(game) for game in games]
+        simplex_time = time.perf_counter() - start
+        exact = sum(solution.exact for solution in solutions)
+
+        brute = "-"
+        if size <= args.max_brute:
+            start = time.perf_counter()
+            for game, solution in zip(games, solutions):
+                reference = support_enumeration_zero_sum(game)
+                assert reference is not None and abs(reference.value - solution.value) < 1e-7
+            brute = f"{time.perf_counter() - start:.3f}"
+        print(f"{size:>5} {args.games:>6} {simplex_time:>12.3f} {exact:>6} {brute:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.minmax.routes import router as minmax_router
+from app.api.nash.routes import router as nash_router
+from app.logic.common.difficulty import MINMAX_L6_MAX_BREADTH, MINMAX_L6_MIN_BREADTH
+from app.logic.minmax.solver import _generate_flat_tree
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Client pentru rutele MinMax și Nash, montate ca în aplicație (prefixul /api)."""
+    app = FastAPI()
+    app.include_router(minmax_router, prefix="/api")
+    app.include_router(nash_router, prefix="/api")
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def random_trees():
+    """
+    Fabrică de arbori aleatori reproductibili: arborele i vine din random.Random(i), cu adâncimea
+    între min_depth și max_depth și rădăcina MAX sau MIN alese din același generator.
+    """
+    def make(count, min_depth=1, max_depth=7, min_breadth=MINMAX_L6_MIN_BREADTH,
+             max_breadth=MINMAX_L6_MAX_BREADTH, chance_nodes=False):
+        for seed in range(count):
+            rng = random.Random(seed)
+            yield _generate_flat_tree(rng.randint(min_depth, max_depth), rng.random() < 0.5, rng,
+                                      min_breadth, max_breadth, chance_nodes=chance_nodes)
+    return make
@@ -0,0 +1,111 @@
+import numpy as np
+
+from app.logic.minmax.annotations import (
+    ANNOTATION_MISSING,
+    annotate_alpha_beta,
+    decode_bound,
+    grade_node_answers,
+)
+from app.logic.minmax.solver import (
+    AlphaBetaStats,
+    _alpha_beta,
+    fixed_tree_params,
+    iter_alpha_beta_trace,
+    solve_minmax,
+)
+
+
+def test_annotations_match_the_search_and_the_trace(random_trees):
+    for tree in random_trees(100):
+        stats, reference = AlphaBetaStats(), AlphaBetaStats()
+        annotations = annotate_alpha_beta(tree, stats)
+        assert annotations.root_value == _alpha_beta(tree, reference)
+        assert stats.leaves_visited == reference.leaves_visited
+        assert stats.cutoffs_per_depth == reference.cutoffs_per_depth
+
+        names = tree.node_names()
+        visited_leaves = [names[i] for i in range(len(tree)) if tree.arity[i] == 0 and not annotations.pruned[i]]
+        assert len(visited_leaves) == reference.leaves_visited
+
+        # Ieșirile din trace dau valorile, iar ultima actualizare a fiecărui nod dă fereastra finală
+        index_by_name = {name: i for i, name in enumerate(names)}
+        windows = {}
+        for event in iter_alpha_beta_trace(tree):
+            if event["t"] in ("exit", "leaf"):
+                node = index_by_name[event["n"]]
+                assert not annotations.pruned[node]
+                assert annotations.values[node] == event["v"]
+            elif event["t"] == "update":
+                windows[index_by_name[event["n"]]] = (event["a"], event["b"])
+        for node, window in windows.items():
+            assert (decode_bound(annotations.alpha[node]), decode_bound(annotations.beta[node])) == window
+
+
+def test_pruned_nodes_have_no_value(random_trees):
+    tree = next(tree for tree in random_trees(50) if annotate_alpha_beta(tree).pruned.any())
+    annotations = annotate_alpha_beta(tree)
+
+    assert (annotations.values[annotations.pruned] == ANNOTATION_MISSING).all()
+    assert annotations.nbytes == len(tree) * 13
+
+
+def test_grading_a_full_submission(random_trees):
+    tree = next(tree for tree in random_trees(50) if annotate_alpha_beta(tree).pruned.any())
+    annotations = annotate_alpha_beta(tree)
+    nodes = np.arange(len(tree))
+
+    perfect = grade_node_answers(annotations, nodes, annotations.values, annotations.pruned)
+    assert perfect.percentage == 100 and len(perfect.wrong) == 0
+
+    # Valoarea unui nod tăiat nu contează; starea lui da
+    values = annotations.values.astype(np.int64)
+    values[annotations.pruned] = 7
+    assert grade_node_answers(annotations, nodes, values, annotations.pruned).percentage == 100
+
+    pruned = annotations.pruned.copy()
+    wrong = int(np.flatnonzero(pruned)[0])
+    pruned[wrong] = False
+    grade = grade_node_answers(annotations, nodes, annotations.values, pruned)
+    assert grade.wrong.tolist() == [wrong]
+    assert grade.correct == len(tree) - 1
+
+    partial = grade_node_answers(annotations, nodes[:1], annotations.values[:1], annotations.pruned[:1])
+    assert partial.correct == 1 and len(partial.wrong) == len(tree) - 1
+
+
+def test_evaluate_nodes_endpoint(client):
+    params = fixed_tree_params(4, "MAX")
+    solution = solve_minmax(11, params, annotate=True)
+    annotations = solution.annotations
+    names = solution.tree.node_names()
+    reconstruction = {
+        "problem_seed": 11,
+        "generated_random_depth": False,
+        "generated_depth": 4,
+        "generated_random_root": False,
+        "generated_is_maximizing": True,
+    }
+
+    nodes = [
+        {"name": name, "value": int(annotations.values[i]), "pruned": bool(annotations.pruned[i])}
+        for i, name in enumerate(names)
+    ]
+    data = client.post("/api/evaluate/minmax/nodes", json={**reconstruction, "nodes": nodes}).json()
+    assert data["percentage"] == 100 and data["corrections"] == []
+
+    nodes[0]["value"] += 1
+    data = client.post("/api/evaluate/minmax/nodes", json={**reconstruction, "nodes": nodes}).json()
+    assert data["correct_nodes"] == len(names) - 1
+    assert data["corrections"] == [{
+        "name": "R", "value": solution.root_value, "alpha": decode_bound(annotations.alpha[0]),
+        "beta": None, "pruned": False,
+    }]
+
+    response = client.post("/api/evaluate/minmax/nodes",
+                           json={**reconstruction, "nodes": nodes, "generated_algorithm": "pvs"})
+    assert response.status_code == 400
+
+    # Valorile din afara int32 sunt respinse de schemă, nu ajung la conversia NumPy
+    nodes[0]["value"] = 10 ** 30
+    response = client.post("/api/evaluate/minmax/nodes", json={**reconstruction, "nodes": nodes})
+    assert response.status_code == 422
@@ -0,0 +1,72 @@
+from array import array
+
+import pytest
+
+from app.logic.minmax.batch import generate_minmax_trees, solve_flat_trees_batch, solve_minmax_batch
+from app.logic.minmax.solver import fixed_tree_params, solve_minmax
+from app.logic.minmax.tree import FlatTree, NODE_MAX
+
+
+def _assert_matches_scalar(seeds, params):
+    result = solve_minmax_batch(generate_minmax_trees(seeds, params))
+    for i, seed in enumerate(seeds):
+        solution = solve_minmax(seed, params)
+        assert result.root_values[i] == solution.root_value
+        assert result.leaves_visited[i] == solution.stats.leaves_visited
+        assert result.cutoffs[i] == solution.stats.total_cutoffs
+        assert result.depths[i] == solution.depth
+        assert result.root_is_max[i] == (solution.root_type == "MAX")
+
+
+def test_batch_matches_scalar_solver_for_random_params():
+    _assert_matches_scalar(list(range(600)), None)
+
+
+def test_batch_matches_scalar_solver_for_deep_trees():
+    _assert_matches_scalar(list(range(100)), {"random_depth": False, "depth": 9, "random_root": True})
+
+
+def test_batch_matches_scalar_solver_for_game_trees():
+    # Frunzele apar pe mai multe niveluri, iar valorile pot fi negative
+    _assert_matches_scalar(list(range(40)), fixed_tree_params(3, "MIN", "tictactoe"))
+
+
+def test_single_leaf_tree():
+    leaf = FlatTree(array("i", [0]), array("i", [7]), array("b", [NODE_MAX]))
+    solved = solve_flat_trees_batch([leaf, solve_minmax(1, fixed_tree_params(4, "MAX")).tree])
+
+    assert solved["root_values"][0] == 7
+    assert solved["leaves_visited"][0] == 1
+
+
+def test_distribution_by_depth():
+    result = solve_minmax_batch(generate_minmax_trees(range(300)))
+    summary = result.distribution_by_depth()
+
+    assert sum(stats["trees"] for stats in summary.values()) == 300
+    for depth, stats in summary.items():
+        assert sum(stats["root_values"].values()) == stats["trees"]
+        assert 0 <= stats["pruned_fraction_mean"] < 1
+
+
+def test_chance_trees_are_rejected():
+    with pytest.raises(ValueError):
+        generate_minmax_trees(range(3), {"chance_nodes": True})
+
+
+def _minimax_values(tree):
+    """Referința: valoarea minimax a fiecărui nod, de jos în sus (copiii au indici mai mari)."""
+    values = list(tree.values)
+    for node in range(len(tree) - 1, -1, -1):
+        if tree.arity[node]:
+            children = values[tree.offsets[node]:tree.offsets[node] + tree.arity[node]]
+            values[node] = max(children) if tree.types[node] == NODE_MAX else min(children)
+    return values
+
+
+def test_node_values_are_exact_minimax_values():
+    trees = generate_minmax_trees(range(50), {"random_depth": False, "depth": 5, "random_root": True})
+    result = solve_minmax_batch(trees)
+    assert len(result.node_values) == sum(len(tree) for tree in trees)
+    for i, tree in enumerate(trees):
+        assert result.tree_values(i).tolist() == _minimax_values(tree)
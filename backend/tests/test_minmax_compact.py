@@ -0,0 +1,51 @@
+from app.api.minmax.routes import MINMAX_COMPACT_MEDIA_TYPE
+from app.logic.minmax.solver import (
+    AlphaBetaStats,
+    _alpha_beta,
+    build_compact_tree,
+    build_schema_tree,
+    fixed_tree_params,
+    solve_minmax,
+)
+from app.logic.minmax.tree import FlatTree
+
+
+def test_compact_round_trip_rebuilds_nested_tree():
+    for seed in range(20):
+        solution = solve_minmax(seed, fixed_tree_params(5, "MIN" if seed % 2 else "MAX"))
+        compact = build_compact_tree(solution.tree)
+
+        decoded = FlatTree.from_compact(compact.arity, compact.values, compact.root_type)
+
+        assert build_schema_tree(decoded) == build_schema_tree(solution.tree)
+        stats = AlphaBetaStats()
+        assert _alpha_beta(decoded, stats) == solution.root_value
+        assert stats.leaves_visited == solution.stats.leaves_visited
+
+
+def test_nested_format_is_default(client):
+    data = client.post("/api/generate/minmax", json={}).json()
+
+    assert data["tree"]["name"] == "R"
+    assert data["tree_compact"] is None
+
+
+def test_compact_format_by_request_parameter(client):
+    data = client.post("/api/generate/minmax", json={"tree_format": "compact"}).json()
+
+    assert data["tree"] is None
+    compact = data["tree_compact"]
+    assert compact["root_type"] == data["root_type"]
+    assert len(compact["values"]) == compact["arity"].count(0)
+    assert sum(compact["arity"]) == len(compact["arity"]) - 1
+
+
+def test_compact_format_by_accept_header(client):
+    response = client.post(
+        "/api/generate/minmax",
+        json={},
+        headers={"Accept": MINMAX_COMPACT_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["tree_compact"] is not None
@@ -0,0 +1,123 @@
+from app.logic.minmax.constructive import (
+    CONSTRUCTIVE_MAX_TARGET,
+    COUNT_CUTOFFS,
+    COUNT_LEAVES,
+    CutoffPlanner,
+    OUTCOME_MID,
+    _bits,
+    _count_bound,
+    construct_leaf_values,
+)
+from app.logic.common.seed import get_rng
+from app.logic.minmax.solver import AlphaBetaStats, _alpha_beta, _generate_flat_tree, fixed_tree_params, solve_minmax
+
+
+def _search(tree):
+    stats = AlphaBetaStats()
+    value = _alpha_beta(tree, stats)
+    return value, stats.leaves_visited, sum(stats.cutoffs_per_depth)
+
+
+def test_every_achievable_visited_count_is_hit_exactly(random_trees):
+    for tree in random_trees(120, min_depth=2, max_depth=6):
+        achievable = _bits(CutoffPlanner(tree).sets[0][0][OUTCOME_MID])
+        assert achievable[-1] == tree.leaf_count
+        for target in achievable:
+            built = construct_leaf_values(tree, target_visited=target)
+            assert _search(built)[1] == target
+            assert list(built.arity) == list(tree.arity)
+            # Peste 20 de valori distincte vizitate, intervalul se extinde la 1..m
+            assert all(1 <= value <= max(20, tree.leaf_count) for value in built.leaf_values())
+
+
+def test_min_cutoffs_is_met_when_possible(random_trees):
+    for tree in random_trees(120, min_depth=2, max_depth=6):
+        achievable = _bits(CutoffPlanner(tree, COUNT_CUTOFFS).sets[0][0][OUTCOME_MID])
+        for k in range(6):
+            cutoffs = _search(construct_leaf_values(tree, min_cutoffs=k))[2]
+            # Cel mai mic număr realizabil >= k, altfel maximul posibil pentru această formă
+            assert cutoffs == min([count for count in achievable if count >= k] or [achievable[-1]])
+
+
+def test_unreachable_target_falls_back_to_closest_count(random_trees):
+    tree = next(random_trees(1, min_depth=2, max_depth=6))
+    achievable = _bits(CutoffPlanner(tree).sets[0][0][OUTCOME_MID])
+    built = construct_leaf_values(tree, target_visited=10 * tree.leaf_count)
+
+    assert _search(built)[1] == achievable[-1]
+
+
+def test_solver_is_deterministic_and_keeps_the_shape():
+    params = fixed_tree_params(5, "MAX", target_visited=7)
+    first, second = solve_minmax(42, params), solve_minmax(42, params)
+    plain = solve_minmax(42, fixed_tree_params(5, "MAX"))
+
+    assert list(first.tree.values) == list(second.tree.values)
+    assert list(first.tree.arity) == list(plain.tree.arity)
+    assert first.stats.leaves_visited == min(
+        _bits(CutoffPlanner(plain.tree).sets[0][0][OUTCOME_MID]), key=lambda count: (abs(count - 7), count))
+
+
+def test_generate_and_evaluate_with_cutoff_target(client):
+    data = client.post("/api/generate/minmax", json={
+        "min_cutoffs": 2, "random_depth": False, "depth": 4, "random_root": False, "is_maximizing_player": True,
+    }).json()
+    assert "min_cutoffs=2" in data["tree_image_url"]
+
+    solution = solve_minmax(data["seed"], fixed_tree_params(4, "MAX", min_cutoffs=2))
+    answer = {
+        "problem_seed": data["seed"],
+        "root_value": solution.root_value,
+        "visited_nodes": solution.stats.leaves_visited,
+        "generated_random_depth": False,
+        "generated_depth": 4,
+        "generated_random_root": False,
+        "generated_is_maximizing": True,
+        "generated_min_cutoffs": 2,
+    }
+    assert client.post("/api/evaluate/minmax", json=answer).json()["percentage"] == 100
+
+
+def test_targets_are_rejected_outside_random_trees(client):
+    assert client.post("/api/generate/minmax", json={"target_visited": 3, "source": "nim"}).status_code == 400
+    assert client.post("/api/generate/minmax", json={"target_visited": 3, "chance_nodes": True}).status_code == 400
+    assert client.post("/api/generate/minmax", json={"target_visited": 3, "min_cutoffs": 1}).status_code == 400
+    too_many = CONSTRUCTIVE_MAX_TARGET + 1
+    assert client.post("/api/generate/minmax", json={"target_visited": too_many}).status_code == 400
+    assert client.get(f"/api/image/minmax/1?depth=4&root=MAX&min_cutoffs={too_many}").status_code == 400
+
+
+def test_targets_above_the_maximum_are_clamped(random_trees):
+    # Peste maximul realizabil se obține maximul, fără bitset-uri mai late decât arborele
+    for tree in random_trees(20, min_depth=2, max_depth=6):
+        for metric, option in ((COUNT_LEAVES, "target_visited"), (COUNT_CUTOFFS, "min_cutoffs")):
+            highest = _count_bound(tree, metric, maximum=True)
+            built = construct_leaf_values(tree, **{option: highest + 1000})
+            visited, cutoffs = _search(built)[1:]
+            assert (visited if metric == COUNT_LEAVES else cutoffs) == highest
+
+
+def test_capped_bitsets_keep_exact_counts_below_the_limit(random_trees):
+    limit = 9
+    for tree in random_trees(60, min_depth=2, max_depth=6):
+        for metric in (COUNT_LEAVES, COUNT_CUTOFFS):
+            full = CutoffPlanner(tree, metric).sets[0][0][OUTCOME_MID]
+            capped = CutoffPlanner(tree, metric, limit).sets[0][0][OUTCOME_MID]
+            assert capped & ((1 << limit) - 1) == full & ((1 << limit) - 1)
+            assert bool(capped >> limit) == bool(full >> limit)
+            assert _count_bound(tree, metric) == _bits(full)[0]
+            assert _count_bound(tree, metric, maximum=True) == _bits(full)[-1]
+
+
+def test_bitset_width_does_not_grow_with_the_tree():
+    # Costul per nod este proporțional cu lățimea bitset-urilor: cu limita fixă, costul total
+    # crește liniar cu numărul de noduri (arborii de aici au între ~100 și ~30000 de noduri)
+    limit = 12
+    for depth in (4, 6, 8):
+        tree = _generate_flat_tree(depth, True, get_rng(depth), 3, 4)
+        planner = CutoffPlanner(tree, COUNT_CUTOFFS, limit)
+        widths = [mask.bit_length() for node_sets in planner.sets for sets in node_sets for mask in sets]
+        assert max(widths) <= limit + 1
+
+        built = construct_leaf_values(tree, min_cutoffs=5)
+        assert _search(built)[2] == 5
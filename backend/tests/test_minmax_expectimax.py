@@ -0,0 +1,108 @@
+import random
+
+from app.logic.minmax.expectimax import expectimax_value, star_minimax
+from app.logic.minmax.solver import (
+    AlphaBetaStats,
+    _generate_flat_tree,
+    build_compact_tree,
+    build_schema_tree,
+    fixed_tree_params,
+    solve_minmax,
+)
+from app.logic.minmax.tree import FlatTree, NODE_CHANCE, NODE_MAX, NODE_MIN
+
+
+def test_chance_levels_alternate_with_decision_levels():
+    tree = _generate_flat_tree(5, True, random.Random(1), 2, 2, chance_nodes=True)
+    level_types = [tree.types[start] for start in tree.level_starts]
+
+    assert level_types == [NODE_MAX, NODE_CHANCE, NODE_MIN, NODE_CHANCE, NODE_MAX, NODE_CHANCE]
+
+
+def test_star_pruning_matches_plain_expectimax(random_trees):
+    for tree in random_trees(150, min_depth=2, min_breadth=1, max_breadth=4, chance_nodes=True):
+        reference = expectimax_value(tree)
+        for star2 in (False, True):
+            assert star_minimax(tree, star2=star2) == reference
+
+
+def test_star_pruning_skips_leaves(random_trees):
+    star1 = star2 = total = 0
+    for tree in random_trees(150, min_depth=2, min_breadth=1, max_breadth=4, chance_nodes=True):
+        stats1, stats2 = AlphaBetaStats(), AlphaBetaStats()
+        star_minimax(tree, stats1, star2=False)
+        star_minimax(tree, stats2, star2=True)
+        assert stats1.leaves_visited <= tree.leaf_count
+        assert stats2.leaves_visited <= tree.leaf_count
+        star1 += stats1.leaves_visited
+        star2 += stats2.leaves_visited
+        total += tree.leaf_count
+
+    assert star2 < star1 < total
+
+
+def test_windowed_search_returns_valid_bounds(random_trees):
+    rng = random.Random(9)
+    for tree in random_trees(150, min_depth=2, min_breadth=1, max_breadth=4, chance_nodes=True):
+        reference = expectimax_value(tree)
+        alpha = rng.uniform(0, 21)
+        beta = alpha + rng.uniform(0.1, 8)
+        value = star_minimax(tree, alpha=alpha, beta=beta)
+        if value <= alpha:
+            assert reference <= value
+        elif value >= beta:
+            assert reference >= value
+        else:
+            assert value == reference
+
+
+def test_compact_round_trip_keeps_chance_nodes():
+    solution = solve_minmax(5, fixed_tree_params(5, "MIN", chance_nodes=True))
+    compact = build_compact_tree(solution.tree)
+    decoded = FlatTree.from_compact(compact.arity, compact.values, compact.root_type, compact.chance_nodes)
+
+    assert compact.chance_nodes
+    assert build_schema_tree(decoded) == build_schema_tree(solution.tree)
+    assert build_schema_tree(decoded).children[0].node_type == "CHANCE"
+
+
+def test_generate_and_evaluate_chance_problem(client):
+    data = client.post("/api/generate/minmax", json={
+        "chance_nodes": True, "random_depth": False, "depth": 4, "random_root": False, "is_maximizing_player": True,
+    }).json()
+    assert "chance_nodes=true" in data["tree_image_url"]
+    assert data["tree"]["children"][0]["node_type"] == "CHANCE"
+
+    solution = solve_minmax(data["seed"], fixed_tree_params(4, "MAX", chance_nodes=True))
+    answer = {
+        "problem_seed": data["seed"],
+        "root_value": solution.root_value + 0.004,
+        "visited_nodes": solution.stats.leaves_visited,
+        "generated_random_depth": False,
+        "generated_depth": 4,
+        "generated_random_root": False,
+        "generated_is_maximizing": True,
+        "generated_chance_nodes": True,
+    }
+    assert client.post("/api/evaluate/minmax", json=answer).json()["percentage"] == 100
+
+    answer["root_value"] = solution.root_value + 0.5
+    assert client.post("/api/evaluate/minmax", json=answer).json()["percentage"] == 50
+
+
+def test_tolerance_applies_only_to_chance_trees(client):
+    solution = solve_minmax(11, fixed_tree_params(4, "MAX"))
+    answer = {
+        "problem_seed": 11,
+        "root_value": solution.root_value + 0.004,
+        "visited_nodes": solution.stats.leaves_visited,
+        "generated_random_depth": False,
+        "generated_depth": 4,
+        "generated_random_root": False,
+        "generated_is_maximizing": True,
+    }
+    # Arborii deterministi au valori întregi: o valoare aproximativă nu este acceptată
+    assert client.post("/api/evaluate/minmax", json=answer).json()["percentage"] == 50
+
+    answer["root_value"] = solution.root_value
+    assert client.post("/api/evaluate/minmax", json=answer).json()["percentage"] == 100
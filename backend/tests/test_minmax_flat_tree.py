@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from app.logic.common.seed import set_seed
+from app.logic.common.difficulty import MINMAX_L6_MIN_BREADTH, MINMAX_L6_MAX_BREADTH
+from app.logic.minmax.solver import (
+    AlphaBetaStats,
+    SolverNode,
+    _alpha_beta,
+    _convert_to_schema,
+    _generate_flat_tree,
+    generate_and_solve_minmax,
+)
+
+
+# --- Implementarea de referință (recursivă, pe obiecte) ---
+
+def _reference_tree(depth, max_depth, name_prefix, is_max):
+    current_type = "MAX" if is_max else "MIN"
+    if depth == max_depth:
+        return SolverNode(name=name_prefix, node_type=current_type, value=random.randint(1, 20))
+
+    breadth = random.randint(MINMAX_L6_MIN_BREADTH, MINMAX_L6_MAX_BREADTH)
+    children = [
+        _reference_tree(depth + 1, max_depth, f"{name_prefix}{i + 1}", not is_max)
+        for i in range(breadth)
+    ]
+    return SolverNode(name=name_prefix, node_type=current_type, children=children)
+
+
+def _reference_alpha_beta(node, alpha, beta, counter):
+    if not node.children:
+        counter[0] += 1
+        return node.value
+
+    if node.node_type == "MAX":
+        value = -float('inf')
+        for child in node.children:
+            value = max(value, _reference_alpha_beta(child, alpha, beta, counter))
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        return value
+
+    value = float('inf')
+    for child in node.children:
+        value = min(value, _reference_alpha_beta(child, alpha, beta, counter))
+        beta = min(beta, value)
+        if alpha >= beta:
+            break
+    return value
+
+
+@pytest.mark.parametrize("depth", [1, 2, 5, 8])
+@pytest.mark.parametrize("is_max", [True, False])
+def test_flat_alpha_beta_matches_recursive_reference(depth, is_max):
+    for seed in range(40):
+        set_seed(seed)
+        reference = _reference_tree(0, depth, "R", is_max)
+        counter = [0]
+        expected_value = _reference_alpha_beta(reference, -float('inf'), float('inf'), counter)
+
+        set_seed(seed)
+        flat = _generate_flat_tree(max_depth=depth, is_max=is_max)
+        stats = AlphaBetaStats()
+        value = _alpha_beta(flat, stats)
+
+        assert value == expected_value
+        assert stats.leaves_visited == counter[0]
+        # Vederea pe obiecte reconstruiește exact același arbore
+        assert _convert_to_schema(flat.to_solver_node()) == _convert_to_schema(reference)
+
+
+def test_flat_tree_levels_and_offsets():
+    set_seed(7)
+    flat = _generate_flat_tree(max_depth=4, is_max=True)
+
+    assert flat.depth == 4
+    assert flat.level_starts[0] == 0
+    # Copiii fiecărui nod sunt contigui și se află pe nivelul următor
+    for i, a in enumerate(flat.arity):
+        for k in range(a):
+            assert flat.types[flat.offsets[i] + k] == -flat.types[i]
+    assert flat.leaf_count == len(flat) - flat.level_starts[-1]
+
+
+def test_evaluation_mode_skips_tree_construction():
+    tree, value, visited, depth, _, _ = generate_and_solve_minmax(seed=42, build_tree=False)
+    full_tree, full_value, full_visited, full_depth, _, _ = generate_and_solve_minmax(seed=42)
+
+    assert tree is None
+    assert full_tree is not None
+    assert (value, visited, depth) == (full_value, full_visited, full_depth)
+
+
+def test_deep_tree_has_no_recursion_limit():
+    set_seed(3)
+    flat = _generate_flat_tree(max_depth=12, is_max=False)
+    stats = AlphaBetaStats()
+    value = _alpha_beta(flat, stats)
+
+    assert 1 <= value <= 20
+    assert 1 <= stats.leaves_visited <= flat.leaf_count
+    assert stats.max_depth_reached == 12
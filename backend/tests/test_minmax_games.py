@@ -0,0 +1,82 @@
+import random
+
+from app.logic.minmax.games import GAMES, GameSolver, build_game_view
+from app.logic.minmax.solver import _alpha_beta, build_compact_tree, fixed_tree_params, solve_minmax
+
+
+def _plain_negamax(game, state):
+    terminal = game.terminal_score(state)
+    if terminal is not None:
+        return terminal
+    h = game.hash(state)
+    return max(-_plain_negamax(game, game.play(state, h, move)[0]) for move in game.moves(state))
+
+
+def _random_positions(game, count):
+    rng = random.Random(7)
+    return [game.random_position(rng, maximizing=bool(i % 2)) for i in range(count)]
+
+
+def test_transposition_solver_matches_plain_minimax():
+    for game in GAMES.values():
+        solver = GameSolver(game)
+        for state in _random_positions(game, 15):
+            assert solver.solve(state) == _plain_negamax(game, state)
+
+
+def test_incremental_zobrist_hash_matches_full_hash():
+    for game in GAMES.values():
+        rng = random.Random(3)
+        for state in _random_positions(game, 10):
+            h = game.hash(state)
+            while game.terminal_score(state) is None:
+                state, h = game.play(state, h, rng.choice(game.moves(state)))
+                assert h == game.hash(state)
+
+
+def test_view_tree_value_is_exact_game_value():
+    for game in GAMES.values():
+        for state in _random_positions(game, 10):
+            tree = build_game_view(game, state, view_depth=2)
+            exact = GameSolver(game).solve(state)
+            assert _alpha_beta(tree) == (exact if state[1] == 1 else -exact)
+
+
+def test_game_problems_are_reproducible_from_seed():
+    for source in GAMES:
+        for seed in range(5):
+            first = solve_minmax(seed, fixed_tree_params(3, "MAX", source))
+            again = solve_minmax(seed, fixed_tree_params(first.depth, first.root_type, source))
+
+            assert first.source == source
+            assert first.position is not None
+            assert build_compact_tree(again.tree) == build_compact_tree(first.tree)
+            assert again.root_value == first.root_value
+
+
+def test_generate_and_evaluate_game_problem(client):
+    data = client.post(
+        "/api/generate/minmax",
+        json={"source": "nim", "random_depth": False, "depth": 2, "random_root": False, "is_maximizing_player": True},
+    ).json()
+    assert "source=nim" in data["tree_image_url"]
+    assert "Nim" in data["text"]["description"]
+
+    solution = solve_minmax(data["seed"], fixed_tree_params(2, "MAX", "nim"))
+    response = client.post("/api/evaluate/minmax", json={
+        "problem_seed": data["seed"],
+        "root_value": solution.root_value,
+        "visited_nodes": solution.stats.leaves_visited,
+        "generated_random_depth": False,
+        "generated_depth": 2,
+        "generated_random_root": False,
+        "generated_is_maximizing": True,
+        "generated_source": "nim",
+    })
+    assert response.json()["percentage"] == 100
+
+
+def test_unknown_source_is_rejected(client):
+    response = client.post("/api/generate/minmax", json={"source": "chess"})
+
+    assert response.status_code == 400
@@ -0,0 +1,76 @@
+import app.logic.minmax.image_cache as image_cache
+from app.logic.minmax.image_cache import CachedImage, ImageCache
+
+
+def test_cache_evicts_least_recently_used_by_size():
+    cache = ImageCache(max_bytes=10)
+    cache.put("a", CachedImage(b"aaaa", "image/svg+xml"))
+    cache.put("b", CachedImage(b"bbbb", "image/svg+xml"))
+    assert cache.get("a") is not None  # "a" devine cel mai recent folosit
+
+    cache.put("c", CachedImage(b"cccc", "image/svg+xml"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.total_bytes == 8
+
+    cache.put("huge", CachedImage(b"x" * 11, "image/svg+xml"))
+    assert cache.get("huge") is None
+
+
+def test_generate_returns_image_url_without_inline_payload(client):
+    response = client.post("/api/generate/minmax", json={})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["tree_image_base64"] is None
+    assert f"/api/image/minmax/{data['seed']}" in data["tree_image_url"]
+
+    image = client.get(data["tree_image_url"])
+    assert image.status_code == 200
+    assert image.headers["content-type"].startswith("image/svg+xml")
+    assert image.content.startswith(b"<svg")
+
+
+def test_image_endpoint_renders_once_and_supports_etag(monkeypatch, client):
+    calls = []
+    original = image_cache.render_minmax_image
+
+    def counting_render(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr("app.api.minmax.routes.render_minmax_image", counting_render)
+
+    url = "/api/image/minmax/987654?depth=3&root=MIN&image_format=svg"
+    first = client.get(url)
+    second = client.get(url)
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert len(calls) == 1
+    assert "immutable" in first.headers["cache-control"]
+
+    etag = first.headers["etag"]
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_image_endpoint_rejects_unknown_format(client):
+    response = client.get("/api/image/minmax/1?depth=3&root=MAX&image_format=gif")
+    assert response.status_code == 400
+
+
+def test_full_render_queue_answers_503(monkeypatch, client):
+    # O coadă de capacitate zero: nicio randare nouă nu mai este acceptată
+    monkeypatch.setattr(image_cache.minmax_render_pool, "max_pending", 0)
+
+    response = client.get("/api/image/minmax/424242?depth=3&root=MAX&image_format=svg")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == str(image_cache.MINMAX_RENDER_RETRY_AFTER)
+
+    # Pre-randarea opțională este doar omisă; imaginea inline are nevoie de o randare
+    assert client.post("/api/generate/minmax", json={}).status_code == 200
+    assert client.post("/api/generate/minmax", json={"inline_image": True}).status_code == 503
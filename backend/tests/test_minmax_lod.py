@@ -0,0 +1,108 @@
+import random
+import xml.etree.ElementTree as ET
+
+from app.logic.minmax.annotations import annotate_alpha_beta
+from app.logic.minmax.lod import build_lod_tree, build_plain_tree, resolve_expand_path
+from app.logic.minmax.solver import _generate_flat_tree, build_schema_tree, fixed_tree_params, solve_minmax
+from app.logic.minmax.visualizer import generate_tree_svg
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+def _walk(node):
+    yield node
+    for child in node["children"]:
+        yield from _walk(child)
+
+
+def _deep_tree(seed=3, depth=10):
+    return _generate_flat_tree(depth, True, random.Random(seed))
+
+
+def test_summary_accounts_for_every_leaf():
+    tree = _deep_tree()
+    annotations = annotate_alpha_beta(tree)
+    summary = build_lod_tree(tree, 3, annotations=annotations)
+    nodes = list(_walk(summary))
+
+    shown_leaves = sum(1 for node in nodes if not node["children"] and not node.get("aggregate"))
+    aggregated = sum(node["aggregate"]["leaves"] for node in nodes if node.get("aggregate"))
+    assert shown_leaves + aggregated == tree.leaf_count
+    assert len(nodes) < len(tree) // 10
+
+
+def test_aggregates_carry_alpha_beta_results():
+    tree = _deep_tree()
+    annotations = annotate_alpha_beta(tree)
+    names = {name: index for index, name in enumerate(tree.node_names())}
+    summary = build_lod_tree(tree, 5, annotations=annotations)
+
+    aggregates = [node for node in _walk(summary) if node.get("aggregate")]
+    assert any(node["aggregate"]["pruned"] for node in aggregates)
+    for node in aggregates:
+        index = names[node["name"]]
+        info = node["aggregate"]
+        assert info["pruned"] == bool(annotations.pruned[index])
+        if not info["pruned"]:
+            assert info["value"] == annotations.values[index]
+            assert info["min"] <= info["value"] <= info["max"]
+
+
+def test_expand_shows_the_path_and_the_chosen_subtree():
+    tree = _deep_tree()
+    annotations = annotate_alpha_beta(tree)
+    target = next(name for name in tree.node_names() if len(name) == 7)
+    summary = build_lod_tree(tree, 2, expand=target, annotations=annotations)
+    by_name = {node["name"]: node for node in _walk(summary)}
+
+    for length in range(1, len(target) + 1):
+        assert not by_name[target[:length]].get("aggregate")
+    expanded = by_name[target]
+    assert len(expanded["children"]) > 0
+    assert all(not child.get("aggregate") or child["aggregate"]["pruned"] or child["children"] == []
+               for child in expanded["children"])
+
+
+def test_expand_path_validation():
+    tree = _deep_tree()
+    assert resolve_expand_path(tree, "R") == [0]
+    for name in ("X1", "R0", "R9"):
+        try:
+            resolve_expand_path(tree, name)
+        except ValueError:
+            continue
+        raise AssertionError(name)
+
+
+def test_svg_draws_aggregates_as_expandable_boxes():
+    tree = _deep_tree()
+    svg = ET.fromstring(generate_tree_svg(build_lod_tree(tree, 5, annotations=annotate_alpha_beta(tree))))
+    rects = svg.findall(f".//{SVG_NS}rect")
+
+    assert rects
+    assert any(rect.get("stroke-dasharray") for rect in rects)
+
+
+def test_image_endpoint_summarizes_deep_trees(client):
+    seed = 5
+    solution = solve_minmax(seed, fixed_tree_params(10, "MAX"))
+    url = f"/api/image/minmax/{seed}?depth=10&root=MAX&image_format=svg"
+
+    svg = ET.fromstring(client.get(url).content)
+    shown = len(svg.findall(f".//{SVG_NS}ellipse")) + len(svg.findall(f".//{SVG_NS}rect"))
+    assert shown < len(solution.tree) // 10
+
+    target = solution.tree.node_names()[solution.tree.level_starts[5]]
+    expanded = client.get(f"{url}&expand={target}&lod_depth=2")
+    assert expanded.status_code == 200
+    assert expanded.content != client.get(url).content
+
+    assert client.get(f"{url}&expand=R9").status_code == 400
+    assert client.get(f"{url}&expand=Rx").status_code == 400
+
+
+def test_plain_tree_matches_schema_tree():
+    # Randarea completă nu mai trece prin modelele Pydantic, dar produce același dicționar
+    for seed in range(10):
+        tree = solve_minmax(seed, fixed_tree_params(4, "MIN", chance_nodes=seed % 2 == 1)).tree
+        assert build_plain_tree(tree) == build_schema_tree(tree).model_dump()
@@ -0,0 +1,63 @@
+import random
+
+from app.logic.minmax.mcts import mcts_search
+from app.logic.minmax.solver import _alpha_beta, fixed_tree_params, solve_minmax
+from app.logic.minmax.tree import NODE_MAX
+
+
+def _exact_child_values(tree):
+    first = tree.offsets[0]
+    return [_alpha_beta(tree.subtree(child)) for child in range(first, first + tree.arity[0])]
+
+
+def test_visit_counts_add_up_to_budget():
+    tree = solve_minmax(3, fixed_tree_params(6, "MAX")).tree
+    result = mcts_search(tree, playouts=500, rng=random.Random(1))
+
+    assert result.playouts == 500
+    assert sum(child.visits for child in result.children) == 500
+    assert len(result.children) == tree.arity[0]
+    assert 0 < result.leaves_evaluated <= tree.leaf_count
+
+
+def test_search_is_deterministic_for_a_given_rng():
+    tree = solve_minmax(11, fixed_tree_params(7, "MIN")).tree
+    first = mcts_search(tree, 300, random.Random(5))
+    again = mcts_search(tree, 300, random.Random(5))
+
+    assert [(c.visits, c.value_estimate) for c in first.children] == \
+           [(c.visits, c.value_estimate) for c in again.children]
+
+
+def test_large_budget_converges_to_exact_best_child():
+    for seed in range(10):
+        tree = solve_minmax(seed, fixed_tree_params(4, "MAX" if seed % 2 else "MIN")).tree
+        exact = _exact_child_values(tree)
+        result = mcts_search(tree, playouts=20 * tree.leaf_count + 2000, rng=random.Random(seed))
+
+        pick = max if tree.types[0] == NODE_MAX else min
+        chosen = [c.name for c in result.children].index(result.best_child)
+        assert exact[chosen] == pick(exact)
+
+
+def test_single_leaf_tree():
+    tree = solve_minmax(0, {"random_depth": False, "depth": 1, "random_root": False,
+                            "is_maximizing_player": True}).tree
+    result = mcts_search(tree.subtree(tree.offsets[0]), playouts=10)
+
+    assert result.children == []
+    assert result.best_child is None
+    assert result.leaves_evaluated == 1
+
+
+def test_analyze_endpoint_reports_exact_and_approximate(client):
+    response = client.get("/api/analyze/minmax/42", params={"depth": 5, "root": "MAX", "playouts": 400})
+    data = response.json()
+
+    solution = solve_minmax(42, fixed_tree_params(5, "MAX"))
+    assert response.status_code == 200
+    assert data["exact_value"] == solution.root_value
+    assert data["alpha_beta_leaves_visited"] == solution.stats.leaves_visited
+    assert data["playouts"] == 400
+    assert sum(child["visits"] for child in data["children"]) == 400
+    assert [child["exact_value"] for child in data["children"]] == _exact_child_values(solution.tree)
@@ -0,0 +1,69 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from app.logic.common.seed import get_rng
+from app.logic.minmax.parallel import _forest, _forest_levels, parallel_alpha_beta
+from app.logic.minmax.solver import AlphaBetaStats, _alpha_beta, _generate_flat_tree, solve_minmax
+from app.logic.minmax.tree import FlatTree
+
+# Trimite executorului orice grup de frați, indiferent de costul estimat
+DISPATCH_ALL = {"min_task_leaves": 0, "max_nodes_per_leaf": float("inf")}
+
+
+def _sequential(tree):
+    stats = AlphaBetaStats()
+    value = _alpha_beta(tree, stats)
+    return value, stats
+
+
+@pytest.mark.parametrize("depth", [2, 3, 6, 9])
+@pytest.mark.parametrize("split_depth", [None, 1, 2])
+def test_parallel_reports_sequential_counters(depth, split_depth):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for seed in range(15):
+            tree = _generate_flat_tree(depth, seed % 2 == 0, get_rng(seed), 1, 4)
+            value, stats = _sequential(tree)
+
+            result = parallel_alpha_beta(tree, executor, split_depth=split_depth, **DISPATCH_ALL)
+
+            assert result.root_value == value
+            assert result.leaves_visited == stats.leaves_visited
+            assert result.stats.cutoffs_per_depth == stats.cutoffs_per_depth
+            assert result.stats.max_depth_reached == stats.max_depth_reached
+
+
+def test_parallel_over_process_pool_matches_solve_minmax():
+    params = {"random_depth": False, "depth": 10}
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for seed in range(3):
+            sequential = solve_minmax(seed, params)
+            parallel = solve_minmax(seed, params, executor=executor)
+
+            assert parallel.root_value == sequential.root_value
+            assert parallel.stats.leaves_visited == sequential.stats.leaves_visited
+
+
+def test_forest_keeps_the_sibling_subtrees():
+    tree = _generate_flat_tree(6, True, get_rng(3), 1, 4)
+    first = tree.offsets[0]
+    last = first + tree.arity[0] - 1
+    forest = _forest(tree, _forest_levels(tree, first, last))
+    assert forest.offsets.tolist() == FlatTree(forest.arity, forest.values, forest.types).offsets.tolist()
+    for k, node in enumerate(range(first, last + 1), start=1):
+        for alpha, beta in [(-float('inf'), float('inf')), (10, 60)]:
+            expected, got = AlphaBetaStats(), AlphaBetaStats()
+            assert _alpha_beta(forest, got, alpha, beta, root=k) == _alpha_beta(tree, expected, alpha, beta, root=node)
+            assert got.leaves_visited == expected.leaves_visited
+
+
+def test_parallel_work_stays_close_to_sequential():
+    # Frații speculativi și recăutările nu trebuie să multiplice munca secvențială
+    searched = sequential = 0
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for seed in range(5):
+            tree = _generate_flat_tree(9, True, get_rng(seed), 2, 4)
+            result = parallel_alpha_beta(tree, executor, **DISPATCH_ALL)
+            searched += result.leaves_searched
+            sequential += result.leaves_visited
+    assert searched < 2 * sequential
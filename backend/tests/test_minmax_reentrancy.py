@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.logic.minmax.solver import generate_and_solve_minmax, solve_minmax
+
+PARAMS = {"random_depth": False, "depth": 8, "random_root": True}
+
+
+def _solve_summary(seed):
+    solution = solve_minmax(seed, PARAMS)
+    return (
+        solution.root_value,
+        solution.stats.leaves_visited,
+        tuple(solution.stats.cutoffs_per_depth),
+        solution.stats.max_depth_reached,
+    )
+
+
+def test_parallel_threads_match_sequential():
+    seeds = list(range(100, 160))
+    sequential = [_solve_summary(seed) for seed in seeds]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        parallel = list(pool.map(_solve_summary, seeds))
+
+    assert parallel == sequential
+
+
+def test_parallel_processes_match_sequential():
+    seeds = list(range(10))
+    sequential = [_solve_summary(seed) for seed in seeds]
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = list(pool.map(_solve_summary, seeds))
+
+    assert parallel == sequential
+
+
+def test_solution_counters_are_consistent():
+    solution = solve_minmax(42, PARAMS)
+    _, value, visited, depth, _, root_type = generate_and_solve_minmax(42, PARAMS, build_tree=False)
+
+    assert (value, visited, depth, root_type) == (
+        solution.root_value, solution.stats.leaves_visited, solution.depth, solution.root_type
+    )
+    assert solution.stats.max_depth_reached == 8
+    # Fără tăieri, toate frunzele ar fi vizitate
+    if solution.stats.total_cutoffs == 0:
+        assert visited == solution.tree.leaf_count
+    else:
+        assert visited < solution.tree.leaf_count
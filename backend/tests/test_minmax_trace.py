@@ -0,0 +1,63 @@
+import json
+
+from app.logic.minmax.solver import (
+    AlphaBetaStats,
+    _alpha_beta,
+    fixed_tree_params,
+    iter_alpha_beta_trace,
+    solve_minmax,
+)
+
+
+def test_trace_matches_solver_result():
+    for seed in range(30):
+        tree = solve_minmax(seed, fixed_tree_params(6, "MAX")).tree
+        stats = AlphaBetaStats()
+        value = _alpha_beta(tree, stats)
+
+        events = list(iter_alpha_beta_trace(tree))
+        leaves = [e for e in events if e["t"] == "leaf"]
+        cuts = [e for e in events if e["t"] == "cut"]
+
+        assert events[-1] == {"t": "done", "v": value, "leaves": stats.leaves_visited}
+        assert len(leaves) == stats.leaves_visited
+        assert len(cuts) == stats.total_cutoffs
+        # Fiecare nod intern vizitat are exact un enter și un exit
+        enters = [e["n"] for e in events if e["t"] == "enter"]
+        exits = [e["n"] for e in events if e["t"] == "exit"]
+        assert sorted(enters) == sorted(exits)
+
+
+def test_trace_endpoint_streams_ndjson(client):
+    response = client.get("/api/trace/minmax/42?depth=4&root=MIN")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[0] == {"t": "enter", "n": "R", "k": "MIN", "a": None, "b": None}
+    assert events[-1]["t"] == "done"
+
+
+def test_trace_is_lazy():
+    tree = solve_minmax(5, fixed_tree_params(12, "MAX")).tree
+    trace = iter_alpha_beta_trace(tree)
+
+    # Primele evenimente sunt disponibile fără a parcurge tot arborele
+    first = [next(trace) for _ in range(3)]
+    assert first[0]["n"] == "R"
+    assert first[1]["t"] == "enter"
+
+
+def test_trace_endpoint_uses_reconstruction_params(client):
+    # Cu o țintă de tăiere, trace-ul descrie arborele construit (același ca imaginea), nu pe cel aleator
+    params = fixed_tree_params(5, "MAX", target_visited=20)
+    tree = solve_minmax(9, params).tree
+    expected = list(iter_alpha_beta_trace(tree))
+
+    response = client.get("/api/trace/minmax/9?depth=5&root=MAX&target_visited=20")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events == expected
+
+    response = client.get("/api/trace/minmax/9?depth=5&root=MAX&chance_nodes=true")
+    assert response.status_code == 400
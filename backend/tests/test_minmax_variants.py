@@ -0,0 +1,75 @@
+from array import array
+
+from app.logic.minmax.solver import AlphaBetaStats, _alpha_beta, fixed_tree_params, solve_minmax
+from app.logic.minmax.tree import FlatTree, NODE_MAX
+from app.logic.minmax.variants import SEARCH_VARIANTS, SearchStats, mtdf, principal_variation_search
+
+
+def test_variants_match_alpha_beta_value(random_trees):
+    for tree in random_trees(300, min_breadth=1, max_breadth=4):
+        expected = _alpha_beta(tree)
+        for search in SEARCH_VARIANTS.values():
+            assert search(tree) == expected
+
+
+def test_variants_on_game_trees_with_negative_values():
+    for seed in range(20):
+        solution = solve_minmax(seed, fixed_tree_params(3, "MAX", "tictactoe"))
+        assert principal_variation_search(solution.tree) == solution.root_value
+        assert mtdf(solution.tree) == solution.root_value
+
+
+def test_leaf_counters_are_consistent(random_trees):
+    for tree in random_trees(200, min_breadth=1, max_breadth=4):
+        for search in SEARCH_VARIANTS.values():
+            stats = SearchStats()
+            search(tree, stats)
+            assert 0 < stats.leaves_visited <= tree.leaf_count
+            assert stats.leaf_evaluations >= stats.leaves_visited
+
+
+def test_null_window_searches_prune_more_than_alpha_beta_on_average(random_trees):
+    totals = {name: 0 for name in SEARCH_VARIANTS}
+    alpha_beta = 0
+    for tree in random_trees(300, min_breadth=1, max_breadth=4):
+        stats = AlphaBetaStats()
+        _alpha_beta(tree, stats)
+        alpha_beta += stats.leaves_visited
+        for name, search in SEARCH_VARIANTS.items():
+            stats = SearchStats()
+            search(tree, stats)
+            totals[name] += stats.leaves_visited
+
+    assert all(total < alpha_beta for total in totals.values())
+
+
+def test_mtdf_on_single_leaf():
+    leaf = FlatTree(array("i", [0]), array("i", [5]), array("b", [NODE_MAX]))
+    stats = SearchStats()
+
+    assert mtdf(leaf, stats) == 5
+    assert stats.leaves_visited == 1
+
+
+def test_generate_and_evaluate_with_algorithm(client):
+    config = {"random_depth": False, "depth": 6, "random_root": False, "is_maximizing_player": True}
+    data = client.post("/api/generate/minmax", json={**config, "algorithm": "pvs"}).json()
+    assert "NegaScout" in data["text"]["requirement"]
+
+    solution = solve_minmax(data["seed"], fixed_tree_params(6, "MAX", algorithm="pvs"))
+    answer = {
+        "problem_seed": data["seed"],
+        "root_value": solution.root_value,
+        "visited_nodes": solution.stats.leaves_visited,
+        "generated_random_depth": False,
+        "generated_depth": 6,
+        "generated_random_root": False,
+        "generated_is_maximizing": True,
+        "generated_algorithm": "pvs",
+    }
+    assert client.post("/api/evaluate/minmax", json=answer).json()["percentage"] == 100
+
+
+def test_unknown_algorithm_is_rejected(client):
+    assert client.post("/api/generate/minmax", json={"algorithm": "sss*"}).status_code == 400
+    assert client.post("/api/generate/minmax", json={"algorithm": "pvs", "chance_nodes": True}).status_code == 400
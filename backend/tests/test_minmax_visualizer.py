@@ -0,0 +1,61 @@
+import base64
+import subprocess
+import xml.etree.ElementTree as ET
+
+from app.logic.minmax.solver import generate_and_solve_minmax
+from app.logic.minmax.visualizer import generate_tree_svg, render_tree_image
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+def _count_nodes(node):
+    return 1 + sum(_count_nodes(child) for child in node["children"])
+
+
+def test_svg_contains_every_node_with_minmax_colours(monkeypatch):
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("Randarea SVG nu trebuie să pornească procese externe")
+
+    monkeypatch.setattr(subprocess, "Popen", no_subprocess)
+
+    tree, *_ = generate_and_solve_minmax(42, {"random_depth": False, "depth": 5})
+    tree_dict = tree.model_dump()
+    root = ET.fromstring(generate_tree_svg(tree_dict))
+
+    ellipses = root.findall(f".//{SVG_NS}ellipse")
+    lines = root.findall(f".//{SVG_NS}line")
+    assert len(ellipses) == _count_nodes(tree_dict)
+    assert len(lines) == len(ellipses) - 1
+
+    fills = {e.get("fill") for e in ellipses}
+    assert "#ffffff" in fills
+    assert fills <= {"#ffffff", "#A0D8F1", "#FFD6A5"}
+
+
+def test_layout_keeps_siblings_apart():
+    tree, *_ = generate_and_solve_minmax(7, {"random_depth": False, "depth": 4})
+    root = ET.fromstring(generate_tree_svg(tree.model_dump()))
+
+    # Pe fiecare nivel, centrele nodurilor sunt distincte
+    rows = {}
+    for e in root.findall(f".//{SVG_NS}ellipse"):
+        rows.setdefault(e.get("cy"), []).append(float(e.get("cx")))
+    for xs in rows.values():
+        assert len(xs) == len(set(xs))
+
+
+def test_render_tree_image_defaults_to_svg():
+    tree, *_ = generate_and_solve_minmax(1)
+    img_bytes, mime = render_tree_image(tree.model_dump())
+
+    assert mime == "image/svg+xml"
+    assert img_bytes.startswith(b"<svg")
+
+
+def test_generate_endpoint_returns_svg_image(client):
+    response = client.post("/api/generate/minmax", json={"image_format": "svg", "inline_image": True})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["tree_image_mime"] == "image/svg+xml"
+    assert base64.b64decode(data["tree_image_base64"]).startswith(b"<svg")
@@ -0,0 +1,37 @@
+import numpy as np
+
+from app.logic.nash.solver import count_pure_equilibria, generate_and_solve_nash, solve_pure_nash_arrays
+
+
+def test_batch_count_matches_the_single_game_solver():
+    rng = np.random.default_rng(0)
+    p1, p2 = rng.integers(0, 3, size=(2, 500, 3, 4))
+    counts = count_pure_equilibria(p1, p2)
+    assert counts.tolist() == [len(solve_pure_nash_arrays(a, b)) for a, b in zip(p1, p2)]
+
+
+def test_exact_equilibrium_targets_are_deterministic():
+    for target in range(4):
+        for seed in range(20):
+            params = {"rows": 3, "cols": 4, "random_size": False, "target_equilibria": target}
+            matrix, equilibria, _ = generate_and_solve_nash(seed, params)
+            again, _, _ = generate_and_solve_nash(seed, params)
+            assert len(equilibria) == target
+            assert matrix.grid == again.grid
+
+    params = {"rows": 3, "cols": 3, "random_size": False, "target_equilibria": 1, "problem_type": "zero_sum"}
+    matrix, equilibria, _ = generate_and_solve_nash(5, params)
+    assert len(equilibria) == 1 and (matrix.p2 == -matrix.p1).all()
+
+
+def test_target_through_the_api(client):
+    params = {"rows": 4, "cols": 4, "random_size": False, "target_equilibria": 0}
+    data = client.post("/api/generate/nash", json=params).json()
+    answer = {"problem_seed": data["seed"], "has_equilibrium": False, **params}
+    assert client.post("/api/evaluate/nash", json=answer).json()["percentage"] == 100
+
+    # 2x2 are cel mult 4 echilibre
+    response = client.post("/api/generate/nash", json={**params, "rows": 2, "cols": 2, "target_equilibria": 5})
+    assert response.status_code == 400
+    response = client.post("/api/generate/nash", json={**params, "target_equilibria": -1})
+    assert response.status_code == 400
@@ -0,0 +1,84 @@
+import numpy as np
+
+from app.logic.nash.dominance import NASH_PLAYER_COLS, NASH_PLAYER_ROWS, iterated_elimination
+from app.logic.nash.mixed import is_mixed_equilibrium, lemke_howson
+from app.logic.nash.solver import generate_and_solve_nash, payoff_arrays, solve_pure_nash_arrays
+
+
+def _reference(p1, p2, weak):
+    """Eliminarea iterată prin comparații directe, toate perechile la fiecare rundă."""
+    rows, cols = list(range(p1.shape[0])), list(range(p1.shape[1]))
+    changed = True
+    while changed:
+        changed = False
+        for own, opponents, payoffs in ((rows, cols, p1), (cols, rows, p2.T)):
+            if len(own) <= 1:
+                continue
+            dominated = []
+            for k in own:
+                for i in own:
+                    difference = payoffs[i, opponents] - payoffs[k, opponents]
+                    if i != k and ((difference > 0).all() or
+                                   (weak and (difference >= 0).all() and (difference > 0).any())):
+                        dominated.append(k)
+                        break
+            for k in dominated:
+                own.remove(k)
+            changed = changed or bool(dominated)
+    return rows, cols
+
+
+def test_incremental_index_matches_full_recomputation():
+    rng = np.random.default_rng(2)
+    for trial in range(1500):
+        m, n = rng.integers(1, 8, size=2)
+        p1 = rng.integers(0, rng.integers(1, 6), size=(m, n))
+        p2 = rng.integers(0, rng.integers(1, 6), size=(m, n))
+        if trial % 3 == 0:
+            # Coloane cu ponderi mari: perechile revin în index după eliminarea unei coloane
+            p1 = p1 * rng.integers(1, 30, size=(1, n))
+        for weak in (False, True):
+            result = iterated_elimination(p1, p2, weak)
+            assert (result.rows, result.cols) == _reference(p1, p2, weak)
+
+
+def test_prisoners_dilemma_and_elimination_order():
+    p1 = np.array([[-1, -3], [0, -2]])
+    result = iterated_elimination(p1, p1.T)
+    assert (result.rows, result.cols) == ([1], [1])
+    assert [(e.player, e.index, e.dominated_by, e.strict) for e in result.eliminations] == [
+        (NASH_PLAYER_ROWS, 0, 1, True), (NASH_PLAYER_COLS, 0, 1, True)]
+
+
+def test_strict_elimination_keeps_every_equilibrium():
+    rng = np.random.default_rng(8)
+    for _ in range(200):
+        m, n = rng.integers(2, 7, size=2)
+        p1 = rng.integers(-5, 11, size=(m, n)) + rng.integers(0, 4) * np.arange(m)[:, None]
+        p2 = rng.integers(-5, 11, size=(m, n))
+        result = iterated_elimination(p1, p2)
+        reduced = solve_pure_nash_arrays(*result.reduce(p1, p2))
+        assert [(result.rows[r], result.cols[c]) for r, c in reduced] == solve_pure_nash_arrays(p1, p2)
+        equilibrium = lemke_howson(p1, p2, reduce=True)
+        assert is_mixed_equilibrium(p1, p2, equilibrium.row_strategy, equilibrium.col_strategy, 1e-7)
+
+
+def test_iesds_problem_grading(client):
+    response = client.post("/api/generate/nash", json={"problem_type": "iesds", "random_size": False,
+                                                       "rows": 4, "cols": 4})
+    problem = response.json()
+    assert problem["problem_type"] == "iesds"
+
+    params = {"rows": 4, "cols": 4, "random_size": False}
+    matrix, _, _ = generate_and_solve_nash(problem["seed"], params)
+    result = iterated_elimination(*payoff_arrays(matrix))
+    answer = {"problem_seed": problem["seed"], **params}
+
+    graded = client.post("/api/evaluate/nash/iesds", json={**answer, "rows_remaining": result.rows[::-1],
+                                                           "cols_remaining": result.cols}).json()
+    assert graded["percentage"] == 100
+    assert graded["correct_answer"]["rows"] == result.rows
+
+    graded = client.post("/api/evaluate/nash/iesds", json={**answer, "rows_remaining": result.rows,
+                                                           "cols_remaining": [5]}).json()
+    assert graded["percentage"] == 50
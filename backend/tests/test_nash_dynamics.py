@@ -0,0 +1,52 @@
+import json
+
+import numpy as np
+
+from app.logic.nash.dynamics import iter_dynamics, run_dynamics
+from app.logic.nash.solver import generate_and_solve_nash
+
+
+def test_trajectories_converge_to_the_equilibria():
+    # Joc de coordonare: două echilibre pure, fiecare cu bazinul său de atracție
+    A = np.array([[2, 0], [0, 1]])
+    summary = run_dynamics(A, A, populations=200, steps=5000)
+    assert {tuple(e["profile"]) for e in summary["pure"]} == {(0, 0), (1, 1)}
+    assert sum(e["count"] for e in summary["pure"]) == 200
+
+    # Dilema prizonierului: toate populațiile ajung la (1, 1), cu ambele dinamici
+    A = np.array([[3, 0], [5, 1]])
+    for rule in ("replicator", "best_response"):
+        summary = run_dynamics(A, A.T, rule=rule, populations=50, steps=5000)
+        assert summary["pure"] == [{"profile": [1, 1], "count": 50}]
+
+
+def test_converged_pure_profiles_are_pure_equilibria():
+    params = {"rows": 4, "cols": 4, "random_size": False}
+    for seed in range(10):
+        matrix, equilibria, _ = generate_and_solve_nash(seed, params)
+        summary = run_dynamics(matrix.p1, matrix.p2, populations=64, steps=3000, seed=seed)
+        for entry in summary["pure"]:
+            assert tuple(entry["profile"]) in equilibria
+
+
+def test_samples_are_streamed_at_the_stride():
+    A = np.array([[1, -1], [-1, 1]])
+    events = iter_dynamics(A, -A, populations=16, steps=100, stride=25, sampled=2)
+    first = next(events)
+    assert first["t"] == "sample" and first["step"] == 25 and len(first["x"]) == 2
+    rest = list(events)
+    assert [e["step"] for e in rest[:-1]] == [50, 75, 100]
+    assert rest[-1]["t"] == "done" and rest[-1]["steps"] == 100
+
+
+def test_dynamics_endpoint_streams_ndjson(client):
+    params = {"rows": 3, "cols": 3, "random_size": False, "problem_seed": 11,
+              "steps": 40, "stride": 10, "populations": 8}
+    response = client.post("/api/dynamics/nash", json=params)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1]["t"] == "done"
+    assert all(e["t"] == "sample" for e in events[:-1])
+
+    response = client.post("/api/dynamics/nash", json={**params, "rule": "fictitious"})
+    assert response.status_code == 400
@@ -0,0 +1,79 @@
+import numpy as np
+
+from app.logic.nash.editor import BestResponseIndex, EditorSessionStore
+from app.logic.nash.packed import PackedNashMatrix
+from app.logic.nash.solver import solve_pure_nash_arrays
+
+
+def test_incremental_updates_match_the_full_solver():
+    rng = np.random.default_rng(6)
+    for _ in range(40):
+        rows, cols = rng.integers(1, 8, size=2)
+        p1, p2 = rng.integers(0, 4, size=(2, rows, cols))
+        index = BestResponseIndex(PackedNashMatrix.from_arrays(p1, p2))
+        for _ in range(30):
+            r, c = int(rng.integers(rows)), int(rng.integers(cols))
+            before = set(index.equilibria())
+            a, b = (int(v) for v in rng.integers(0, 4, size=2))
+            change = index.update(r, c, a, b)
+            p1[r, c], p2[r, c] = a, b
+            expected = solve_pure_nash_arrays(p1, p2)
+            assert index.equilibria() == expected
+            assert set(change.added) == set(expected) - before
+            assert set(change.removed) == before - set(expected)
+
+
+def test_updates_on_a_large_matrix():
+    # Timpii (actualizare vs. rezolvare completă) sunt în benchmarks/nash_large.py
+    rng = np.random.default_rng(1)
+    p1, p2 = rng.integers(-5, 11, size=(2, 2000, 2000))
+    index = BestResponseIndex(PackedNashMatrix.from_arrays(p1, p2))
+    for k in range(200):
+        index.update(k, 2 * k, 10, 10)
+        p1[k, 2 * k] = p2[k, 2 * k] = 10
+    assert all((k, 2 * k) in index.equilibria() for k in range(200))
+    assert index.equilibria() == solve_pure_nash_arrays(p1, p2)
+
+
+def test_session_store_evicts_least_recently_used():
+    matrix = PackedNashMatrix(np.zeros((10, 10, 2)))
+    store = EditorSessionStore(max_bytes=2 * BestResponseIndex(matrix).nbytes)
+    first, _ = store.create(matrix)
+    second, _ = store.create(matrix)
+    assert store.get(first) is not None
+    store.create(matrix)
+    assert store.get(second) is None and store.get(first) is not None
+
+
+def test_cell_update_endpoint(client):
+    data = client.post("/api/generate/nash", json={"rows": 3, "cols": 3, "random_size": False,
+                                                   "editable": True}).json()
+    session = data["editor_session"]
+    grid = data["matrix"]["grid"]
+    assert data["editor_equilibria"] == [list(cell) for cell in
+                                         solve_pure_nash_arrays(*np.moveaxis(np.array(grid), -1, 0))]
+
+    response = client.post(f"/api/edit/nash/{session}", json={"row": 1, "col": 2, "p1": 100, "p2": 100})
+    assert response.status_code == 200
+    assert [1, 2] in response.json()["equilibria"]
+
+    assert client.post(f"/api/edit/nash/{session}", json={"row": 3, "col": 0, "p1": 0, "p2": 0}).status_code == 400
+    assert client.post(f"/api/edit/nash/{session}", json={"row": 0, "col": 0, "p1": 10 ** 6, "p2": 0}).status_code == 400
+    assert client.post("/api/edit/nash/missing", json={"row": 0, "col": 0, "p1": 0, "p2": 0}).status_code == 404
+
+
+def test_answers_in_editor_mode_are_graded_on_the_edited_matrix(client):
+    params = {"rows": 3, "cols": 3, "random_size": False}
+    data = client.post("/api/generate/nash", json={**params, "editable": True}).json()
+    session = data["editor_session"]
+    # O celulă care devine echilibru doar în matricea editată
+    row, col = next([r, c] for r in range(3) for c in range(3) if [r, c] not in data["editor_equilibria"])
+    client.post(f"/api/edit/nash/{session}", json={"row": row, "col": col, "p1": 100, "p2": 100})
+
+    answer = {**params, "problem_seed": data["seed"], "has_equilibrium": True, "equilibrium_point": [row, col]}
+    assert client.post("/api/evaluate/nash", json=answer).json()["percentage"] != 100
+    graded = client.post("/api/evaluate/nash", json={**answer, "editor_session": session}).json()
+    assert graded["percentage"] == 100
+
+    response = client.post("/api/evaluate/nash", json={**answer, "editor_session": "missing"})
+    assert response.status_code == 404
@@ -0,0 +1,80 @@
+import numpy as np
+
+from app.logic.nash.extensive import ExtensiveGame, backward_induction, generate_and_solve_extensive
+from app.logic.nash.tensor import solve_pure_nash_tensor
+
+
+def _reference(game: ExtensiveGame, node: int = 0):
+    """Inducția inversă recursivă (doar pentru arbori mici): (plăți, drum)."""
+    if game.arity[node] == 0:
+        return game.leaf_payoffs[game.leaf_indices()[node]].tolist(), []
+    mover = int(game.movers[node])
+    best = None
+    for action in range(game.arity[node]):
+        payoffs, path = _reference(game, int(game.offsets[node]) + action)
+        if best is None or payoffs[mover] > best[0][mover]:
+            best = (payoffs, [action] + path)
+    return best
+
+
+def test_matches_recursive_reference():
+    for seed in range(40):
+        players = 2 + seed % 3
+        game, equilibrium, _ = generate_and_solve_extensive(seed, {"players": players, "depth": 4, "max_breadth": 3})
+        payoffs, path = _reference(game)
+        assert equilibrium.payoffs == payoffs
+        assert equilibrium.path() == path
+
+
+def test_irregular_tree_with_early_leaves():
+    # Rădăcina (P0) are o frunză și un nod al lui P1; P1 alege între două frunze
+    game = ExtensiveGame(arity=[2, 0, 2, 0, 0], movers=[0, -1, 1, -1, -1],
+                         leaf_payoffs=[[2, 2], [3, 0], [0, 1]])
+    equilibrium = backward_induction(game)
+    assert equilibrium.path() == [0]
+    assert equilibrium.payoffs == [2, 2]
+    assert equilibrium.strategy(1).tolist() == [1]
+
+
+def test_normal_form_view_contains_the_subgame_perfect_profile():
+    game, equilibrium, _ = generate_and_solve_extensive(3, {"players": 2, "depth": 3, "max_breadth": 2})
+    view = game.normal_form
+    tensor = view.to_tensor()
+    assert tensor.strategies == tuple(view.strategy_counts())
+
+    # Indexul strategiei în bază mixtă (ultimul nod variază cel mai repede)
+    profile = []
+    for player, nodes in enumerate(view.decision_nodes):
+        index = 0
+        for arity, action in zip(game.arity[nodes], equilibrium.strategy(player)):
+            index = index * int(arity) + int(action)
+        profile.append(index)
+    assert tensor.payoffs[tuple(profile)].tolist() == equilibrium.payoffs
+    assert view.outcome([equilibrium.strategy(p) for p in range(2)]) == equilibrium.payoffs
+    assert tuple(profile) in solve_pure_nash_tensor(tensor.player_payoffs())
+
+
+def test_million_node_tree_is_solved_level_by_level():
+    game, equilibrium, _ = generate_and_solve_extensive(1, {"players": 3, "depth": 12, "max_breadth": 4})
+    assert len(game) > 9 * 10 ** 5
+    again = backward_induction(game)
+    assert again.path() == equilibrium.path() and len(again.path()) == 12
+    # Forma normală nu se enumeră pentru un asemenea arbore
+    assert sum(game.normal_form.log10_strategy_counts()) > 1000
+
+
+def test_extensive_api_round_trip(client):
+    params = {"players": 2, "depth": 3, "max_breadth": 2}
+    data = client.post("/api/generate/nash/extensive", json=params).json()
+    game = ExtensiveGame(np.array(data["tree"]["arity"]), np.array(data["tree"]["movers"]),
+                         np.array(data["tree"]["payoffs"]).reshape(-1, 2))
+    _, path = _reference(game)
+
+    result = client.post("/api/evaluate/nash/extensive",
+                         json={**params, "problem_seed": data["seed"], "path": path}).json()
+    assert result["percentage"] == 100
+    assert result["correct_answer"]["path"] == path
+    assert "Forma normală" in result["explanation"]
+
+    response = client.post("/api/generate/nash/extensive", json={"depth": 40, "max_breadth": 10})
+    assert response.status_code == 400
@@ -0,0 +1,66 @@
+from fractions import Fraction
+
+import numpy as np
+
+from app.logic.nash.mixed import _run, is_mixed_equilibrium, lemke_howson
+from app.logic.nash.solver import generate_and_solve_nash, payoff_arrays
+
+
+def test_random_games_for_every_initial_label():
+    rng = np.random.default_rng(7)
+    for _ in range(100):
+        m, n = rng.integers(2, 7, size=2)
+        A = rng.integers(-5, 6, size=(m, n))
+        B = rng.integers(-5, 6, size=(m, n))
+        for label in range(m + n):
+            eq = lemke_howson(A, B, initial_label=label)
+            assert is_mixed_equilibrium(A, B, eq.row_strategy, eq.col_strategy, 1e-7)
+
+
+def test_matching_pennies_and_the_exact_path():
+    A = np.array([[1, -1], [-1, 1]])
+    eq = lemke_howson(A, -A)
+    assert np.allclose(eq.row_strategy, [0.5, 0.5]) and np.allclose(eq.col_strategy, [0.5, 0.5])
+    assert abs(eq.row_value) < 1e-12
+
+    # Joc degenerat rezolvat direct cu fracții
+    A = np.array([[3, 3], [2, 5], [0, 6]]) + 1
+    B = np.array([[3, 2], [2, 6], [3, 1]]) + 1
+    x, y = _run(A, B, 0, exact=True, max_pivots=None)
+    assert all(isinstance(p, Fraction) for p in x + y)
+    assert sum(x) == 1 and sum(y) == 1
+    assert is_mixed_equilibrium(A, B, [float(p) for p in x], [float(q) for q in y], 1e-12)
+
+
+def test_mixed_problem_generation_and_grading(client):
+    response = client.post("/api/generate/nash", json={"problem_type": "mixed", "random_size": False,
+                                                       "rows": 3, "cols": 3})
+    assert response.status_code == 200
+    problem = response.json()
+    assert problem["problem_type"] == "mixed"
+
+    params = {"rows": 3, "cols": 3, "random_size": False}
+    matrix, _, _ = generate_and_solve_nash(problem["seed"], params)
+    eq = lemke_howson(*payoff_arrays(matrix))
+    answer = {"problem_seed": problem["seed"], **params}
+
+    graded = client.post("/api/evaluate/nash/mixed", json={**answer, "row_strategy": eq.row_strategy,
+                                                           "col_strategy": eq.col_strategy}).json()
+    assert graded["percentage"] == 100
+
+    graded = client.post("/api/evaluate/nash/mixed", json={**answer, "row_strategy": [1, 0],
+                                                           "col_strategy": eq.col_strategy}).json()
+    assert graded["percentage"] == 0
+    assert graded["correct_answer"] == eq.rounded()
+
+    response = client.post("/api/evaluate/nash/mixed", json={**answer, "large_game": True,
+                                                             "row_strategy": [1], "col_strategy": [1]})
+    assert response.status_code == 400
+
+
+def test_ungradable_or_unknown_problem_types_are_rejected(client):
+    # Un joc mare cu strategii mixte nu ar putea fi notat de /evaluate/nash/mixed
+    response = client.post("/api/generate/nash", json={"problem_type": "mixed", "large_game": True})
+    assert response.status_code == 400
+    assert client.post("/api/generate/nash", json={"problem_type": "bogus"}).status_code == 400
+    assert client.post("/api/dynamics/nash", json={"problem_seed": 1, "problem_type": "bogus"}).status_code == 400
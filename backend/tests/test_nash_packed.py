@@ -0,0 +1,37 @@
+import numpy as np
+
+from app.logic.nash.packed import NASH_PAYOFF_DTYPE, PackedNashMatrix, unpack_compact
+from app.logic.nash.solver import generate_and_solve_nash, payoff_arrays
+from app.schemas.nash_schemas import NashCompactMatrix
+
+
+def test_solver_views_share_the_packed_buffer():
+    params = {"rows": 300, "cols": 200, "random_size": False, "large_game": True}
+    matrix, _, _ = generate_and_solve_nash(9, params)
+    assert matrix.payoffs.dtype == NASH_PAYOFF_DTYPE and matrix.payoffs.shape == (300, 200, 2)
+
+    p1, p2 = payoff_arrays(matrix)
+    assert np.shares_memory(p1, matrix.payoffs) and np.shares_memory(p2, matrix.payoffs)
+    assert p1[4, 7] == matrix.grid[4][7][0] and p2[4, 7] == matrix.grid[4][7][1]
+
+
+def test_compact_encodings_round_trip():
+    matrix = PackedNashMatrix.from_grid([[(1, -2), (3, 4)], [(-5, 6), (7, 10)], [(0, 0), (9, -1)]])
+    for encoding in ("base64", "flat"):
+        compact = NashCompactMatrix(**matrix.to_compact(encoding).model_dump())
+        assert unpack_compact(compact).grid == matrix.grid
+    assert matrix.to_compact("flat").payoffs == [1, -2, 3, 4, -5, 6, 7, 10, 0, 0, 9, -1]
+
+
+def test_generate_response_formats(client):
+    params = {"rows": 3, "cols": 4, "random_size": False}
+    grid_response = client.post("/api/generate/nash", json=params).json()
+    assert grid_response["matrix_compact"] is None
+    assert len(grid_response["matrix"]["grid"]) == 3
+
+    for encoding in ("base64", "flat"):
+        data = client.post("/api/generate/nash", json={**params, "matrix_format": encoding}).json()
+        assert data["matrix"] is None
+        compact = NashCompactMatrix(**data["matrix_compact"])
+        matrix, _, _ = generate_and_solve_nash(data["seed"], params)
+        assert unpack_compact(compact).grid == matrix.grid
@@ -0,0 +1,70 @@
+import random
+
+import numpy as np
+
+from app.logic.nash.solver import generate_and_solve_nash, solve_pure_nash, solve_pure_nash_arrays
+from app.schemas.nash_schemas import NashMatrix
+
+
+def _reference(grid):
+    rows, cols = len(grid), len(grid[0])
+    return [
+        (r, c)
+        for r in range(rows)
+        for c in range(cols)
+        if all(grid[r][c][0] >= grid[rr][c][0] for rr in range(rows))
+        and all(grid[r][c][1] >= grid[r][cc][1] for cc in range(cols))
+    ]
+
+
+def test_vectorized_solver_matches_the_cell_by_cell_definition():
+    rng = random.Random(4)
+    for _ in range(300):
+        rows, cols = rng.randint(1, 7), rng.randint(1, 7)
+        grid = [[(rng.randint(-2, 2), rng.randint(-2, 2)) for _ in range(cols)] for _ in range(rows)]
+        assert solve_pure_nash(NashMatrix(rows=rows, cols=cols, grid=grid)) == _reference(grid)
+
+
+def test_classic_games():
+    prisoners = [[(-1, -1), (-3, 0)], [(0, -3), (-2, -2)]]
+    stag_hunt = [[(5, 5), (0, 3)], [(3, 0), (4, 4)]]
+    pennies = [[(1, -1), (-1, 1)], [(-1, 1), (1, -1)]]
+
+    assert solve_pure_nash(NashMatrix(rows=2, cols=2, grid=prisoners)) == [(1, 1)]
+    assert solve_pure_nash(NashMatrix(rows=2, cols=2, grid=stag_hunt)) == [(0, 0), (1, 1)]
+    assert solve_pure_nash(NashMatrix(rows=2, cols=2, grid=pennies)) == []
+
+
+def test_thousand_by_thousand_game_matches_reference():
+    rng = np.random.default_rng(0)
+    p1 = rng.integers(-5, 11, size=(1000, 1000))
+    p2 = rng.integers(-5, 11, size=(1000, 1000))
+    # Un echilibru garantat: maximul strict al coloanei 7 și al rândului 3
+    p1[3, 7], p2[3, 7] = 11, 11
+
+    equilibria = solve_pure_nash_arrays(p1, p2)
+    assert (3, 7) in equilibria
+    # Referință independentă: celulele care ating maximul coloanei (P1) și al rândului (P2)
+    best = (p1 == p1.max(axis=0)) & (p2 == p2.max(axis=1, keepdims=True))
+    assert equilibria == [tuple(cell) for cell in np.argwhere(best).tolist()]
+
+
+def test_small_games_keep_their_seeded_matrices():
+    matrix, equilibria, _ = generate_and_solve_nash(123, {"rows": 9, "cols": 3, "random_size": False})
+    assert (matrix.rows, matrix.cols) == (4, 3)
+    assert equilibria == _reference(matrix.grid)
+
+
+def test_large_game_mode_raises_the_size_limit(client):
+    params = {"rows": 60, "cols": 45, "random_size": False, "large_game": True}
+    matrix, equilibria, _ = generate_and_solve_nash(77, params)
+    again, _, _ = generate_and_solve_nash(77, params)
+
+    assert (matrix.rows, matrix.cols) == (60, 45)
+    assert matrix.grid == again.grid
+    assert equilibria == _reference(matrix.grid)
+
+    data = client.post("/api/generate/nash", json=params).json()
+    assert data["matrix"]["rows"] == 60
+    answer = {"problem_seed": data["seed"], "has_equilibrium": False, **params}
+    assert client.post("/api/evaluate/nash", json=answer).status_code == 200
@@ -0,0 +1,71 @@
+from itertools import product
+
+import numpy as np
+
+from app.logic.nash.solver import solve_pure_nash_arrays
+from app.logic.nash.tensor import TensorGame, generate_and_solve_tensor, solve_pure_nash_tensor, unpack_tensor
+from app.schemas.nash_schemas import NashTensorGame
+
+
+def _brute_force(payoffs: np.ndarray):
+    """Referința: pentru fiecare profil, fiecare jucător încearcă toate devierile unilaterale."""
+    shape, players = payoffs.shape[:-1], payoffs.shape[-1]
+    equilibria = []
+    for profile in product(*(range(s) for s in shape)):
+        stable = True
+        for i in range(players):
+            for deviation in range(shape[i]):
+                other = profile[:i] + (deviation,) + profile[i + 1:]
+                if payoffs[other + (i,)] > payoffs[profile + (i,)]:
+                    stable = False
+        if stable:
+            equilibria.append(profile)
+    return equilibria
+
+
+def test_matches_brute_force_on_small_games():
+    rng = np.random.default_rng(0)
+    for shape in [(2, 3, 2), (3, 3, 3), (2, 2, 2, 3), (4, 2)]:
+        for _ in range(30):
+            payoffs = rng.integers(0, 3, size=shape + (len(shape),))
+            game = TensorGame(payoffs)
+            assert solve_pure_nash_tensor(game.player_payoffs()) == _brute_force(payoffs)
+
+
+def test_two_players_is_the_bimatrix_case():
+    # Dilema prizonierului: singurul echilibru este (1, 1)
+    p1 = np.array([[3, 0], [5, 1]])
+    p2 = p1.T
+    assert solve_pure_nash_arrays(p1, p2) == [(1, 1)]
+    assert solve_pure_nash_tensor((p1, p2)) == [(1, 1)]
+
+
+def test_generation_is_deterministic_and_round_trips():
+    params = {"players": 3, "strategies": [20, 20, 20]}
+    game, equilibria, text = generate_and_solve_tensor(7, params)
+    again, _, _ = generate_and_solve_tensor(7, params)
+    assert game.payoffs.shape == (20, 20, 20, 3)
+    assert (game.payoffs == again.payoffs).all()
+    assert "3 jucători" in text["description"]
+    for encoding in ("flat", "base64"):
+        schema = NashTensorGame(**game.to_schema(encoding).model_dump())
+        assert (unpack_tensor(schema).payoffs == game.payoffs).all()
+
+
+def test_tensor_api_round_trip(client):
+    params = {"players": 3, "strategies": [3, 2, 4]}
+    data = client.post("/api/generate/nash/tensor", json=params).json()
+    game = unpack_tensor(NashTensorGame(**data["game"]))
+    equilibria = _brute_force(game.payoffs)
+
+    answer = {**params, "problem_seed": data["seed"], "has_equilibrium": bool(equilibria),
+              "equilibrium_profile": list(equilibria[0]) if equilibria else None}
+    result = client.post("/api/evaluate/nash/tensor", json=answer).json()
+    assert result["percentage"] == 100
+
+    response = client.post("/api/generate/nash/tensor", json={"players": 3, "strategies": [2, 2]})
+    assert response.status_code == 400
+    response = client.post("/api/generate/nash/tensor", json={"players": 4, "strategies": [100] * 4})
+    assert response.status_code == 400
+    response = client.post("/api/generate/nash/tensor", json={**params, "matrix_format": "grid"})
+    assert response.status_code == 400
@@ -0,0 +1,61 @@
+from fractions import Fraction
+
+import numpy as np
+
+from app.logic.nash.solver import NASH_PROBLEM_ZERO_SUM, generate_and_solve_nash, payoff_arrays
+from app.logic.nash.zero_sum import _simplex, is_zero_sum_solution, solve_zero_sum, support_enumeration_zero_sum
+
+
+def test_simplex_matches_support_enumeration():
+    rng = np.random.default_rng(11)
+    for _ in range(200):
+        m, n = rng.integers(1, 6, size=2)
+        A = rng.integers(-5, 11, size=(m, n))
+        solution = solve_zero_sum(A)
+        reference = support_enumeration_zero_sum(A)
+        assert is_zero_sum_solution(A, solution.value, solution.row_strategy, solution.col_strategy, 1e-7)
+        assert abs(solution.value - reference.value) < 1e-7
+
+
+def test_classic_games_and_the_exact_path():
+    pennies = np.array([[1, -1], [-1, 1]])
+    solution = solve_zero_sum(pennies)
+    assert abs(solution.value) < 1e-12 and np.allclose(solution.row_strategy, [0.5, 0.5])
+
+    saddle = np.array([[3, 1, 4], [2, 0, 1], [5, 2, 6]])
+    assert solve_zero_sum(saddle).rounded() == {"value": 2, "row_strategy": [0, 0, 1], "col_strategy": [0, 1, 0]}
+
+    rps = np.array([[0, -1, 1], [1, 0, -1], [-1, 1, 0]])
+    x, q, z = _simplex(rps + 2, exact=True)
+    assert 1 / z - 2 == 0 and [p / z for p in x] == [p / z for p in q] == [Fraction(1, 3)] * 3
+
+
+def test_large_zero_sum_game():
+    params = {"rows": 300, "cols": 200, "random_size": False, "large_game": True,
+              "problem_type": NASH_PROBLEM_ZERO_SUM}
+    matrix, _, _ = generate_and_solve_nash(5, params)
+    p1, p2 = payoff_arrays(matrix)
+    assert (p2 == -p1).all() and p1.shape == (300, 200)
+    solution = solve_zero_sum(p1)
+    assert is_zero_sum_solution(p1, solution.value, solution.row_strategy, solution.col_strategy, 1e-7)
+
+
+def test_zero_sum_generation_and_grading(client):
+    response = client.post("/api/generate/nash", json={"problem_type": "zero_sum", "random_size": False,
+                                                       "rows": 3, "cols": 4})
+    problem = response.json()
+    assert problem["problem_type"] == "zero_sum"
+    assert all(cell[1] == -cell[0] for row in problem["matrix"]["grid"] for cell in row)
+
+    p1 = np.array([[cell[0] for cell in row] for row in problem["matrix"]["grid"]])
+    solution = solve_zero_sum(p1)
+    answer = {"problem_seed": problem["seed"], "rows": 3, "cols": 4, "random_size": False}
+
+    graded = client.post("/api/evaluate/nash/zero_sum", json={**answer, "value": solution.value,
+                                                              "row_strategy": solution.row_strategy}).json()
+    assert graded["percentage"] == 100
+
+    graded = client.post("/api/evaluate/nash/zero_sum", json={**answer, "value": solution.value + 1,
+                                                              "row_strategy": [1, 1, 1]}).json()
+    assert graded["percentage"] == 0
+    assert graded["correct_answer"] == solution.rounded()
@@ -23,6 +23,18 @@ export const generateNashProblem = (config = {}) => {
 export const evaluateNashAnswer = (answerData) => {
     return api.post('/evaluate/nash', answerData);
 };
+export const evaluateNashMixedAnswer = (answerData) => {
+    return api.post('/evaluate/nash/mixed', answerData);
+};
+export const evaluateNashZeroSumAnswer = (answerData) => {
+    return api.post('/evaluate/nash/zero_sum', answerData);
+};
+export const evaluateNashIesdsAnswer = (answerData) => {
+    return api.post('/evaluate/nash/iesds', answerData);
+};
+export const updateNashCell = (sessionId, cell) => {
+    return api.post(`/edit/nash/${sessionId}`, cell);
+};
 
 // --- STRATEGY ENDPOINTS ---
 export const generateStrategyProblem = (config = {}) => {
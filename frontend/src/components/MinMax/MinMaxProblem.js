@@ -2,6 +2,9 @@ import React, {useState, useEffect} from 'react';
 import {generateMinMaxProblem, evaluateMinMaxAnswer} from '../../api/apiService';
 import './MinMax.css';
 
+// Același tipar ca MINMAX_NODE_NAME_PATTERN în backend: rădăcina R și cel mult 12 niveluri
+const NODE_NAME_PATTERN = /^R[1-9]{0,12}$/;
+
 function MinMaxProblem({autoGenerate = false, seed = null}) {
     // Starea pentru problema primită de la API
     const [problem, setProblem] = useState(null);
@@ -13,7 +16,12 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
         randomDepth: true,
         depth: 3,
         randomRoot: true,
-        rootType: 'MAX'
+        rootType: 'MAX',
+        source: 'random',
+        chanceNodes: false,
+        algorithm: 'alphabeta',
+        pruningTarget: 'none',
+        pruningCount: 4
     });
 
     // --- GENERATION CONFIG STATE ---
@@ -31,6 +39,10 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
     const [isLoading, setIsLoading] = useState(false);
     const [error, setError] = useState(null);
     const [showJson, setShowJson] = useState(false);
+    // Nodul extins în imaginea rezumată (arbori adânci), ex. "R213": câmpul se editează liber,
+    // iar imaginea se recere doar la "Extinde"
+    const [expandInput, setExpandInput] = useState('');
+    const [expandNode, setExpandNode] = useState('');
 
     /**
      * Apelată la apăsarea butonului "Generează Problema MinMax".
@@ -41,12 +53,15 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
 
         setIsLoading(true);
         setError(null);
+        setExpandInput('');
+        setExpandNode('');
         setProblem(null);
         setEvaluation(null);
         setAnswer({root_value: '', visited_nodes: ''});
 
         try {
             const isMaxPlayer = config.rootType === 'MAX';
+            const withTargets = config.source === 'random' && !config.chanceNodes;
 
             const payload = {
                 seed: seed ?? Math.floor(Math.random() * 1_000_000),
@@ -55,7 +70,16 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
                     ? null
                     : Math.max(1, parseInt(config.depth, 10)),
                 random_root: config.randomRoot,
-                is_maximizing_player: config.randomRoot ? null : isMaxPlayer
+                is_maximizing_player: config.randomRoot ? null : isMaxPlayer,
+                source: config.source,
+                chance_nodes: config.source === 'random' && config.chanceNodes,
+                algorithm: config.source === 'random' && config.chanceNodes ? 'alphabeta' : config.algorithm,
+                target_visited: withTargets && config.pruningTarget === 'visited'
+                    ? Math.max(1, parseInt(config.pruningCount, 10))
+                    : null,
+                min_cutoffs: withTargets && config.pruningTarget === 'cutoffs'
+                    ? Math.max(0, parseInt(config.pruningCount, 10))
+                    : null
             };
 
 
@@ -96,14 +120,19 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
         try {
             const answerData = {
                 problem_seed: problem.seed,
-                root_value: parseInt(answer.root_value, 10),
+                root_value: parseFloat(answer.root_value),
                 visited_nodes: parseInt(answer.visited_nodes, 10),
 
                 // --- TRIMITERE PARAMETRI PENTRU RECONSTRUCȚIE ---
                 generated_random_depth: lastGenConfig.random_depth,
                 generated_depth: lastGenConfig.depth,
                 generated_random_root: lastGenConfig.random_root,
-                generated_is_maximizing: lastGenConfig.is_maximizing_player
+                generated_is_maximizing: lastGenConfig.is_maximizing_player,
+                generated_source: lastGenConfig.source,
+                generated_chance_nodes: lastGenConfig.chance_nodes,
+                generated_algorithm: lastGenConfig.algorithm,
+                generated_target_visited: lastGenConfig.target_visited,
+                generated_min_cutoffs: lastGenConfig.min_cutoffs
             };
 
             const response = await evaluateMinMaxAnswer(answerData);
@@ -197,7 +226,88 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
                         )}
                     </div>
 
-                    {/* 3. Buton Generare */}
+                    {/* 3. Sursa arborelui */}
+                    <div className="config-group">
+                        <label>Sursa arborelui</label>
+                        <div className="config-inputs">
+                            <select
+                                value={config.source}
+                                onChange={(e) =>
+                                    setConfig({...config, source: e.target.value})
+                                }
+                            >
+                                <option value="random">Arbore aleator</option>
+                                <option value="tictactoe">Tic-Tac-Toe</option>
+                                <option value="nim">Nim</option>
+                            </select>
+                        </div>
+                    </div>
+
+                    {/* 4. Noduri de șansă (doar pentru arbori aleatori) */}
+                    {config.source === 'random' && (
+                        <div className="config-group">
+                            <label>
+                                <input
+                                    type="checkbox"
+                                    checked={config.chanceNodes}
+                                    onChange={(e) =>
+                                        setConfig({...config, chanceNodes: e.target.checked})
+                                    }
+                                />
+                                Noduri de șansă (Expectiminimax)
+                            </label>
+                        </div>
+                    )}
+
+                    {/* 5. Algoritmul de căutare (arborii cu noduri de șansă folosesc *-minimax) */}
+                    {!(config.source === 'random' && config.chanceNodes) && (
+                        <div className="config-group">
+                            <label>Algoritm</label>
+                            <div className="config-inputs">
+                                <select
+                                    value={config.algorithm}
+                                    onChange={(e) =>
+                                        setConfig({...config, algorithm: e.target.value})
+                                    }
+                                >
+                                    <option value="alphabeta">Alpha-Beta</option>
+                                    <option value="pvs">PVS (NegaScout)</option>
+                                    <option value="mtdf">MTD(f)</option>
+                                </select>
+                            </div>
+                        </div>
+                    )}
+
+                    {/* 6. Tiparul de tăieri (doar arbori aleatori fără noduri de șansă) */}
+                    {config.source === 'random' && !config.chanceNodes && (
+                        <div className="config-group">
+                            <label>Tipar de tăieri</label>
+                            <div className="config-inputs">
+                                <select
+                                    value={config.pruningTarget}
+                                    onChange={(e) =>
+                                        setConfig({...config, pruningTarget: e.target.value})
+                                    }
+                                >
+                                    <option value="none">Aleator</option>
+                                    <option value="visited">Frunze vizitate</option>
+                                    <option value="cutoffs">Minim tăieri</option>
+                                </select>
+                                {config.pruningTarget !== 'none' && (
+                                    <input
+                                        type="number"
+                                        min="0"
+                                        value={config.pruningCount}
+                                        onChange={(e) =>
+                                            setConfig({...config, pruningCount: e.target.value})
+                                        }
+                                    />
+                                )}
+                            </div>
+                        </div>
+                    )}
+
+                    {/* 7. Buton Generare */}
                     <button
                         onClick={handleGenerate}
                         disabled={isLoading}
@@ -241,12 +351,38 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
                             )}
                         </div>
 
-                        {problem.tree_image_base64 && (
+                        {(problem.tree_image_url || problem.tree_image_base64) && (
                             <div className="image-wrapper">
+                                {problem.tree_image_url && (
+                                    <form
+                                        className="config-group"
+                                        onSubmit={(e) => {
+                                            e.preventDefault();
+                                            setExpandNode(NODE_NAME_PATTERN.test(expandInput) ? expandInput : '');
+                                        }}
+                                    >
+                                        <label>Extinde nodul (ex. R213)</label>
+                                        <input
+                                            type="text"
+                                            value={expandInput}
+                                            onChange={(e) => setExpandInput(e.target.value.trim().toUpperCase())}
+                                        />
+                                        <button type="submit" className="secondary-btn">Extinde</button>
+                                    </form>
+                                )}
                                 <img
-                                    src={`data:image/png;base64,${problem.tree_image_base64}`}
+                                    src={problem.tree_image_url
+                                        ? problem.tree_image_url + (expandNode ? `&expand=${expandNode}` : '')
+                                        : `data:${problem.tree_image_mime || 'image/png'};base64,${problem.tree_image_base64}`}
                                     alt="Arbore MinMax"
                                     className="tree-image"
+                                    onError={() => {
+                                        // Nodul nu există în acest arbore (400): revenim la imaginea rezumată
+                                        if (expandNode) {
+                                            setExpandNode('');
+                                            setError(`Nodul ${expandNode} nu există în acest arbore.`);
+                                        }
+                                    }}
                                 />
                             </div>
                         )}
@@ -260,6 +396,7 @@ function MinMaxProblem({autoGenerate = false, seed = null}) {
                                 type="number"
                                 id="root_value"
                                 name="root_value"
+                                step="any"
                                 value={answer.root_value}
                                 onChange={handleInputChange}
                                 required
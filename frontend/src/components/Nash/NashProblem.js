@@ -1,7 +1,17 @@
 import React, {useState, useEffect} from 'react';
-import {generateNashProblem, evaluateNashAnswer} from '../../api/apiService';
+import {
+    generateNashProblem,
+    evaluateNashAnswer,
+    evaluateNashMixedAnswer,
+    evaluateNashZeroSumAnswer,
+    evaluateNashIesdsAnswer,
+    updateNashCell
+} from '../../api/apiService';
 import './Nash.css';
 
+// Matricele mai mari se afișează pe ferestre de NASH_VIEW_SIZE x NASH_VIEW_SIZE celule, nu integral
+const NASH_VIEW_SIZE = 20;
+
 function NashProblem({autoGenerate = false, seed = null}) {
     // Stare pentru problema curentă
     const [problem, setProblem] = useState(null);
@@ -11,16 +21,33 @@ function NashProblem({autoGenerate = false, seed = null}) {
     const [config, setConfig] = useState({
         rows: 3,
         cols: 3,
-        random_size: true
+        random_size: true,
+        large_game: false,
+        // 'pure' (echilibru pur), 'mixed' (strategii mixte), 'zero_sum' (sumă nulă) sau 'iesds' (strategii dominate)
+        problem_type: 'pure',
+        editable: false,  // mod editor: celulele se pot modifica, echilibrele pure se actualizează imediat
+        target_equilibria: ''  // '' = oricâte echilibre pure, altfel numărul exact cerut
     });
 
+    const targetEquilibria = config.target_equilibria === '' ? null : parseInt(config.target_equilibria, 10);
+
     // Stare pentru răspunsul utilizatorului
     const [answer, setAnswer] = useState({
         hasEquilibrium: null,
         row: '',
-        col: ''
+        col: '',
+        rowStrategy: '',  // probabilități separate prin virgulă (strategii mixte)
+        colStrategy: '',
+        value: '',  // valoarea jocului (sumă nulă)
+        rowsRemaining: '',  // indexuri separate prin virgulă (strategii dominate)
+        colsRemaining: ''
     });
 
+    // Mod editor: echilibrele pure curente (lista de [rând, coloană])
+    const [editorEquilibria, setEditorEquilibria] = useState([]);
+    // Colțul stânga-sus al ferestrei afișate din matrice
+    const [view, setView] = useState({row: 0, col: 0});
+
     // Stare pentru rezultate și UI
     const [evaluation, setEvaluation] = useState(null);
     const [isLoading, setIsLoading] = useState(false);
@@ -39,25 +66,60 @@ function NashProblem({autoGenerate = false, seed = null}) {
         });
     };
 
+    /**
+     * Decodează formatul compact "base64" (int16 little-endian, p1 și p2 pe rânduri) într-un
+     * Int16Array plat, fără a construi grila de liste: un joc 2000 x 2000 are 8M de valori
+     */
+    const unpackBase64Matrix = ({rows, cols, data}) => {
+        const binary = atob(data);
+        const payoffs = new Int16Array(binary.length / 2);
+        for (let i = 0; i < payoffs.length; i++) {
+            const value = binary.charCodeAt(2 * i) | (binary.charCodeAt(2 * i + 1) << 8);
+            payoffs[i] = value > 0x7fff ? value - 0x10000 : value;
+        }
+        return {rows, cols, payoffs};
+    };
+
+    /**
+     * Celula (r, c) ca [p1, p2], din grilă (jocuri mici) sau din tabloul plat (jocuri mari)
+     */
+    const cellAt = (matrix, r, c) => {
+        if (matrix.grid) return matrix.grid[r][c];
+        const offset = 2 * (r * matrix.cols + c);
+        return [matrix.payoffs[offset], matrix.payoffs[offset + 1]];
+    };
+
     const handleGenerate = async () => {
         setIsLoading(true);
         setError(null);
         setProblem(null);
         setEvaluation(null);
-        setAnswer({hasEquilibrium: null, row: '', col: ''});
+        setView({row: 0, col: 0});
+        setAnswer({
+            hasEquilibrium: null, row: '', col: '', rowStrategy: '', colStrategy: '', value: '',
+            rowsRemaining: '', colsRemaining: ''
+        });
 
         try {
             const response = await generateNashProblem({
                 seed: seed ?? Math.floor(Math.random() * 1_000_000),
                 rows: parseInt(config.rows),
                 cols: parseInt(config.cols),
-                random_size: config.random_size
+                random_size: config.random_size,
+                large_game: config.large_game,
+                target_equilibria: targetEquilibria,
+                problem_type: config.problem_type,
+                // Jocurile mari vin ca octeți în base64 (fără o listă JSON cu milioane de valori)
+                matrix_format: config.large_game ? 'base64' : 'grid',
+                editable: config.editable
             });
 
-            setProblem(response.data);
+            const data = response.data;
+            setProblem(data.matrix_compact ? {...data, matrix: unpackBase64Matrix(data.matrix_compact)} : data);
+            setEditorEquilibria(data.editor_equilibria || []);
         } catch (err) {
             console.error("Eroare generare:", err);
-            setError("Nu s-a putut genera problema. Verifică backend-ul.");
+            setError(err.response?.data?.detail || "Nu s-a putut genera problema. Verifică backend-ul.");
         } finally {
             setIsLoading(false);
         }
@@ -70,8 +132,159 @@ function NashProblem({autoGenerate = false, seed = null}) {
     }, [autoGenerate]);
 
 
+    const handleCellEdit = async (rIndex, cIndex, player, text) => {
+        const payoff = parseInt(text, 10);
+        if (isNaN(payoff)) return;
+        const cell = [...cellAt(problem.matrix, rIndex, cIndex)];
+        cell[player] = payoff;
+
+        try {
+            const response = await updateNashCell(problem.editor_session, {
+                row: rIndex, col: cIndex, p1: cell[0], p2: cell[1]
+            });
+            let matrix;
+            if (problem.matrix.grid) {
+                const grid = problem.matrix.grid.map((row, r) =>
+                    r === rIndex ? row.map((old, c) => (c === cIndex ? cell : old)) : row);
+                matrix = {...problem.matrix, grid};
+            } else {
+                const payoffs = problem.matrix.payoffs.slice();
+                payoffs.set(cell, 2 * (rIndex * problem.matrix.cols + cIndex));
+                matrix = {...problem.matrix, payoffs};
+            }
+            setProblem({...problem, matrix});
+            setEditorEquilibria(response.data.equilibria);
+        } catch (err) {
+            console.error("Eroare editare:", err);
+            setError("Sesiunea de editare a expirat. Generează o matrice nouă.");
+        }
+    };
+
+    const isEquilibriumCell = (rIndex, cIndex) =>
+        editorEquilibria.some(([r, c]) => r === rIndex && c === cIndex);
+
+    const parseStrategy = (text) => text.split(',').map((p) => parseFloat(p.trim()));
+
+    const handleMixedSubmit = async () => {
+        const rowStrategy = parseStrategy(answer.rowStrategy);
+        const colStrategy = parseStrategy(answer.colStrategy);
+        if (rowStrategy.some(isNaN) || colStrategy.some(isNaN)) {
+            setError("Introdu probabilitățile separate prin virgulă (ex: 0.5, 0.5).");
+            return;
+        }
+
+        setIsLoading(true);
+        setError(null);
+        setEvaluation(null);
+
+        try {
+            const response = await evaluateNashMixedAnswer({
+                problem_seed: problem.seed,
+                row_strategy: rowStrategy,
+                col_strategy: colStrategy,
+                rows: parseInt(config.rows),
+                cols: parseInt(config.cols),
+                random_size: config.random_size,
+                large_game: config.large_game,
+                target_equilibria: targetEquilibria
+            });
+            setEvaluation(response.data);
+        } catch (err) {
+            console.error("Eroare evaluare:", err);
+            setError("Eroare la evaluare.");
+        } finally {
+            setIsLoading(false);
+        }
+    };
+
+    const handleZeroSumSubmit = async () => {
+        const rowStrategy = parseStrategy(answer.rowStrategy);
+        const value = parseFloat(answer.value);
+        if (rowStrategy.some(isNaN) || isNaN(value)) {
+            setError("Introdu valoarea jocului și probabilitățile separate prin virgulă (ex: 0.5, 0.5).");
+            return;
+        }
+
+        setIsLoading(true);
+        setError(null);
+        setEvaluation(null);
+
+        try {
+            const response = await evaluateNashZeroSumAnswer({
+                problem_seed: problem.seed,
+                value: value,
+                row_strategy: rowStrategy,
+                rows: parseInt(config.rows),
+                cols: parseInt(config.cols),
+                random_size: config.random_size,
+                large_game: config.large_game,
+                target_equilibria: targetEquilibria
+            });
+            setEvaluation(response.data);
+        } catch (err) {
+            console.error("Eroare evaluare:", err);
+            setError("Eroare la evaluare.");
+        } finally {
+            setIsLoading(false);
+        }
+    };
+
+    const handleIesdsSubmit = async () => {
+        const parseIndexes = (text) => text.split(',').filter((p) => p.trim() !== '').map((p) => parseInt(p.trim(), 10));
+        const rowsRemaining = parseIndexes(answer.rowsRemaining);
+        const colsRemaining = parseIndexes(answer.colsRemaining);
+        if (rowsRemaining.some(isNaN) || colsRemaining.some(isNaN)) {
+            setError("Introdu indexurile separate prin virgulă (ex: 0, 2).");
+            return;
+        }
+
+        setIsLoading(true);
+        setError(null);
+        setEvaluation(null);
+
+        try {
+            const response = await evaluateNashIesdsAnswer({
+                problem_seed: problem.seed,
+                rows_remaining: rowsRemaining,
+                cols_remaining: colsRemaining,
+                rows: parseInt(config.rows),
+                cols: parseInt(config.cols),
+                random_size: config.random_size,
+                large_game: config.large_game,
+                target_equilibria: targetEquilibria
+            });
+            setEvaluation(response.data);
+        } catch (err) {
+            console.error("Eroare evaluare:", err);
+            setError("Eroare la evaluare.");
+        } finally {
+            setIsLoading(false);
+        }
+    };
+
+    const isMixed = problem && problem.problem_type === 'mixed';
+    const isZeroSum = problem && problem.problem_type === 'zero_sum';
+    const isIesds = problem && problem.problem_type === 'iesds';
+    // În modul editor doar echilibrele pure se notează pe matricea editată (prin `editor_session`);
+    // celelalte tipuri ar fi notate pe matricea generată din seed, deci răspunsul este dezactivat
+    const editorGradingUnavailable = problem && problem.editor_session && (isMixed || isZeroSum || isIesds);
+
     const handleSubmit = async (e) => {
         e.preventDefault();
+        if (editorGradingUnavailable) return;
+
+        if (isMixed) {
+            await handleMixedSubmit();
+            return;
+        }
+        if (isZeroSum) {
+            await handleZeroSumSubmit();
+            return;
+        }
+        if (isIesds) {
+            await handleIesdsSubmit();
+            return;
+        }
 
         if (!answer.hasEquilibrium) {
             setError("Selectează dacă există sau nu un echilibru.");
@@ -96,7 +309,11 @@ function NashProblem({autoGenerate = false, seed = null}) {
                 // --- MODIFICARE AICI: Trimitem configurația curentă pentru reconstrucție ---
                 rows: parseInt(config.rows),
                 cols: parseInt(config.cols),
-                random_size: config.random_size
+                random_size: config.random_size,
+                large_game: config.large_game,
+                target_equilibria: targetEquilibria,
+                // Modul editor: notarea se face pe matricea editată din sesiune
+                editor_session: problem.editor_session ?? null
             };
 
             const response = await evaluateNashAnswer(payload);
@@ -109,6 +326,20 @@ function NashProblem({autoGenerate = false, seed = null}) {
         }
     };
 
+    // Limita dimensiunilor (NASH_REQUEST_MAX_SIZE / NASH_LARGE_MAX_SIZE / NASH_ZERO_SUM_MAX_SIZE în backend)
+    const largeMaxSize = config.problem_type === 'zero_sum' ? 500 : 2000;
+    const maxSize = config.large_game ? largeMaxSize : 4;
+
+    // Fereastra afișată: cel mult NASH_VIEW_SIZE rânduri și coloane, începând din `view`
+    const range = (start, total) =>
+        Array.from({length: Math.min(NASH_VIEW_SIZE, total - start)}, (_, i) => start + i);
+    const clampView = (text, total) =>
+        Math.min(Math.max(parseInt(text, 10) || 0, 0), Math.max(total - NASH_VIEW_SIZE, 0));
+    const viewRows = problem ? range(view.row, problem.matrix.rows) : [];
+    const viewCols = problem ? range(view.col, problem.matrix.cols) : [];
+    const viewCells = (rIndex) => viewCols.map((cIndex) => [cIndex, cellAt(problem.matrix, rIndex, cIndex)]);
+    const isPaged = problem && (problem.matrix.rows > NASH_VIEW_SIZE || problem.matrix.cols > NASH_VIEW_SIZE);
+
     const getResultClass = () => {
         if (!evaluation) return '';
         if (evaluation.percentage === 100) return 'nash-success';
@@ -136,14 +367,81 @@ function NashProblem({autoGenerate = false, seed = null}) {
                         </label>
                     </div>
 
+                    <div className="config-group">
+                        <label>
+                            <input
+                                type="checkbox"
+                                checked={config.editable}
+                                onChange={(e) =>
+                                    setConfig({...config, editable: e.target.checked})
+                                }
+                            />
+                            Mod editor
+                        </label>
+                    </div>
+
+                    <div className="config-group">
+                        <label>
+                            Tip problemă:
+                            <select
+                                value={config.problem_type}
+                                onChange={(e) =>
+                                    setConfig({
+                                        ...config,
+                                        problem_type: e.target.value,
+                                        large_game: e.target.value === 'mixed' ? false : config.large_game
+                                    })
+                                }
+                            >
+                                <option value="pure">Echilibru pur</option>
+                                <option value="mixed">Strategii mixte</option>
+                                <option value="zero_sum">Sumă nulă (valoarea jocului)</option>
+                                <option value="iesds">Strategii dominate (IESDS)</option>
+                            </select>
+                        </label>
+                    </div>
+
+                    <div className="config-group">
+                        <label>
+                            Echilibre pure:
+                            <select
+                                value={config.target_equilibria}
+                                onChange={(e) =>
+                                    setConfig({...config, target_equilibria: e.target.value})
+                                }
+                            >
+                                <option value="">Oricâte</option>
+                                <option value="0">Niciunul</option>
+                                <option value="1">Exact 1</option>
+                                <option value="2">Exact 2</option>
+                                <option value="3">Exact 3</option>
+                            </select>
+                        </label>
+                    </div>
+
+                    {!config.random_size && config.problem_type !== 'mixed' && (
+                        <div className="config-group">
+                            <label>
+                                <input
+                                    type="checkbox"
+                                    checked={config.large_game}
+                                    onChange={(e) =>
+                                        setConfig({...config, large_game: e.target.checked})
+                                    }
+                                />
+                                Joc mare (până la {largeMaxSize}x{largeMaxSize})
+                            </label>
+                        </div>
+                    )}
+
                     {!config.random_size && (
                         <div className="config-inputs">
                             <label>
-                                Rânduri (2-4):
+                                Rânduri (2-{maxSize}):
                                 <input
                                     type="number"
                                     min="2"
-                                    max="4"
+                                    max={maxSize}
                                     value={config.rows}
                                     onChange={(e) =>
                                         setConfig({...config, rows: e.target.value})
@@ -152,11 +450,11 @@ function NashProblem({autoGenerate = false, seed = null}) {
                             </label>
 
                             <label>
-                                Coloane (2-4):
+                                Coloane (2-{maxSize}):
                                 <input
                                     type="number"
                                     min="2"
-                                    max="4"
+                                    max={maxSize}
                                     value={config.cols}
                                     onChange={(e) =>
                                         setConfig({...config, cols: e.target.value})
@@ -190,22 +488,62 @@ function NashProblem({autoGenerate = false, seed = null}) {
                             {problem.text.requirement}
                         </p>
 
+                        {isPaged && (
+                            <div className="config-group">
+                                <p>
+                                    Matrice {problem.matrix.rows} x {problem.matrix.cols}: afișate
+                                    rândurile {view.row}-{viewRows[viewRows.length - 1]} și
+                                    coloanele {view.col}-{viewCols[viewCols.length - 1]}
+                                    {problem.editor_session && ` (${editorEquilibria.length} echilibre pure)`}
+                                </p>
+                                <label>Primul rând:
+                                    <input
+                                        type="number" min="0" max={Math.max(problem.matrix.rows - NASH_VIEW_SIZE, 0)}
+                                        value={view.row}
+                                        onChange={(e) => setView({...view, row: clampView(e.target.value, problem.matrix.rows)})}
+                                    />
+                                </label>
+                                <label>Prima coloană:
+                                    <input
+                                        type="number" min="0" max={Math.max(problem.matrix.cols - NASH_VIEW_SIZE, 0)}
+                                        value={view.col}
+                                        onChange={(e) => setView({...view, col: clampView(e.target.value, problem.matrix.cols)})}
+                                    />
+                                </label>
+                            </div>
+                        )}
+
                         <table className="payoff-matrix">
                             <tbody>
                             <tr>
                                 <td className="matrix-header"></td>
-                                {problem.matrix.grid[0].map((_, idx) => (
+                                {viewCols.map((idx) => (
                                     <td key={`h-${idx}`} className="matrix-header-col">Col {idx}</td>
                                 ))}
                             </tr>
-                            {problem.matrix.grid.map((row, rIndex) => (
+                            {viewRows.map((rIndex) => (
                                 <tr key={rIndex}>
                                     <td className="matrix-header-row">Rând {rIndex}</td>
-                                    {row.map((cell, cIndex) => (
-                                        <td key={cIndex} className="payoff-cell">
-                                            <span className="p1-score">{cell[0]}</span>,
-                                            <span className="p2-score">{cell[1]}</span>
-                                        </td>
+                                    {viewCells(rIndex).map(([cIndex, cell]) => (
+                                        problem.editor_session ? (
+                                            <td key={cIndex}
+                                                className={`payoff-cell ${isEquilibriumCell(rIndex, cIndex) ? 'equilibrium-cell' : ''}`}>
+                                                {[0, 1].map((player) => (
+                                                    <input
+                                                        key={`${player}-${cell[player]}`}
+                                                        type="number"
+                                                        className={`payoff-input ${player === 0 ? 'p1-score' : 'p2-score'}`}
+                                                        defaultValue={cell[player]}
+                                                        onBlur={(e) => handleCellEdit(rIndex, cIndex, player, e.target.value)}
+                                                    />
+                                                ))}
+                                            </td>
+                                        ) : (
+                                            <td key={cIndex} className="payoff-cell">
+                                                <span className="p1-score">{cell[0]}</span>,
+                                                <span className="p2-score">{cell[1]}</span>
+                                            </td>
+                                        )
                                     ))}
                                 </tr>
                             ))}
@@ -215,6 +553,72 @@ function NashProblem({autoGenerate = false, seed = null}) {
 
                     <form onSubmit={handleSubmit} className="nash-form">
                         <h3>Răspunsul Tău:</h3>
+                        {isIesds ? (
+                            <div className="coords-inputs">
+                                <p>Indexurile rămase, separate prin virgulă (ex: 0, 2):</p>
+                                <div className="input-row">
+                                    <label>Rânduri rămase:
+                                        <input
+                                            type="text"
+                                            value={answer.rowsRemaining}
+                                            onChange={(e) => setAnswer({...answer, rowsRemaining: e.target.value})}
+                                            required
+                                        />
+                                    </label>
+                                    <label>Coloane rămase:
+                                        <input
+                                            type="text"
+                                            value={answer.colsRemaining}
+                                            onChange={(e) => setAnswer({...answer, colsRemaining: e.target.value})}
+                                            required
+                                        />
+                                    </label>
+                                </div>
+                            </div>
+                        ) : isZeroSum ? (
+                            <div className="coords-inputs">
+                                <div className="input-row">
+                                    <label>Valoarea jocului:
+                                        <input
+                                            type="number" step="0.01"
+                                            value={answer.value}
+                                            onChange={(e) => setAnswer({...answer, value: e.target.value})}
+                                            required
+                                        />
+                                    </label>
+                                    <label>Strategia Jucătorului 1 ({problem.matrix.rows} rânduri, ex: 0.5, 0.5):
+                                        <input
+                                            type="text"
+                                            value={answer.rowStrategy}
+                                            onChange={(e) => setAnswer({...answer, rowStrategy: e.target.value})}
+                                            required
+                                        />
+                                    </label>
+                                </div>
+                            </div>
+                        ) : isMixed ? (
+                            <div className="coords-inputs">
+                                <p>Probabilități, separate prin virgulă (ex: 0.5, 0.5):</p>
+                                <div className="input-row">
+                                    <label>Jucătorul 1 ({problem.matrix.rows} rânduri):
+                                        <input
+                                            type="text"
+                                            value={answer.rowStrategy}
+                                            onChange={(e) => setAnswer({...answer, rowStrategy: e.target.value})}
+                                            required
+                                        />
+                                    </label>
+                                    <label>Jucătorul 2 ({problem.matrix.cols} coloane):
+                                        <input
+                                            type="text"
+                                            value={answer.colStrategy}
+                                            onChange={(e) => setAnswer({...answer, colStrategy: e.target.value})}
+                                            required
+                                        />
+                                    </label>
+                                </div>
+                            </div>
+                        ) : (<>
                         <div className="question-group">
                             <p>Există un echilibru Nash pur?</p>
                             <label className="radio-label">
@@ -256,8 +660,14 @@ function NashProblem({autoGenerate = false, seed = null}) {
                                 </div>
                             </div>
                         )}
+                        </>)}
 
-                        <button type="submit" className="submit-btn" disabled={isLoading}>
+                        {editorGradingUnavailable && (
+                            <p className="instruction">
+                                În modul editor se pot verifica doar răspunsurile despre echilibrele pure.
+                            </p>
+                        )}
+                        <button type="submit" className="submit-btn" disabled={isLoading || editorGradingUnavailable}>
                             Verifică Răspunsul
                         </button>
                     </form>
@@ -273,10 +683,25 @@ function NashProblem({autoGenerate = false, seed = null}) {
 
                     {evaluation.percentage < 100 && (
                         <div className="correct-answer-box">
-                            <strong>Soluții Corecte (Indexe): </strong>
-                            {evaluation.correct_answer.length > 0
-                                ? JSON.stringify(evaluation.correct_answer)
-                                : "Niciunul"}
+                            {isIesds ? (
+                                <>
+                                    <strong>Strategii rămase: </strong>
+                                    {`Rânduri ${JSON.stringify(evaluation.correct_answer.rows)}, `
+                                        + `Coloane ${JSON.stringify(evaluation.correct_answer.cols)}`}
+                                </>
+                            ) : isMixed || isZeroSum ? (
+                                <>
+                                    <strong>{isZeroSum ? 'O soluție optimă: ' : 'Un echilibru mixt: '}</strong>
+                                    {JSON.stringify(evaluation.correct_answer)}
+                                </>
+                            ) : (
+                                <>
+                                    <strong>Soluții Corecte (Indexe): </strong>
+                                    {evaluation.correct_answer.length > 0
+                                        ? JSON.stringify(evaluation.correct_answer)
+                                        : "Niciunul"}
+                                </>
+                            )}
                         </div>
                     )}
                 </div>